@@ -5,6 +5,8 @@ from enum import Enum
 
 import grpc
 
+from openfeature.contrib.tools.flagd.core.metrics import MetricsSink
+
 
 class ResolverType(Enum):
     RPC = "rpc"
@@ -17,12 +19,22 @@ class CacheType(Enum):
     DISABLED = "disabled"
 
 
+COMPRESSION_ALGORITHMS = {
+    "none": grpc.Compression.NoCompression,
+    "gzip": grpc.Compression.Gzip,
+    "deflate": grpc.Compression.Deflate,
+}
+
 DEFAULT_CACHE = CacheType.LRU
 DEFAULT_CACHE_SIZE = 1000
+DEFAULT_CHANNEL_POOL_SIZE = 1
+DEFAULT_COMPRESSION: str | None = None
 DEFAULT_DEADLINE = 500
 DEFAULT_HOST = "localhost"
+DEFAULT_HTTP2_WINDOW_SIZE: int | None = None
 DEFAULT_KEEP_ALIVE = 0
-DEFAULT_OFFLINE_SOURCE_PATH: str | None = None
+DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH: int | None = None
+DEFAULT_OFFLINE_SOURCE_PATH: str | list[str] | None = None
 DEFAULT_OFFLINE_POLL_MS = 5000
 DEFAULT_PORT_IN_PROCESS = 8015
 DEFAULT_PORT_RPC = 8013
@@ -30,15 +42,23 @@ DEFAULT_RESOLVER_TYPE = ResolverType.RPC
 DEFAULT_RETRY_BACKOFF = 1000
 DEFAULT_RETRY_BACKOFF_MAX = 12000
 DEFAULT_RETRY_GRACE_PERIOD_SECONDS = 5
+DEFAULT_SHARED_SYNC = False
 DEFAULT_STREAM_DEADLINE = 600000
+DEFAULT_SYNC_CACHE_PATH: str | None = None
+DEFAULT_SYNC_TARGETS: list[str] | None = None
+DEFAULT_TARGETING_CACHE_TTL = 0
 DEFAULT_TLS = False
 DEFAULT_TLS_CERT: str | None = None
 
 ENV_VAR_CACHE_SIZE = "FLAGD_MAX_CACHE_SIZE"
 ENV_VAR_CACHE_TYPE = "FLAGD_CACHE"
+ENV_VAR_CHANNEL_POOL_SIZE = "FLAGD_CHANNEL_POOL_SIZE"
+ENV_VAR_COMPRESSION = "FLAGD_COMPRESSION"
 ENV_VAR_DEADLINE_MS = "FLAGD_DEADLINE_MS"
 ENV_VAR_HOST = "FLAGD_HOST"
+ENV_VAR_HTTP2_WINDOW_SIZE = "FLAGD_HTTP2_WINDOW_SIZE"
 ENV_VAR_KEEP_ALIVE_TIME_MS = "FLAGD_KEEP_ALIVE_TIME_MS"
+ENV_VAR_MAX_RECEIVE_MESSAGE_LENGTH = "FLAGD_MAX_RECEIVE_MESSAGE_LENGTH"
 ENV_VAR_OFFLINE_FLAG_SOURCE_PATH = "FLAGD_OFFLINE_FLAG_SOURCE_PATH"
 ENV_VAR_OFFLINE_POLL_MS = "FLAGD_OFFLINE_POLL_MS"
 ENV_VAR_PORT = "FLAGD_PORT"
@@ -49,8 +69,12 @@ ENV_VAR_RETRY_BACKOFF_MS = "FLAGD_RETRY_BACKOFF_MS"
 ENV_VAR_RETRY_BACKOFF_MAX_MS = "FLAGD_RETRY_BACKOFF_MAX_MS"
 ENV_VAR_RETRY_GRACE_PERIOD_SECONDS = "FLAGD_RETRY_GRACE_PERIOD"
 ENV_VAR_SELECTOR = "FLAGD_SOURCE_SELECTOR"
+ENV_VAR_SHARED_SYNC = "FLAGD_SHARED_SYNC"
 ENV_VAR_PROVIDER_ID = "FLAGD_PROVIDER_ID"
 ENV_VAR_STREAM_DEADLINE_MS = "FLAGD_STREAM_DEADLINE_MS"
+ENV_VAR_SYNC_CACHE_PATH = "FLAGD_SYNC_CACHE_PATH"
+ENV_VAR_SYNC_TARGETS = "FLAGD_SYNC_TARGETS"
+ENV_VAR_TARGETING_CACHE_TTL_MS = "FLAGD_TARGETING_CACHE_TTL_MS"
 ENV_VAR_TLS = "FLAGD_TLS"
 ENV_VAR_TLS_CERT = "FLAGD_SERVER_CERT_PATH"
 ENV_VAR_DEFAULT_AUTHORITY = "FLAGD_DEFAULT_AUTHORITY"
@@ -62,6 +86,16 @@ def str_to_bool(val: str) -> bool:
     return val.lower() == "true"
 
 
+def str_to_paths(val: str) -> str | list[str]:
+    # separated like PATH, file names may contain commas
+    paths = [path for path in val.split(os.pathsep) if path]
+    return paths[0] if len(paths) == 1 else paths
+
+
+def str_to_list(val: str) -> list[str]:
+    return [item.strip() for item in val.split(",") if item.strip()]
+
+
 def convert_resolver_type(val: str | ResolverType) -> ResolverType:
     if isinstance(val, str):
         v = val.lower()
@@ -70,6 +104,17 @@ def convert_resolver_type(val: str | ResolverType) -> ResolverType:
         return ResolverType(val)
 
 
+def convert_compression(val: str | None) -> grpc.Compression | None:
+    if val is None:
+        return None
+    try:
+        return COMPRESSION_ALGORITHMS[val.lower()]
+    except KeyError:
+        raise ValueError(
+            f"`compression` must be one of {', '.join(COMPRESSION_ALGORITHMS)}: {val}"
+        ) from None
+
+
 def env_or_default(
     env_var: str, default: T, cast: typing.Callable[[str], T] | None = None
 ) -> str | T:
@@ -90,7 +135,7 @@ class Config:
         selector: str | None = None,
         provider_id: str | None = None,
         resolver: ResolverType | None = None,
-        offline_flag_source_path: str | None = None,
+        offline_flag_source_path: str | list[str] | None = None,
         offline_poll_interval_ms: int | None = None,
         retry_backoff_ms: int | None = None,
         retry_backoff_max_ms: int | None = None,
@@ -100,11 +145,20 @@ class Config:
         keep_alive_time: int | None = None,
         cache: CacheType | None = None,
         max_cache_size: int | None = None,
+        targeting_cache_ttl_ms: int | None = None,
         cert_path: str | None = None,
         default_authority: str | None = None,
         channel_credentials: grpc.ChannelCredentials | None = None,
         sync_metadata_disabled: bool | None = None,
         fatal_status_codes: list[str] | None = None,
+        sync_cache_path: str | None = None,
+        shared_sync: bool | None = None,
+        compression: str | None = None,
+        max_receive_message_length: int | None = None,
+        http2_window_size: int | None = None,
+        sync_targets: list[str] | None = None,
+        channel_pool_size: int | None = None,
+        metrics_sink: MetricsSink | None = None,
     ):
         self.host = env_or_default(ENV_VAR_HOST, DEFAULT_HOST) if host is None else host
 
@@ -184,7 +238,9 @@ class Config:
 
         self.offline_flag_source_path = (
             env_or_default(
-                ENV_VAR_OFFLINE_FLAG_SOURCE_PATH, DEFAULT_OFFLINE_SOURCE_PATH
+                ENV_VAR_OFFLINE_FLAG_SOURCE_PATH,
+                DEFAULT_OFFLINE_SOURCE_PATH,
+                cast=str_to_paths,
             )
             if offline_flag_source_path is None
             else offline_flag_source_path
@@ -247,6 +303,18 @@ class Config:
             else max_cache_size
         )
 
+        self.targeting_cache_ttl_ms: int = (
+            int(
+                env_or_default(
+                    ENV_VAR_TARGETING_CACHE_TTL_MS,
+                    DEFAULT_TARGETING_CACHE_TTL,
+                    cast=int,
+                )
+            )
+            if targeting_cache_ttl_ms is None
+            else targeting_cache_ttl_ms
+        )
+
         self.cert_path = (
             env_or_default(ENV_VAR_TLS_CERT, DEFAULT_TLS_CERT)
             if cert_path is None
@@ -271,6 +339,60 @@ class Config:
 
         self.channel_credentials = channel_credentials
 
+        self.sync_cache_path = (
+            env_or_default(ENV_VAR_SYNC_CACHE_PATH, DEFAULT_SYNC_CACHE_PATH)
+            if sync_cache_path is None
+            else sync_cache_path
+        )
+
+        self.shared_sync = (
+            env_or_default(ENV_VAR_SHARED_SYNC, DEFAULT_SHARED_SYNC, cast=str_to_bool)
+            if shared_sync is None
+            else shared_sync
+        )
+
+        self.compression = convert_compression(
+            env_or_default(ENV_VAR_COMPRESSION, DEFAULT_COMPRESSION)
+            if compression is None
+            else compression
+        )
+
+        self.max_receive_message_length = (
+            env_or_default(
+                ENV_VAR_MAX_RECEIVE_MESSAGE_LENGTH,
+                DEFAULT_MAX_RECEIVE_MESSAGE_LENGTH,
+                cast=int,
+            )
+            if max_receive_message_length is None
+            else max_receive_message_length
+        )
+
+        self.http2_window_size = (
+            env_or_default(
+                ENV_VAR_HTTP2_WINDOW_SIZE, DEFAULT_HTTP2_WINDOW_SIZE, cast=int
+            )
+            if http2_window_size is None
+            else http2_window_size
+        )
+
+        self.sync_targets = (
+            env_or_default(ENV_VAR_SYNC_TARGETS, DEFAULT_SYNC_TARGETS, cast=str_to_list)
+            if sync_targets is None
+            else sync_targets
+        )
+
+        self.channel_pool_size: int = (
+            int(
+                env_or_default(
+                    ENV_VAR_CHANNEL_POOL_SIZE, DEFAULT_CHANNEL_POOL_SIZE, cast=int
+                )
+            )
+            if channel_pool_size is None
+            else channel_pool_size
+        )
+
+        self.metrics_sink = metrics_sink
+
         # TODO: remove the metadata call entirely after https://github.com/open-feature/flagd/issues/1584
         # This is a temporary stop-gap solutions to support servers that don't implement sync.GetMetadata
         # (see: https://buf.build/open-feature/flagd/docs/main:flagd.sync.v1#flagd.sync.v1.FlagSyncService.GetMetadata).
@@ -278,3 +400,17 @@ class Config:
         # Disabling will prevent static context from flagd being used in evaluations.
         # GetMetadata and this option will be removed.
         self.sync_metadata_disabled = sync_metadata_disabled
+
+
+def grpc_tuning_options(config: Config) -> list[tuple[str, typing.Any]]:
+    """Message size and flow-control channel options shared by both resolvers."""
+    options: list[tuple[str, typing.Any]] = []
+    if config.max_receive_message_length is not None:
+        options.append(
+            ("grpc.max_receive_message_length", config.max_receive_message_length)
+        )
+    if config.http2_window_size is not None:
+        # a fixed window replaces the one sized by bandwidth-delay probing
+        options.append(("grpc.http2.lookahead_bytes", config.http2_window_size))
+        options.append(("grpc.http2.bdp_probe", 0))
+    return options
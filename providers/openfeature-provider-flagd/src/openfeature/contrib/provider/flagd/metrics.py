@@ -0,0 +1,88 @@
+import typing
+
+from openfeature.contrib.tools.flagd.core.metrics import MetricsSink, SyncMetrics
+
+if typing.TYPE_CHECKING:
+    from opentelemetry import metrics as otel_metrics
+else:
+    try:
+        from opentelemetry import metrics as otel_metrics
+    except ImportError:
+        otel_metrics = None
+
+__all__ = ["MetricsSink", "OpenTelemetryMetricsSink", "SyncMetrics"]
+
+METER_NAME = "openfeature.contrib.provider.flagd"
+
+
+class OpenTelemetryMetricsSink:
+    """Records the sync metrics of in-process providers with OpenTelemetry.
+
+    Payload size, decode and update time and changed keys are recorded as
+    histograms per flag configuration update, payloads skipped as unchanged
+    are counted and the age of the current snapshot is an observable gauge. Requires the ``otel`` extra.
+    """
+
+    def __init__(self, meter: "otel_metrics.Meter | None" = None):
+        """
+        :param meter: meter to create the instruments with, defaults to the
+            meter of the global meter provider
+        """
+        if otel_metrics is None:
+            raise ImportError(
+                "OpenTelemetryMetricsSink requires opentelemetry-api, "
+                "install openfeature-provider-flagd[otel]"
+            )
+        meter = meter or otel_metrics.get_meter(METER_NAME)
+        self._payload_size = meter.create_histogram(
+            "flagd.sync.payload.size",
+            unit="By",
+            description="Size of the synced flag configuration payloads",
+        )
+        self._decode_duration = meter.create_histogram(
+            "flagd.sync.decode.duration",
+            unit="s",
+            description="Time spent decoding and parsing synced payloads",
+        )
+        self._update_duration = meter.create_histogram(
+            "flagd.sync.update.duration",
+            unit="s",
+            description="Time spent swapping parsed flag configurations in",
+        )
+        self._changed_keys = meter.create_histogram(
+            "flagd.sync.changed_keys",
+            unit="{flag}",
+            description="Flags changed by a flag configuration update",
+        )
+        self._skipped_reloads = meter.create_counter(
+            "flagd.sync.skipped_reloads",
+            unit="{payload}",
+            description="Synced payloads skipped because they did not change",
+        )
+        meter.create_observable_gauge(
+            "flagd.sync.snapshot.age",
+            callbacks=[self._observe_snapshot_age],
+            unit="s",
+            description="Time since the current flag configuration was applied",
+        )
+        self._last: SyncMetrics | None = None
+
+    def record_sync(self, metrics: SyncMetrics) -> None:
+        if metrics.payload_bytes is not None:
+            self._payload_size.record(metrics.payload_bytes)
+        self._decode_duration.record(metrics.decode_seconds)
+        self._update_duration.record(metrics.update_seconds)
+        self._changed_keys.record(metrics.changed_keys)
+        self._last = metrics
+
+    def record_skipped_reload(self, metrics: SyncMetrics) -> None:
+        self._skipped_reloads.add(1)
+        self._last = metrics
+
+    def _observe_snapshot_age(
+        self, options: "otel_metrics.CallbackOptions"
+    ) -> "typing.Iterable[otel_metrics.Observation]":
+        last = self._last
+        if last is None:
+            return []
+        return [otel_metrics.Observation(last.snapshot_age)]
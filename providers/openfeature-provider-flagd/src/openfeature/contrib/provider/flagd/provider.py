@@ -23,6 +23,7 @@
 
 import typing
 import warnings
+from types import MappingProxyType
 
 import grpc
 
@@ -34,7 +35,11 @@ from openfeature.provider import AbstractProvider
 from openfeature.provider.metadata import Metadata
 
 from .config import CacheType, Config, ResolverType
+from .metrics import MetricsSink, SyncMetrics
 from .resolvers import AbstractResolver, GrpcResolver, InProcessResolver
+from .resolvers.backoff import BackoffState
+from .resolvers.cache import CacheStats
+from .resolvers.scope import EvaluationScope
 from .sync_metadata_hook import SyncMetadataHook
 
 T = typing.TypeVar("T")
@@ -54,11 +59,12 @@ class FlagdProvider(AbstractProvider):
         selector: str | None = None,
         provider_id: str | None = None,
         resolver_type: ResolverType | None = None,
-        offline_flag_source_path: str | None = None,
+        offline_flag_source_path: str | list[str] | None = None,
         stream_deadline_ms: int | None = None,
         keep_alive_time: int | None = None,
         cache: CacheType | None = None,
         max_cache_size: int | None = None,
+        targeting_cache_ttl_ms: int | None = None,
         retry_backoff_max_ms: int | None = None,
         retry_grace_period: int | None = None,
         cert_path: str | None = None,
@@ -66,6 +72,14 @@ class FlagdProvider(AbstractProvider):
         channel_credentials: grpc.ChannelCredentials | None = None,
         sync_metadata_disabled: bool | None = None,
         fatal_status_codes: list[str] | None = None,
+        sync_cache_path: str | None = None,
+        shared_sync: bool | None = None,
+        compression: str | None = None,
+        max_receive_message_length: int | None = None,
+        http2_window_size: int | None = None,
+        sync_targets: list[str] | None = None,
+        channel_pool_size: int | None = None,
+        metrics_sink: MetricsSink | None = None,
     ):
         """
         Create an instance of the FlagdProvider
@@ -79,10 +93,34 @@ class FlagdProvider(AbstractProvider):
         :param selector: filter flag configurations by source (in-process mode only)
                          Passed via both flagd-selector gRPC metadata header and request body
                          for backward compatibility with all flagd versions.
-        :param offline_flag_source_path: the path to the flag source file
+        :param offline_flag_source_path: the flag source file, a directory of flag
+                         files or a list of both; later sources take precedence
         :param stream_deadline_ms: the maximum time to wait before a request times out
         :param keep_alive_time: the number of milliseconds to keep alive
         :param resolver_type: the type of resolver to use
+        :param targeting_cache_ttl_ms: also cache targeted evaluations per flag
+                         and evaluation context for this many milliseconds,
+                         0 disables it (rpc mode only)
+        :param sync_cache_path: file to persist the last synced flag configuration
+                         to, served on startup until the sync stream connects
+                         (in-process mode only)
+        :param shared_sync: share one sync stream and parsed flag configuration
+                         with the other providers of the process that sync
+                         from the same target and selector (in-process mode only)
+        :param compression: compression of messages sent to flagd, `gzip`,
+                         `deflate` or `none`
+        :param max_receive_message_length: largest message accepted from flagd
+                         in bytes, gRPC allows 4 MiB by default
+        :param http2_window_size: fixed HTTP/2 stream flow-control window in
+                         bytes, replacing the dynamically sized one
+        :param sync_targets: flagd sync endpoints as `host:port`, the stream
+                         fails over between them (in-process mode only,
+                         replaces host and port)
+        :param channel_pool_size: number of channels to spread concurrent
+                         evaluations over (rpc mode only)
+        :param metrics_sink: receives the metrics of every flag configuration
+                         update, e.g. an `OpenTelemetryMetricsSink`
+                         (in-process mode only)
         """
         if deadline_ms is None and timeout is not None:
             deadline_ms = timeout * 1000
@@ -108,21 +146,35 @@ class FlagdProvider(AbstractProvider):
             keep_alive_time=keep_alive_time,
             cache=cache,
             max_cache_size=max_cache_size,
+            targeting_cache_ttl_ms=targeting_cache_ttl_ms,
             cert_path=cert_path,
             default_authority=default_authority,
             channel_credentials=channel_credentials,
             sync_metadata_disabled=sync_metadata_disabled,
             fatal_status_codes=fatal_status_codes,
+            sync_cache_path=sync_cache_path,
+            shared_sync=shared_sync,
+            compression=compression,
+            max_receive_message_length=max_receive_message_length,
+            http2_window_size=http2_window_size,
+            sync_targets=sync_targets,
+            channel_pool_size=channel_pool_size,
+            metrics_sink=metrics_sink,
         )
         self.enriched_context: dict = {}
+        # built once per sync context update, shared by all evaluations
+        self._enriched_evaluation_context = EvaluationContext()
 
         self.resolver = self.setup_resolver()
         self.hooks: list[Hook] = [SyncMetadataHook(self.get_enriched_context)]
 
     def get_enriched_context(self) -> EvaluationContext:
-        return EvaluationContext(attributes=self.enriched_context)
+        return self._enriched_evaluation_context
 
     def get_provider_hooks(self) -> list[Hook]:
+        # without sync metadata there is nothing to merge into evaluations
+        if not self.enriched_context:
+            return []
         return self.hooks
 
     def setup_resolver(self) -> AbstractResolver:
@@ -157,6 +209,43 @@ class FlagdProvider(AbstractProvider):
         if self.resolver:
             self.resolver.shutdown()
 
+    async def initialize_async(self, evaluation_context: EvaluationContext) -> None:
+        """Initialize from within a running event loop.
+
+        In-process sync then runs on the loop instead of background threads.
+        Await it before registering the provider, the SDK's own call to
+        `initialize` is a no-op afterwards.
+        """
+        await self.resolver.initialize_async(evaluation_context)
+
+    async def shutdown_async(self) -> None:
+        if self.resolver:
+            await self.resolver.shutdown_async()
+
+    def get_sync_metrics(self) -> SyncMetrics | None:
+        """Metrics of the last flag configuration update, in-process mode only."""
+        if isinstance(self.resolver, InProcessResolver):
+            return self.resolver.get_sync_metrics()
+        return None
+
+    def get_reconnect_backoff(self) -> BackoffState | None:
+        """State of the stream reconnect backoff, None without a gRPC stream."""
+        return self.resolver.get_reconnect_backoff()
+
+    def get_cache_stats(self) -> CacheStats | None:
+        """Counters of the evaluation cache, None without one.
+
+        Only RPC evaluations are cached, see `cache_type` and `max_cache_size`.
+        """
+        return self.resolver.get_cache_stats()
+
+    def evaluation_scope(self) -> EvaluationScope:
+        """Scope sharing one bulk evaluation per context within a `with` block.
+
+        Only RPC evaluations use it, in-process evaluations are local anyway.
+        """
+        return EvaluationScope(self.resolver)
+
     def get_metadata(self) -> Metadata:
         """Returns provider metadata"""
         return Metadata(name="FlagdProvider")
@@ -214,9 +303,65 @@ class FlagdProvider(AbstractProvider):
             flag_key, default_value, evaluation_context
         )
 
+    async def resolve_boolean_details_async(
+        self,
+        flag_key: str,
+        default_value: bool,
+        evaluation_context: EvaluationContext | None = None,
+    ) -> FlagResolutionDetails[bool]:
+        return await self.resolver.resolve_boolean_details_async(
+            flag_key, default_value, evaluation_context
+        )
+
+    async def resolve_string_details_async(
+        self,
+        flag_key: str,
+        default_value: str,
+        evaluation_context: EvaluationContext | None = None,
+    ) -> FlagResolutionDetails[str]:
+        return await self.resolver.resolve_string_details_async(
+            flag_key, default_value, evaluation_context
+        )
+
+    async def resolve_float_details_async(
+        self,
+        flag_key: str,
+        default_value: float,
+        evaluation_context: EvaluationContext | None = None,
+    ) -> FlagResolutionDetails[float]:
+        return await self.resolver.resolve_float_details_async(
+            flag_key, default_value, evaluation_context
+        )
+
+    async def resolve_integer_details_async(
+        self,
+        flag_key: str,
+        default_value: int,
+        evaluation_context: EvaluationContext | None = None,
+    ) -> FlagResolutionDetails[int]:
+        return await self.resolver.resolve_integer_details_async(
+            flag_key, default_value, evaluation_context
+        )
+
+    async def resolve_object_details_async(
+        self,
+        flag_key: str,
+        default_value: typing.Sequence[FlagValueType]
+        | typing.Mapping[str, FlagValueType],
+        evaluation_context: EvaluationContext | None = None,
+    ) -> FlagResolutionDetails[
+        typing.Sequence[FlagValueType] | typing.Mapping[str, FlagValueType]
+    ]:
+        return await self.resolver.resolve_object_details_async(
+            flag_key, default_value, evaluation_context
+        )
+
     def emit_provider_ready_with_context(
         self, details: ProviderEventDetails, context: dict
     ) -> None:
+        self._enriched_evaluation_context = EvaluationContext(
+            attributes=MappingProxyType(dict(context))
+        )
         self.enriched_context = context
         self.emit_provider_ready(details)
         pass
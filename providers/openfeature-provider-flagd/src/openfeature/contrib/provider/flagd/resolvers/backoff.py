@@ -0,0 +1,62 @@
+import dataclasses
+import random
+import threading
+import typing
+
+# keeps the doubling ceiling from overflowing, far past any sensible maximum
+_MAX_DOUBLINGS = 64
+
+
+@dataclasses.dataclass(frozen=True)
+class BackoffState:
+    """Snapshot of a `ReconnectBackoff`, e.g. for metrics."""
+
+    # reconnect attempts since the last healthy stream
+    attempts: int
+    # upper bound of the next delay
+    ceiling_seconds: float
+    last_delay_seconds: float | None
+
+
+class ReconnectBackoff:
+    """Exponential backoff with full jitter between stream reconnects.
+
+    The ceiling starts at ``initial`` seconds and doubles with every attempt
+    up to ``maximum``; each delay is drawn uniformly between zero and the
+    ceiling so that clients losing the same server spread their reconnects.
+    `reset` starts over once a stream is healthy again.
+    """
+
+    def __init__(
+        self,
+        initial: float,
+        maximum: float,
+        rand: typing.Callable[[], float] = random.random,
+    ):
+        self.initial = initial
+        self.maximum = max(initial, maximum)
+        self._rand = rand
+        self._lock = threading.Lock()
+        self._attempts = 0
+        self._last_delay: float | None = None
+
+    def _ceiling(self) -> float:
+        return min(
+            self.maximum, self.initial * 2.0 ** min(self._attempts, _MAX_DOUBLINGS)
+        )
+
+    def next_delay(self) -> float:
+        """Delay before the next attempt, in seconds."""
+        with self._lock:
+            delay = self._rand() * self._ceiling()
+            self._attempts += 1
+            self._last_delay = delay
+            return delay
+
+    def reset(self) -> None:
+        with self._lock:
+            self._attempts = 0
+
+    def state(self) -> BackoffState:
+        with self._lock:
+            return BackoffState(self._attempts, self._ceiling(), self._last_delay)
@@ -0,0 +1,160 @@
+import copy
+import dataclasses
+import threading
+import time
+import typing
+
+from cachebox import LRUCache
+
+from openfeature.flag_evaluation import FlagResolutionDetails, FlagValueType, Reason
+
+# a flag key, or a flag key and serialized evaluation context
+CacheKey = str | tuple[str, bytes]
+
+
+@dataclasses.dataclass(frozen=True)
+class CachedFlag:
+    """Evaluation stored in a `FlagCache`, never handed out itself."""
+
+    value: FlagValueType
+    variant: str | None
+    # time.monotonic() after which the entry is dropped, None to keep it
+    expires_at: float | None = None
+
+    def details(self) -> FlagResolutionDetails[FlagValueType]:
+        value = self.value
+        if isinstance(value, (dict, list)):
+            # object flags are the only mutable values, callers get their own
+            value = copy.deepcopy(value)
+        return FlagResolutionDetails(
+            value=value, reason=Reason.CACHED, variant=self.variant
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of the counters of a `FlagCache`, e.g. for metrics."""
+
+    hits: int
+    misses: int
+    # entries dropped to make room for new ones
+    evictions: int
+    # entries dropped because the flag changed or the stream was lost
+    invalidations: int
+    # entries dropped because their time to live ran out
+    expirations: int
+    size: int
+    max_size: int
+
+
+class FlagCache:
+    """LRU cache of evaluation results of an RPC resolver.
+
+    Results that don't depend on the evaluation context are stored per flag,
+    targeted results per flag and serialized context with a time to live.
+    Entries are immutable, every hit returns new `FlagResolutionDetails` with
+    reason ``CACHED`` so that callers can't change what others get.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ):
+        self._entries: LRUCache = LRUCache(maxsize=max_size)
+        self._clock = clock
+        self._lock = threading.Lock()
+        # serialized contexts cached per flag, to invalidate all of them
+        self._contexts: dict[str, set[bytes]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._expirations = 0
+
+    def get(
+        self, flag_key: str, context_key: bytes | None = None
+    ) -> FlagResolutionDetails[FlagValueType] | None:
+        """Cached result of the flag, the one for the context if given."""
+        with self._lock:
+            entry: CachedFlag | None = self._entries.get(flag_key)
+            if entry is None and context_key is not None:
+                key = (flag_key, context_key)
+                entry = self._entries.get(key)
+                if entry is not None and self._expired(entry):
+                    self._drop(key)
+                    self._expirations += 1
+                    entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        return entry.details()
+
+    def put(
+        self,
+        flag_key: str,
+        details: FlagResolutionDetails[FlagValueType],
+        context_key: bytes | None = None,
+        ttl: float | None = None,
+    ) -> None:
+        """Caches a result, only for the context and ttl seconds if given."""
+        key: CacheKey = flag_key if context_key is None else (flag_key, context_key)
+        expires_at = None if ttl is None else self._clock() + ttl
+        entry = CachedFlag(copy.deepcopy(details.value), details.variant, expires_at)
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_size:
+                evicted, _ = self._entries.popitem()
+                self._forget(evicted)
+                self._evictions += 1
+            self._entries.insert(key, entry)
+            if context_key is not None:
+                self._contexts.setdefault(flag_key, set()).add(context_key)
+
+    def invalidate(self, flag_keys: typing.Iterable[str]) -> None:
+        """Drops the results of the flags, for all contexts."""
+        with self._lock:
+            for flag_key in flag_keys:
+                if self._entries.pop(flag_key, None) is not None:
+                    self._invalidations += 1
+                for context_key in self._contexts.pop(flag_key, ()):
+                    if self._entries.pop((flag_key, context_key), None) is not None:
+                        self._invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+            self._contexts.clear()
+
+    def _expired(self, entry: CachedFlag) -> bool:
+        return entry.expires_at is not None and entry.expires_at <= self._clock()
+
+    def _drop(self, key: CacheKey) -> None:
+        self._entries.pop(key, None)
+        self._forget(key)
+
+    def _forget(self, key: CacheKey) -> None:
+        if isinstance(key, tuple):
+            flag_key, context_key = key
+            contexts = self._contexts.get(flag_key)
+            if contexts is not None:
+                contexts.discard(context_key)
+                if not contexts:
+                    del self._contexts[flag_key]
+
+    @property
+    def max_size(self) -> int:
+        return int(self._entries.maxsize)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._invalidations,
+                self._expirations,
+                len(self._entries),
+                self.max_size,
+            )
@@ -0,0 +1,62 @@
+import contextlib
+import threading
+import typing
+
+import grpc
+
+from openfeature.schemas.protobuf.flagd.evaluation.v1 import (
+    evaluation_pb2_grpc as evaluation_v1_pb2_grpc,
+)
+from openfeature.schemas.protobuf.flagd.evaluation.v2 import evaluation_pb2_grpc
+
+
+class PooledChannel:
+    def __init__(self, channel: grpc.Channel):
+        self.channel = channel
+        self.stub = evaluation_pb2_grpc.ServiceStub(channel)
+        # ResolveAll is only part of the v1 evaluation service
+        self.bulk_stub = evaluation_v1_pb2_grpc.ServiceStub(channel)
+        # calls currently running on the channel
+        self.outstanding = 0
+
+
+class ChannelPool:
+    """Spreads unary evaluations over several channels to the same flagd.
+
+    Every call goes to the channel with the fewest outstanding calls, ties
+    are broken round robin. Each channel connects and reconnects on its own.
+    The first channel belongs to the resolver, which also runs the event
+    stream on it, `close` only closes the others.
+    """
+
+    def __init__(self, channels: typing.Sequence[grpc.Channel]):
+        self._channels = [PooledChannel(channel) for channel in channels]
+        self._lock = threading.Lock()
+        self._next = 0
+
+    @contextlib.contextmanager
+    def acquire(self) -> typing.Iterator[PooledChannel]:
+        size = len(self._channels)
+        with self._lock:
+            start = self._next
+            self._next = (start + 1) % size
+            pooled = min(
+                (self._channels[(start + i) % size] for i in range(size)),
+                key=lambda candidate: candidate.outstanding,
+            )
+            pooled.outstanding += 1
+        try:
+            yield pooled
+        finally:
+            with self._lock:
+                pooled.outstanding -= 1
+
+    @property
+    def outstanding(self) -> list[int]:
+        """Outstanding calls per channel."""
+        with self._lock:
+            return [pooled.outstanding for pooled in self._channels]
+
+    def close(self) -> None:
+        for pooled in self._channels[1:]:
+            pooled.channel.close()
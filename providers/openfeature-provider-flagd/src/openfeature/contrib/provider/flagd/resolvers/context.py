@@ -0,0 +1,65 @@
+import typing
+
+from cachebox import LRUCache
+from google.protobuf.struct_pb2 import Struct
+
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.exception import InvalidContextError
+
+# distinct evaluation contexts kept converted, e.g. the users of recent requests
+DEFAULT_MAX_CONTEXTS = 256
+
+
+class ConvertedContext(typing.NamedTuple):
+    """Evaluation context as sent to flagd, shared between evaluations.
+
+    ``struct`` must not be modified, request messages copy it anyway.
+    """
+
+    struct: Struct
+    # deterministic serialization of struct, identifies the context
+    key: bytes
+
+
+class ContextConverter:
+    """Converts evaluation contexts to protobuf Structs, memoized by content.
+
+    The SDK merges the API, client and invocation contexts into a new object
+    for every evaluation, so contexts are recognized by their content rather
+    than their identity: every evaluation with the same targeting key and
+    attributes reuses the converted Struct and its serialization. The repr of
+    the attributes serves as content key, it is computed in C for the JSON-like
+    values a Struct accepts and, unlike equality, tells True, 1 and 1.0 apart.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_CONTEXTS):
+        self._converted: LRUCache = LRUCache(maxsize=max_size)
+        self._empty = self._convert(None)
+
+    def convert(self, evaluation_context: EvaluationContext | None) -> ConvertedContext:
+        if not evaluation_context:
+            return self._empty
+        key = (evaluation_context.targeting_key, repr(evaluation_context.attributes))
+        converted: ConvertedContext | None = self._converted.get(key)
+        if converted is None:
+            converted = self._convert(evaluation_context)
+            self._converted.insert(key, converted)
+        return converted
+
+    @staticmethod
+    def _convert(evaluation_context: EvaluationContext | None) -> ConvertedContext:
+        s = Struct()
+        if evaluation_context:
+            try:
+                s["targetingKey"] = evaluation_context.targeting_key
+                s.update(
+                    typing.cast(
+                        "typing.Mapping[str, typing.Any]", evaluation_context.attributes
+                    )
+                )
+            except ValueError as exc:
+                message = (
+                    "could not serialize evaluation context to google.protobuf.Struct"
+                )
+                raise InvalidContextError(message) from exc
+        return ConvertedContext(s, s.SerializeToString(deterministic=True))
@@ -1,11 +1,13 @@
+import asyncio
+import contextlib
+import functools
 import json
 import logging
 import threading
-import time
 import typing
+import weakref
 
 import grpc
-from cachebox import BaseCacheImpl, LRUCache
 from google.protobuf.json_format import MessageToDict
 from google.protobuf.struct_pb2 import Struct
 from grpc import ChannelConnectivity
@@ -16,20 +18,32 @@ from openfeature.exception import (
     ErrorCode,
     FlagNotFoundError,
     GeneralError,
-    InvalidContextError,
+    OpenFeatureError,
     ParseError,
     ProviderFatalError,
     ProviderNotReadyError,
     TypeMismatchError,
 )
 from openfeature.flag_evaluation import FlagResolutionDetails, FlagValueType, Reason
+from openfeature.schemas.protobuf.flagd.evaluation.v1 import (
+    evaluation_pb2 as evaluation_v1_pb2,
+)
+from openfeature.schemas.protobuf.flagd.evaluation.v1 import (
+    evaluation_pb2_grpc as evaluation_v1_pb2_grpc,
+)
 from openfeature.schemas.protobuf.flagd.evaluation.v2 import (
     evaluation_pb2,
     evaluation_pb2_grpc,
 )
 
-from ..config import CacheType, Config
+from ..config import CacheType, Config, grpc_tuning_options
 from ..flag_type import FlagType
+from .backoff import BackoffState, ReconnectBackoff
+from .cache import CacheStats, FlagCache
+from .channel_pool import ChannelPool
+from .context import ContextConverter, ConvertedContext
+from .scope import current_scope
+from .single_flight import SingleFlight
 from .types import GrpcMultiCallableArgs
 
 FLAGD_SELECTOR_HEADER = "flagd-selector"
@@ -39,9 +53,34 @@ if typing.TYPE_CHECKING:
 
 T = typing.TypeVar("T")
 
+# unary evaluation RPC of each flag type
+_METHODS = {
+    FlagType.BOOLEAN: "ResolveBoolean",
+    FlagType.STRING: "ResolveString",
+    FlagType.OBJECT: "ResolveObject",
+    FlagType.FLOAT: "ResolveFloat",
+    FlagType.INTEGER: "ResolveInt",
+}
+
+# value field of a ResolveAll evaluation expected for each flag type
+_ANY_FLAG_VALUES = {
+    FlagType.BOOLEAN: "bool_value",
+    FlagType.STRING: "string_value",
+    FlagType.OBJECT: "object_value",
+    FlagType.FLOAT: "double_value",
+    FlagType.INTEGER: "double_value",
+}
+
 logger = logging.getLogger("openfeature.contrib")
 
 
+class _AioChannel(typing.NamedTuple):
+    channel: grpc.aio.Channel
+    stub: typing.Any
+    # ResolveAll is only part of the v1 evaluation service
+    bulk_stub: typing.Any
+
+
 class GrpcResolver:
     def __init__(
         self,
@@ -59,33 +98,75 @@ class GrpcResolver:
         self.emit_provider_error = emit_provider_error
         self.emit_provider_stale = emit_provider_stale
         self.emit_provider_configuration_changed = emit_provider_configuration_changed
-        self.cache: BaseCacheImpl | None = (
-            LRUCache(maxsize=self.config.max_cache_size)
-            if self.config.cache == CacheType.LRU
+        self.cache = self._build_cache(config)
+        # targeted results are only cached when opted in
+        self.targeting_cache_ttl: float | None = (
+            config.targeting_cache_ttl_ms * 0.001
+            if self.cache is not None and config.targeting_cache_ttl_ms > 0
             else None
         )
+        self.contexts = ContextConverter()
+        # identical evaluations in flight at the same time share one RPC
+        self.flights = SingleFlight()
         logger.debug(self.config.fatal_status_codes)
 
         self.retry_grace_period = config.retry_grace_period
         self.retry_backoff_max_seconds = config.retry_backoff_max_ms * 0.001
+        self.backoff = ReconnectBackoff(
+            config.retry_backoff_ms * 0.001, self.retry_backoff_max_seconds
+        )
         self.streamline_deadline_seconds = config.stream_deadline_ms * 0.001
         self.deadline = config.deadline_ms * 0.001
         self.connected = False
         self._is_fatal = False
         self._shutdown_event = threading.Event()
+        # ends the blocking connect: first data, a fatal error or shutdown
+        self._ready_event = threading.Event()
         self.channel = self._generate_channel(config)
         self.stub = evaluation_pb2_grpc.ServiceStub(self.channel)
+        # ResolveAll is only part of the v1 evaluation service
+        self.bulk_stub = evaluation_v1_pb2_grpc.ServiceStub(self.channel)
+        self.pool = self._build_pool(config)
         self.selector_metadata: tuple[tuple[str, str], ...] | None = (
             ((FLAGD_SELECTOR_HEADER, config.selector),) if config.selector else None
         )
 
         self.thread: threading.Thread | None = None
         self.timer: threading.Timer | None = None
+        self._init_aio()
+
+    @staticmethod
+    def _build_cache(config: Config) -> FlagCache | None:
+        if config.cache != CacheType.LRU:
+            return None
+        return FlagCache(config.max_cache_size)
+
+    def _build_pool(self, config: Config) -> ChannelPool | None:
+        """Extra channels for unary evaluations, the event stream stays on the first."""
+        if config.channel_pool_size <= 1:
+            return None
+        return ChannelPool(
+            [
+                self.channel,
+                *(
+                    self._generate_channel(config, pooled=True)
+                    for _ in range(config.channel_pool_size - 1)
+                ),
+            ]
+        )
 
-    def _generate_channel(self, config: Config) -> grpc.Channel:
-        target = f"{config.host}:{config.port}"
-        # Create the channel with the service config
-        options = [
+    def _init_aio(self) -> None:
+        # evaluations from asyncio run on a channel created on their loop,
+        # aio channels cannot be shared between loops
+        self._aio_channels: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _AioChannel
+        ] = weakref.WeakKeyDictionary()
+        self._aio_lock = threading.Lock()
+        self._aio_close_tasks: set[asyncio.Task] = set()
+
+    @staticmethod
+    def _channel_options(config: Config) -> list[tuple[str, typing.Any]]:
+        return [
             ("grpc.keepalive_time_ms", config.keep_alive_time),
             ("grpc.initial_reconnect_backoff_ms", config.retry_backoff_ms),
             ("grpc.max_reconnect_backoff_ms", config.retry_backoff_max_ms),
@@ -116,26 +197,84 @@ class GrpcResolver:
                     }
                 ),
             ),
+            *grpc_tuning_options(config),
         ]
-        if config.tls:
-            credentials = grpc.ssl_channel_credentials()
-            if config.cert_path:
-                with open(config.cert_path, "rb") as f:
-                    credentials = grpc.ssl_channel_credentials(f.read())
 
-            channel = grpc.secure_channel(
+    @staticmethod
+    def _channel_credentials(config: Config) -> grpc.ChannelCredentials | None:
+        if not config.tls:
+            return None
+        if config.cert_path:
+            with open(config.cert_path, "rb") as f:
+                return grpc.ssl_channel_credentials(f.read())
+        return grpc.ssl_channel_credentials()
+
+    def _generate_channel(self, config: Config, pooled: bool = False) -> grpc.Channel:
+        target = f"{config.host}:{config.port}"
+        options = self._channel_options(config)
+        if pooled:
+            # channels to the same target share connections unless told not to
+            options.append(("grpc.use_local_subchannel_pool", 1))
+        credentials = self._channel_credentials(config)
+        if credentials is not None:
+            return grpc.secure_channel(
                 target,
                 credentials=credentials,
                 options=options,
+                compression=config.compression,
             )
+        return grpc.insecure_channel(
+            target,
+            options=options,
+            compression=config.compression,
+        )
 
-        else:
-            channel = grpc.insecure_channel(
-                target,
-                options=options,
+    def _generate_aio_channel(self, config: Config) -> grpc.aio.Channel:
+        target = f"{config.host}:{config.port}"
+        options = self._channel_options(config)
+        credentials = self._channel_credentials(config)
+        if credentials is not None:
+            return grpc.aio.secure_channel(
+                target, credentials, options=options, compression=config.compression
             )
+        return grpc.aio.insecure_channel(
+            target, options=options, compression=config.compression
+        )
+
+    def _aio_channel(self) -> _AioChannel:
+        """The ``grpc.aio`` channel bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._aio_lock:
+            aio = self._aio_channels.get(loop)
+            if aio is None:
+                channel = self._generate_aio_channel(self.config)
+                aio = self._aio_channels[loop] = _AioChannel(
+                    channel,
+                    evaluation_pb2_grpc.ServiceStub(channel),
+                    evaluation_v1_pb2_grpc.ServiceStub(channel),
+                )
+        return aio
+
+    def _aio_stub(self) -> typing.Any:
+        return self._aio_channel().stub
+
+    def _aio_bulk_stub(self) -> typing.Any:
+        return self._aio_channel().bulk_stub
 
-        return channel
+    def _close_aio_channels(self) -> None:
+        with self._aio_lock:
+            channels = list(self._aio_channels.items())
+            self._aio_channels.clear()
+        for loop, aio in channels:
+            if not loop.is_closed():
+                # possibly called from another thread, each channel closes on
+                # its own loop
+                loop.call_soon_threadsafe(self._close_on_loop, aio.channel)
+
+    def _close_on_loop(self, channel: grpc.aio.Channel) -> None:
+        task = asyncio.get_running_loop().create_task(channel.close())
+        self._aio_close_tasks.add(task)
+        task.add_done_callback(self._aio_close_tasks.discard)
 
     def initialize(self, evaluation_context: EvaluationContext) -> None:
         self.connect()
@@ -143,17 +282,33 @@ class GrpcResolver:
     def shutdown(self) -> None:
         self.active = False
         self._shutdown_event.set()
+        self._ready_event.set()
         self.channel.unsubscribe(self._state_change_callback)
         self.channel.close()
+        if self.pool is not None:
+            self.pool.close()
         if self.timer and self.timer.is_alive():
             logger.debug("gRPC error timer cancelled due to shutdown")
             self.timer.cancel()
-        if self.cache:
+        if self.cache is not None:
             self.cache.clear()
+        self._close_aio_channels()
+
+    async def initialize_async(self, evaluation_context: EvaluationContext) -> None:
+        await asyncio.to_thread(self.initialize, evaluation_context)
+
+    async def shutdown_async(self) -> None:
+        # the channel of this loop is closed here, the others on their loops
+        with self._aio_lock:
+            aio = self._aio_channels.pop(asyncio.get_running_loop(), None)
+        self.shutdown()
+        if aio is not None:
+            await aio.channel.close()
 
     def connect(self) -> None:
         self.active = True
         self._shutdown_event.clear()
+        self._ready_event.clear()
 
         # Run monitoring in a separate thread
         self.monitor_thread = threading.Thread(
@@ -161,11 +316,7 @@ class GrpcResolver:
         )
         self.monitor_thread.start()
         ## block until ready or deadline reached
-        timeout = self.deadline + time.monotonic()
-        while not self.connected and time.monotonic() < timeout:
-            if self._is_fatal:
-                break
-            time.sleep(0.05)
+        self._ready_event.wait(self.deadline)
         logger.debug("Finished blocking gRPC state initialization")
 
         if self._is_fatal:
@@ -215,7 +366,7 @@ class GrpcResolver:
 
     def emit_error(self) -> None:
         logger.debug("gRPC error emitted")
-        if self.cache:
+        if self.cache is not None:
             self.cache.clear()
         self.emit_provider_error(
             ProviderEventDetails(
@@ -233,7 +384,9 @@ class GrpcResolver:
         return call_args
 
     def _wait_before_reconnect(self) -> None:
-        self._shutdown_event.wait(self.retry_backoff_max_seconds)
+        delay = self.backoff.next_delay()
+        logger.debug(f"Reconnecting gRPC event stream in {delay:.3f}s")
+        self._shutdown_event.wait(delay)
 
     def _handle_rpc_error(self, e: grpc.RpcError) -> bool:
         # code() blocks until final status, finalizing the dead RPC before reconnect; keep it, do not inline into logging only
@@ -243,6 +396,7 @@ class GrpcResolver:
             logger.error(f"EventStream fatal error, {code=} {e.details()=}")
             self._is_fatal = True
             self.active = False
+            self._ready_event.set()
             self.emit_provider_error(
                 ProviderEventDetails(
                     message=f"Fatal gRPC status code: {code}",
@@ -257,11 +411,13 @@ class GrpcResolver:
     def _handle_event_stream_message(
         self, message: evaluation_pb2.EventStreamResponse
     ) -> None:
+        self.backoff.reset()
         if message.type == "provider_ready":
             self.emit_provider_ready(
                 ProviderEventDetails(message="gRPC sync connection established")
             )
             self.connected = True
+            self._ready_event.set()
         elif message.type == "configuration_change":
             msg_dict = MessageToDict(message)
             data = msg_dict.get("data", {})
@@ -292,12 +448,19 @@ class GrpcResolver:
             if self.active:
                 self._wait_before_reconnect()
 
+    def get_reconnect_backoff(self) -> BackoffState | None:
+        return self.backoff.state()
+
+    def get_cache_stats(self) -> CacheStats | None:
+        return self.cache.stats() if self.cache is not None else None
+
     def handle_changed_flags(self, data: typing.Any) -> None:
         changed_flags = list(data.get("flags", {}).keys())
 
-        if self.cache:
-            for flag in changed_flags:
-                self.cache.pop(flag)
+        if self.cache is not None:
+            self.cache.invalidate(changed_flags)
+        # evaluations started before the change must not answer later callers
+        self.flights.forget()
 
         self.emit_provider_configuration_changed(ProviderEventDetails(changed_flags))
 
@@ -344,6 +507,59 @@ class GrpcResolver:
     ]:
         return self._resolve(key, FlagType.OBJECT, default_value, evaluation_context)
 
+    async def resolve_boolean_details_async(
+        self,
+        key: str,
+        default_value: bool,
+        evaluation_context: EvaluationContext | None = None,
+    ) -> FlagResolutionDetails[bool]:
+        return await self._resolve_async(
+            key, FlagType.BOOLEAN, default_value, evaluation_context
+        )
+
+    async def resolve_string_details_async(
+        self,
+        key: str,
+        default_value: str,
+        evaluation_context: EvaluationContext | None = None,
+    ) -> FlagResolutionDetails[str]:
+        return await self._resolve_async(
+            key, FlagType.STRING, default_value, evaluation_context
+        )
+
+    async def resolve_float_details_async(
+        self,
+        key: str,
+        default_value: float,
+        evaluation_context: EvaluationContext | None = None,
+    ) -> FlagResolutionDetails[float]:
+        return await self._resolve_async(
+            key, FlagType.FLOAT, default_value, evaluation_context
+        )
+
+    async def resolve_integer_details_async(
+        self,
+        key: str,
+        default_value: int,
+        evaluation_context: EvaluationContext | None = None,
+    ) -> FlagResolutionDetails[int]:
+        return await self._resolve_async(
+            key, FlagType.INTEGER, default_value, evaluation_context
+        )
+
+    async def resolve_object_details_async(
+        self,
+        key: str,
+        default_value: typing.Sequence[FlagValueType]
+        | typing.Mapping[str, FlagValueType],
+        evaluation_context: EvaluationContext | None = None,
+    ) -> FlagResolutionDetails[
+        typing.Sequence[FlagValueType] | typing.Mapping[str, FlagValueType]
+    ]:
+        return await self._resolve_async(
+            key, FlagType.OBJECT, default_value, evaluation_context
+        )
+
     @typing.overload
     def _resolve(
         self,
@@ -392,77 +608,259 @@ class GrpcResolver:
         typing.Sequence[FlagValueType] | typing.Mapping[str, FlagValueType]
     ]: ...
 
-    def _resolve(  # noqa: PLR0915 C901
+    def _resolve(
         self,
         flag_key: str,
         flag_type: FlagType,
         default_value: FlagValueType,
         evaluation_context: EvaluationContext | None,
     ) -> FlagResolutionDetails[FlagValueType]:
-        if self.cache is not None and flag_key in self.cache:
-            cached_flag: FlagResolutionDetails[FlagValueType] = self.cache[flag_key]
-            cached_flag.reason = Reason.CACHED
-            return cached_flag
+        context = self._cache_context(evaluation_context)
+        context_key = context.key if context is not None else None
+        cached = self._cached(flag_key, context_key)
+        if cached is not None:
+            return cached
+
+        if context is None:
+            context = self._convert_context(evaluation_context)
+        scope = current_scope(self)
+        if scope is not None:
+            flags = scope.get(context.key)
+            if flags is None:
+                # concurrent evaluations of the context share one bulk call
+                flags = self.flights.do(
+                    ("ResolveAll", context.key),
+                    functools.partial(self._resolve_all, context.struct),
+                )
+                scope.put(context.key, flags)
+            if flag_key in flags:
+                return self._scoped_result(flags[flag_key], flag_type, default_value)
+
+        try:
+            response = self.flights.do(
+                (flag_type, flag_key, context.key),
+                functools.partial(self._evaluate, flag_key, flag_type, context.struct),
+            )
+        except grpc.RpcError as e:
+            raise self._map_rpc_error(e) from e
+        return self._result(flag_key, flag_type, response, default_value, context_key)
 
-        context = self._convert_context(evaluation_context)
+    async def _resolve_async(
+        self,
+        flag_key: str,
+        flag_type: FlagType,
+        default_value: T,
+        evaluation_context: EvaluationContext | None,
+    ) -> FlagResolutionDetails[T]:
+        default = typing.cast(FlagValueType, default_value)
+        context = self._cache_context(evaluation_context)
+        context_key = context.key if context is not None else None
+        result = self._cached(flag_key, context_key)
+        if result is None:
+            if context is None:
+                context = self._convert_context(evaluation_context)
+            result = await self._resolve_remote_async(
+                flag_key, flag_type, default, context, context_key
+            )
+        return typing.cast(FlagResolutionDetails[T], result)
+
+    async def _resolve_remote_async(
+        self,
+        flag_key: str,
+        flag_type: FlagType,
+        default_value: FlagValueType,
+        context: ConvertedContext,
+        context_key: bytes | None,
+    ) -> FlagResolutionDetails[FlagValueType]:
+        scope = current_scope(self)
+        if scope is not None:
+            flags = scope.get(context.key)
+            if flags is None:
+                flags = await self.flights.do_async(
+                    ("ResolveAll", context.key),
+                    functools.partial(self._resolve_all_async, context.struct),
+                )
+                scope.put(context.key, flags)
+            if flag_key in flags:
+                return self._scoped_result(flags[flag_key], flag_type, default_value)
+
+        try:
+            response = await self.flights.do_async(
+                (flag_type, flag_key, context.key),
+                functools.partial(
+                    self._evaluate_async, flag_key, flag_type, context.struct
+                ),
+            )
+        except grpc.RpcError as e:
+            raise self._map_rpc_error(e) from e
+        return self._result(flag_key, flag_type, response, default_value, context_key)
+
+    @contextlib.contextmanager
+    def _stubs(self) -> typing.Iterator[tuple[typing.Any, typing.Any]]:
+        """Evaluation and bulk evaluation stub for one unary call."""
+        if self.pool is None:
+            yield self.stub, self.bulk_stub
+            return
+        with self.pool.acquire() as pooled:
+            yield pooled.stub, pooled.bulk_stub
+
+    def _evaluate(
+        self, flag_key: str, flag_type: FlagType, context: Struct
+    ) -> typing.Any:
+        request = self._request(flag_key, flag_type, context)
+        with self._stubs() as (stub, _):
+            return getattr(stub, _METHODS[flag_type])(request, **self._call_args())
+
+    async def _evaluate_async(
+        self, flag_key: str, flag_type: FlagType, context: Struct
+    ) -> typing.Any:
+        request = self._request(flag_key, flag_type, context)
+        return await getattr(self._aio_stub(), _METHODS[flag_type])(
+            request, **self._call_args()
+        )
+
+    def _resolve_all(self, context: Struct) -> typing.Mapping[str, typing.Any]:
+        try:
+            with self._stubs() as (_, bulk_stub):
+                response = bulk_stub.ResolveAll(
+                    evaluation_v1_pb2.ResolveAllRequest(context=context),
+                    **self._call_args(),
+                )
+        except grpc.RpcError as e:
+            return self._resolve_all_failed(e)
+        return dict(response.flags)
+
+    async def _resolve_all_async(
+        self, context: Struct
+    ) -> typing.Mapping[str, typing.Any]:
+        try:
+            response = await self._aio_bulk_stub().ResolveAll(
+                evaluation_v1_pb2.ResolveAllRequest(context=context),
+                **self._call_args(),
+            )
+        except grpc.RpcError as e:
+            return self._resolve_all_failed(e)
+        return dict(response.flags)
+
+    def _resolve_all_failed(self, e: grpc.RpcError) -> typing.Mapping[str, typing.Any]:
+        if e.code() == grpc.StatusCode.UNIMPLEMENTED:
+            # flags are then evaluated one by one for the rest of the scope
+            logger.debug(f"ResolveAll not supported by flagd: {e}")
+            return {}
+        raise self._map_rpc_error(e) from e
+
+    def _scoped_result(
+        self,
+        flag: evaluation_v1_pb2.AnyFlag,
+        flag_type: FlagType,
+        default_value: FlagValueType,
+    ) -> FlagResolutionDetails[FlagValueType]:
+        field = flag.WhichOneof("value")
+        value: FlagValueType
+        if field is None:
+            value = default_value
+        elif field != _ANY_FLAG_VALUES[flag_type]:
+            raise TypeMismatchError(
+                f"flag value is a {field}, not {flag_type.value.lower()}"
+            )
+        elif flag_type == FlagType.OBJECT:
+            value = MessageToDict(flag.object_value)
+        elif flag_type == FlagType.INTEGER:
+            if not flag.double_value.is_integer():
+                raise TypeMismatchError("flag value is not an integer")
+            value = int(flag.double_value)
+        else:
+            value = getattr(flag, field)
+
+        if flag.reason in (Reason.DEFAULT, Reason.DISABLED) and not flag.variant:
+            value = default_value
+        return FlagResolutionDetails(
+            value=value,
+            reason=flag.reason,
+            variant=flag.variant or None,
+        )
+
+    def _cache_context(
+        self, evaluation_context: EvaluationContext | None
+    ) -> ConvertedContext | None:
+        # the context is only needed up front when results are cached per context
+        if self.targeting_cache_ttl is None:
+            return None
+        return self._convert_context(evaluation_context)
+
+    def _cached(
+        self, flag_key: str, context_key: bytes | None = None
+    ) -> FlagResolutionDetails[FlagValueType] | None:
+        if self.cache is None:
+            return None
+        return self.cache.get(flag_key, context_key)
+
+    def _request(
+        self,
+        flag_key: str,
+        flag_type: FlagType,
+        context: Struct,
+    ) -> "Message":
+        if flag_type == FlagType.BOOLEAN:
+            return evaluation_pb2.ResolveBooleanRequest(
+                flag_key=flag_key, context=context
+            )
+        if flag_type == FlagType.STRING:
+            return evaluation_pb2.ResolveStringRequest(
+                flag_key=flag_key, context=context
+            )
+        if flag_type == FlagType.OBJECT:
+            return evaluation_pb2.ResolveObjectRequest(
+                flag_key=flag_key, context=context
+            )
+        if flag_type == FlagType.FLOAT:
+            return evaluation_pb2.ResolveFloatRequest(
+                flag_key=flag_key, context=context
+            )
+        if flag_type == FlagType.INTEGER:
+            return evaluation_pb2.ResolveIntRequest(flag_key=flag_key, context=context)
+        raise ValueError(f"Unknown flag type: {flag_type}")
+
+    def _call_args(self) -> GrpcMultiCallableArgs:
         call_args: GrpcMultiCallableArgs = {
             "timeout": self.deadline,
             "wait_for_ready": True,
         }
         if self.selector_metadata is not None:
             call_args["metadata"] = self.selector_metadata
-        try:
-            request: Message
-            if flag_type == FlagType.BOOLEAN:
-                request = evaluation_pb2.ResolveBooleanRequest(
-                    flag_key=flag_key, context=context
-                )
-                response = self.stub.ResolveBoolean(request, **call_args)
-                value = response.value
-            elif flag_type == FlagType.STRING:
-                request = evaluation_pb2.ResolveStringRequest(
-                    flag_key=flag_key, context=context
-                )
-                response = self.stub.ResolveString(request, **call_args)
-                value = response.value
-            elif flag_type == FlagType.OBJECT:
-                request = evaluation_pb2.ResolveObjectRequest(
-                    flag_key=flag_key, context=context
-                )
-                response = self.stub.ResolveObject(request, **call_args)
-                # DISABLED responses omit the value field entirely; fall back to default_value
-                value = MessageToDict(response, preserving_proto_field_name=True).get(
-                    "value", default_value
-                )
-            elif flag_type == FlagType.FLOAT:
-                request = evaluation_pb2.ResolveFloatRequest(
-                    flag_key=flag_key, context=context
-                )
-                response = self.stub.ResolveFloat(request, **call_args)
-                value = response.value
-            elif flag_type == FlagType.INTEGER:
-                request = evaluation_pb2.ResolveIntRequest(
-                    flag_key=flag_key, context=context
-                )
-                response = self.stub.ResolveInt(request, **call_args)
-                value = response.value
-            else:
-                raise ValueError(f"Unknown flag type: {flag_type}")
+        return call_args
 
-        except grpc.RpcError as e:
-            code = e.code()
-            message = f"received grpc status code {code}"
-            logger.debug(message)
-
-            if code.name in self.config.fatal_status_codes:
-                raise ProviderFatalError(message) from e
-            elif code == grpc.StatusCode.NOT_FOUND:
-                raise FlagNotFoundError(message) from e
-            elif code == grpc.StatusCode.INVALID_ARGUMENT:
-                raise TypeMismatchError(message) from e
-            elif code == grpc.StatusCode.DATA_LOSS:
-                raise ParseError(message) from e
-            raise GeneralError(message) from e
+    def _map_rpc_error(self, e: grpc.RpcError) -> OpenFeatureError:
+        code = e.code()
+        message = f"received grpc status code {code}"
+        logger.debug(message)
+
+        if code.name in self.config.fatal_status_codes:
+            return ProviderFatalError(message)
+        elif code == grpc.StatusCode.NOT_FOUND:
+            return FlagNotFoundError(message)
+        elif code == grpc.StatusCode.INVALID_ARGUMENT:
+            return TypeMismatchError(message)
+        elif code == grpc.StatusCode.DATA_LOSS:
+            return ParseError(message)
+        return GeneralError(message)
+
+    def _result(
+        self,
+        flag_key: str,
+        flag_type: FlagType,
+        response: typing.Any,
+        default_value: FlagValueType,
+        context_key: bytes | None = None,
+    ) -> FlagResolutionDetails[FlagValueType]:
+        value: FlagValueType
+        if flag_type == FlagType.OBJECT:
+            # DISABLED responses omit the value field entirely; fall back to default_value
+            value = MessageToDict(response, preserving_proto_field_name=True).get(
+                "value", default_value
+            )
+        else:
+            value = response.value
 
         # When no default variant is configured, the server returns an empty/zero proto
         # value with reason=DEFAULT. For DISABLED flags the server omits the variant too.
@@ -480,24 +878,15 @@ class GrpcResolver:
             variant=response.variant or None,
         )
 
-        if response.reason == Reason.STATIC and self.cache is not None:
-            self.cache.insert(flag_key, result)
+        if self.cache is not None:
+            if response.reason == Reason.STATIC:
+                self.cache.put(flag_key, result)
+            elif response.reason == Reason.TARGETING_MATCH and context_key is not None:
+                self.cache.put(flag_key, result, context_key, self.targeting_cache_ttl)
 
         return result
 
-    def _convert_context(self, evaluation_context: EvaluationContext | None) -> Struct:
-        s = Struct()
-        if evaluation_context:
-            try:
-                s["targetingKey"] = evaluation_context.targeting_key
-                s.update(
-                    typing.cast(
-                        "typing.Mapping[str, typing.Any]", evaluation_context.attributes
-                    )
-                )
-            except ValueError as exc:
-                message = (
-                    "could not serialize evaluation context to google.protobuf.Struct"
-                )
-                raise InvalidContextError(message) from exc
-        return s
+    def _convert_context(
+        self, evaluation_context: EvaluationContext | None
+    ) -> ConvertedContext:
+        return self.contexts.convert(evaluation_context)
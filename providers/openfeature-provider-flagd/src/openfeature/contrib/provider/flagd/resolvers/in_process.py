@@ -1,15 +1,22 @@
-import json
+import asyncio
 import typing
 
 from openfeature.contrib.tools.flagd.core import FlagdCore
+from openfeature.contrib.tools.flagd.core.metrics import SyncMetrics
+from openfeature.contrib.tools.flagd.core.model import FlagSnapshot
 from openfeature.evaluation_context import EvaluationContext
 from openfeature.event import ProviderEventDetails
 from openfeature.flag_evaluation import FlagResolutionDetails, FlagValueType
 
 from ..config import Config
+from .backoff import BackoffState
+from .cache import CacheStats
 from .process.connector import FlagStateConnector
+from .process.connector.aio_grpc_watcher import AioGrpcWatcher
+from .process.connector.failover_grpc_watcher import FailoverGrpcWatcher
 from .process.connector.file_watcher import FileWatcher
 from .process.connector.grpc_watcher import GrpcWatcher
+from .process.connector.sync_hub import SharedSyncConnector
 
 T = typing.TypeVar("T")
 
@@ -27,9 +34,38 @@ class _FlagStoreAdapter:
         self.evaluator = evaluator
         self.emit_provider_configuration_changed = emit_provider_configuration_changed
 
-    def update(self, flags_data: dict) -> None:
-        json_str = json.dumps(flags_data)
-        changed_keys = self.evaluator.set_flags_and_get_changed_keys(json_str)
+    def record_skipped_reload(self) -> None:
+        self.evaluator.record_skipped_reload()
+
+    def update(
+        self,
+        flags_data: dict,
+        payload_bytes: int | None = None,
+        decode_seconds: float = 0.0,
+    ) -> None:
+        # connectors hand over freshly parsed data, which the evaluator takes
+        # ownership of, so it is passed through without re-serializing
+        self._apply(flags_data, payload_bytes, decode_seconds)
+
+    def swap(
+        self,
+        snapshot: FlagSnapshot,
+        payload_bytes: int | None = None,
+        decode_seconds: float = 0.0,
+    ) -> None:
+        self._apply(snapshot, payload_bytes, decode_seconds)
+
+    def _apply(
+        self,
+        flag_configuration: dict | FlagSnapshot,
+        payload_bytes: int | None,
+        decode_seconds: float,
+    ) -> None:
+        changed_keys = self.evaluator.set_flags_and_get_changed_keys(
+            flag_configuration,
+            payload_bytes=payload_bytes,
+            decode_seconds=decode_seconds,
+        )
         metadata = self.evaluator.get_flag_set_metadata()
         self.emit_provider_configuration_changed(
             ProviderEventDetails(flags_changed=changed_keys, metadata=dict(metadata))
@@ -48,37 +84,100 @@ class InProcessResolver:
         ],
     ):
         self.config = config
-        self.evaluator = FlagdCore()
+        self.evaluator = FlagdCore(metrics_sink=config.metrics_sink)
 
         # Adapter lets connectors push flag data to FlagdCore via the
         # same .update(dict) interface they used with the old FlagStore.
-        flag_store_adapter = _FlagStoreAdapter(
+        self.flag_store_adapter = _FlagStoreAdapter(
             self.evaluator, emit_provider_configuration_changed
         )
+        self.emit_provider_ready = emit_provider_ready
+        self.emit_provider_error = emit_provider_error
+        self.emit_provider_stale = emit_provider_stale
 
-        self.connector: FlagStateConnector = (
-            FileWatcher(
+        self.connector: FlagStateConnector
+        if self.config.offline_flag_source_path:
+            self.connector = FileWatcher(
                 self.config,
-                flag_store_adapter,  # type: ignore[arg-type]
+                self.flag_store_adapter,  # type: ignore[arg-type]
                 emit_provider_ready,
                 emit_provider_error,
             )
-            if self.config.offline_flag_source_path
-            else GrpcWatcher(
+        elif self.config.sync_targets:
+            self.connector = FailoverGrpcWatcher(
                 self.config,
-                flag_store_adapter,  # type: ignore[arg-type]
+                self.flag_store_adapter,  # type: ignore[arg-type]
                 emit_provider_ready,
                 emit_provider_error,
                 emit_provider_stale,
             )
-        )
+        elif self.config.shared_sync:
+            self.connector = SharedSyncConnector(
+                self.config,
+                self.flag_store_adapter,  # type: ignore[arg-type]
+                emit_provider_ready,
+                emit_provider_error,
+                emit_provider_stale,
+            )
+        else:
+            self.connector = GrpcWatcher(
+                self.config,
+                self.flag_store_adapter,  # type: ignore[arg-type]
+                emit_provider_ready,
+                emit_provider_error,
+                emit_provider_stale,
+            )
+        self._initialized_async = False
 
     def initialize(self, evaluation_context: EvaluationContext) -> None:
+        # the SDK initializes registered providers, which already happened
+        # when the application awaited initialize_async
+        if self._initialized_async:
+            return
         self.connector.initialize(evaluation_context)
 
     def shutdown(self) -> None:
+        self._initialized_async = False
         self.connector.shutdown()
 
+    async def initialize_async(self, evaluation_context: EvaluationContext) -> None:
+        if type(self.connector) is GrpcWatcher:
+            # the asyncio watcher binds its channel to the running loop, so it
+            # replaces the synchronous one here rather than in the constructor
+            self.connector.channel.close()
+            self.connector = AioGrpcWatcher(
+                self.config,
+                self.flag_store_adapter,  # type: ignore[arg-type]
+                self.emit_provider_ready,
+                self.emit_provider_error,
+                self.emit_provider_stale,
+            )
+        if isinstance(self.connector, AioGrpcWatcher):
+            await self.connector.initialize_async(evaluation_context)
+        else:
+            await asyncio.to_thread(self.connector.initialize, evaluation_context)
+        self._initialized_async = True
+
+    async def shutdown_async(self) -> None:
+        self._initialized_async = False
+        if isinstance(self.connector, AioGrpcWatcher):
+            await self.connector.shutdown_async()
+        else:
+            self.connector.shutdown()
+
+    def get_sync_metrics(self) -> SyncMetrics | None:
+        return self.evaluator.sync_metrics
+
+    def get_reconnect_backoff(self) -> BackoffState | None:
+        if isinstance(self.connector, GrpcWatcher):
+            return self.connector.backoff.state()
+        if isinstance(self.connector, SharedSyncConnector) and self.connector.stream:
+            return self.connector.stream.watcher.backoff.state()
+        return None
+
+    def get_cache_stats(self) -> CacheStats | None:
+        return None
+
     def resolve_boolean_details(
         self,
         key: str,
@@ -131,3 +230,57 @@ class InProcessResolver:
         return self.evaluator.resolve_object_value(
             key, default_value, evaluation_context
         )
+
+    async def resolve_boolean_details_async(
+        self,
+        key: str,
+        default_value: bool,
+        evaluation_context: EvaluationContext | None = None,
+    ) -> FlagResolutionDetails[bool]:
+        # evaluation is local and never blocks, so it runs on the loop
+        return self.evaluator.resolve_boolean_value(
+            key, default_value, evaluation_context
+        )
+
+    async def resolve_string_details_async(
+        self,
+        key: str,
+        default_value: str,
+        evaluation_context: EvaluationContext | None = None,
+    ) -> FlagResolutionDetails[str]:
+        return self.evaluator.resolve_string_value(
+            key, default_value, evaluation_context
+        )
+
+    async def resolve_float_details_async(
+        self,
+        key: str,
+        default_value: float,
+        evaluation_context: EvaluationContext | None = None,
+    ) -> FlagResolutionDetails[float]:
+        return self.evaluator.resolve_float_value(
+            key, default_value, evaluation_context
+        )
+
+    async def resolve_integer_details_async(
+        self,
+        key: str,
+        default_value: int,
+        evaluation_context: EvaluationContext | None = None,
+    ) -> FlagResolutionDetails[int]:
+        return self.evaluator.resolve_integer_value(
+            key, default_value, evaluation_context
+        )
+
+    async def resolve_object_details_async(
+        self,
+        key: str,
+        default_value: typing.Sequence[FlagValueType]
+        | typing.Mapping[str, FlagValueType],
+        evaluation_context: EvaluationContext | None = None,
+    ) -> FlagResolutionDetails[
+        typing.Sequence[FlagValueType] | typing.Mapping[str, FlagValueType]
+    ]:
+        return self.evaluator.resolve_object_value(
+            key, default_value, evaluation_context
+        )
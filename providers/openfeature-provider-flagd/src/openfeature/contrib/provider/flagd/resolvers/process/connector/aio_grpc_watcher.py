@@ -0,0 +1,220 @@
+import asyncio
+import contextlib
+import logging
+import typing
+
+import grpc
+from grpc import StatusCode
+
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.event import ProviderEventDetails
+from openfeature.exception import ProviderFatalError, ProviderNotReadyError
+from openfeature.schemas.protobuf.flagd.sync.v1 import sync_pb2
+
+from ....config import Config
+from ..flags import FlagStore
+from .grpc_watcher import GrpcWatcher
+
+logger = logging.getLogger("openfeature.contrib")
+
+
+class AioGrpcWatcher(GrpcWatcher):
+    """GrpcWatcher running the sync stream on the asyncio event loop.
+
+    The stream is consumed through a ``grpc.aio`` channel, reconnect delays
+    and the error grace period use asyncio timers. Payloads are parsed and
+    applied in the loop's default executor so large configurations do not
+    block the loop, no threads of its own are started. The channel is bound
+    to the running loop, create and start the watcher from within it through
+    `initialize_async`.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        flag_store: FlagStore,
+        emit_provider_ready: typing.Callable[[ProviderEventDetails, dict], None],
+        emit_provider_error: typing.Callable[[ProviderEventDetails], None],
+        emit_provider_stale: typing.Callable[[ProviderEventDetails], None],
+    ):
+        super().__init__(
+            config,
+            flag_store,
+            emit_provider_ready,
+            emit_provider_error,
+            emit_provider_stale,
+        )
+        self.active = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._ready = asyncio.Event()
+        self._stop = asyncio.Event()
+        self._error_handle: asyncio.TimerHandle | None = None
+        self._monitor_task: asyncio.Task | None = None
+        self._listen_task: asyncio.Task | None = None
+        self._close_task: asyncio.Task | None = None
+
+    @property
+    def aio_channel(self) -> grpc.aio.Channel:
+        return typing.cast(grpc.aio.Channel, self.channel)
+
+    @property
+    def aio_stub(self) -> typing.Any:
+        # the generated stub is typed for synchronous channels
+        return self.stub
+
+    def _generate_channel(self, config: Config) -> grpc.aio.Channel:  # type: ignore[override]
+        target = f"{config.host}:{config.port}"
+        options = self._channel_options(config)
+        credentials = self._channel_credentials(config)
+        if credentials is not None:
+            return grpc.aio.secure_channel(
+                target, credentials, options=options, compression=config.compression
+            )
+        return grpc.aio.insecure_channel(
+            target, options=options, compression=config.compression
+        )
+
+    def initialize(self, context: EvaluationContext) -> None:
+        # started through initialize_async, the SDK still calls this when the
+        # provider is registered
+        pass
+
+    async def initialize_async(self, context: EvaluationContext) -> None:
+        await self.connect_async()
+
+    async def connect_async(self) -> None:
+        loop = self._loop = asyncio.get_running_loop()
+        self.active = True
+        self._ready.clear()
+        self._stop.clear()
+        self._monitor_task = loop.create_task(self._monitor())
+
+        if await loop.run_in_executor(None, self._load_sync_cache):
+            return
+
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._ready.wait(), self.deadline)
+        logger.debug("Finished gRPC state initialization")
+
+        if self._is_fatal:
+            raise ProviderFatalError("Fatal gRPC status code received")
+
+        if not self.connected:
+            raise ProviderNotReadyError(
+                "Blocking init finished before data synced. Consider increasing startup deadline to avoid inconsistent evaluations."
+            )
+
+    async def _monitor(self) -> None:
+        channel = self.aio_channel
+        state = channel.get_state(try_to_connect=True)
+        while self.active:
+            self._on_state_change(state)
+            await channel.wait_for_state_change(state)
+            state = channel.get_state(try_to_connect=True)
+
+    def _on_state_change(self, new_state: grpc.ChannelConnectivity) -> None:
+        logger.debug(f"gRPC state change: {new_state}")
+        loop = self._loop
+        if self._is_fatal or loop is None:
+            return
+        if new_state in (
+            grpc.ChannelConnectivity.READY,
+            grpc.ChannelConnectivity.IDLE,
+        ):
+            if self._listen_task is None or self._listen_task.done():
+                self._listen_task = loop.create_task(self.listen_async())
+            if self._error_handle is not None:
+                logger.debug("gRPC error timer cancelled")
+                self._error_handle.cancel()
+                self._error_handle = None
+
+        elif new_state == grpc.ChannelConnectivity.TRANSIENT_FAILURE:
+            self.emit_provider_stale(
+                ProviderEventDetails(message="gRPC sync disconnected, reconnecting")
+            )
+            if self._error_handle is None:
+                self._error_handle = loop.call_later(
+                    self.retry_grace_period, self.emit_error
+                )
+            self.connected = False
+
+    async def _fetch_metadata_async(self) -> sync_pb2.GetMetadataResponse | None:
+        if self.config.sync_metadata_disabled:
+            return None
+
+        try:
+            response: sync_pb2.GetMetadataResponse = await self.aio_stub.GetMetadata(
+                sync_pb2.GetMetadataRequest(), wait_for_ready=True
+            )
+            return response
+        except grpc.RpcError as e:
+            if e.code() == StatusCode.UNIMPLEMENTED:
+                logger.debug(f"Error getting sync metadata: {e}")
+                return None
+            raise e
+
+    async def _wait_before_reconnect_async(self) -> None:
+        delay = self.backoff.next_delay()
+        logger.debug(f"Reconnecting gRPC sync stream in {delay:.3f}s")
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._stop.wait(), delay)
+
+    async def listen_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        call_args = self.generate_grpc_call_args()
+        request_args = self._create_request_args()
+
+        while self.active:
+            try:
+                context_values_response = await self._fetch_metadata_async()
+                request = sync_pb2.SyncFlagsRequest(**request_args)
+                logger.debug("Setting up gRPC sync flags connection")
+                async for flag_rsp in self.aio_stub.SyncFlags(request, **call_args):
+                    self.backoff.reset()
+                    await loop.run_in_executor(
+                        None,
+                        self._apply,
+                        flag_rsp.flag_configuration,
+                        self._context_values(flag_rsp, context_values_response),
+                    )
+                    if self.connected:
+                        self._ready.set()
+                    if not self.active:
+                        logger.debug("Terminating gRPC sync task")
+                        return
+            except grpc.RpcError as e:
+                if self._handle_rpc_error(e):
+                    self._ready.set()
+                    return
+            if self.active:
+                await self._wait_before_reconnect_async()
+
+    def _stop_tasks(self) -> None:
+        self.active = False
+        self._stop.set()
+        self._ready.set()
+        if self._error_handle is not None:
+            self._error_handle.cancel()
+        for task in (self._monitor_task, self._listen_task):
+            if task is not None:
+                task.cancel()
+
+    async def shutdown_async(self) -> None:
+        if self._loop is None:
+            return
+        self._stop_tasks()
+        await self.aio_channel.close()
+
+    def shutdown(self) -> None:
+        # synchronous callers such as api.shutdown(), possibly from another
+        # thread; the channel is closed on its loop
+        self.active = False
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+
+        def close() -> None:
+            self._stop_tasks()
+            self._close_task = loop.create_task(self.aio_channel.close())
+
+        loop.call_soon_threadsafe(close)
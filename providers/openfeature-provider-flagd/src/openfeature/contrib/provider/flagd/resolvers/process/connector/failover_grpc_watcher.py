@@ -0,0 +1,152 @@
+import dataclasses
+import logging
+import threading
+import time
+import typing
+
+import grpc
+
+from openfeature.event import ProviderEventDetails
+from openfeature.schemas.protobuf.flagd.sync.v1 import sync_pb2, sync_pb2_grpc
+
+from ....config import Config
+from ..flags import FlagStore
+from .grpc_watcher import GrpcWatcher
+
+logger = logging.getLogger("openfeature.contrib")
+
+# weight of the latest connect latency in the moving average
+LATENCY_SMOOTHING = 0.5
+
+
+@dataclasses.dataclass
+class SyncTarget:
+    """Health of one sync endpoint as observed by the watcher."""
+
+    target: str
+    # moving average of the time the channel took to become ready
+    connect_latency: float | None = None
+    failed_at: float | None = None
+
+
+class FailoverGrpcWatcher(GrpcWatcher):
+    """GrpcWatcher failing over between several flagd sync targets.
+
+    Streams are opened against the healthiest target: targets that failed
+    within the last ``retry_backoff_max_ms`` rank last, then the lowest recent
+    connect latency wins and ties keep the configured order. When the stream
+    breaks the watcher switches to the next target right away and only backs
+    off once every target failed in a row. A stream that ends cleanly or hits
+    ``stream_deadline_ms`` is reopened against the same target. RPCs fail fast rather than waiting
+    for an unreachable target to come back.
+
+    The digest of the last applied payload survives a failover, so a target
+    serving the same flag configuration does not cause a reload.
+    """
+
+    wait_for_ready = False
+
+    def __init__(
+        self,
+        config: Config,
+        flag_store: FlagStore,
+        emit_provider_ready: typing.Callable[[ProviderEventDetails, dict], None],
+        emit_provider_error: typing.Callable[[ProviderEventDetails], None],
+        emit_provider_stale: typing.Callable[[ProviderEventDetails], None],
+    ):
+        self.targets = [
+            SyncTarget(target)
+            for target in config.sync_targets or [f"{config.host}:{config.port}"]
+        ]
+        self.current = self.targets[0]
+        self._connect_started: float | None = time.monotonic()
+        self._failures_in_row = 0
+        self._channel_lock = threading.Lock()
+        super().__init__(
+            config,
+            flag_store,
+            emit_provider_ready,
+            emit_provider_error,
+            emit_provider_stale,
+        )
+
+    def _generate_channel(self, config: Config) -> grpc.Channel:
+        return self._channel_for(self.current.target, config)
+
+    def _cache_target(self, config: Config) -> str:
+        return ",".join(target.target for target in self.targets)
+
+    def ranked_targets(self) -> list[SyncTarget]:
+        now = time.monotonic()
+
+        def rank(indexed: tuple[int, SyncTarget]) -> tuple[bool, float, int]:
+            index, target = indexed
+            recently_failed = (
+                target.failed_at is not None
+                and now - target.failed_at < self.retry_backoff_max_seconds
+            )
+            latency = (
+                target.connect_latency
+                if target.connect_latency is not None
+                else float("inf")
+            )
+            return recently_failed, latency, index
+
+        return [target for _, target in sorted(enumerate(self.targets), key=rank)]
+
+    def _state_change_callback(self, new_state: grpc.ChannelConnectivity) -> None:
+        if new_state == grpc.ChannelConnectivity.READY:
+            started, self._connect_started = self._connect_started, None
+            if started is not None:
+                latency = time.monotonic() - started
+                previous = self.current.connect_latency
+                self.current.connect_latency = (
+                    latency
+                    if previous is None
+                    else LATENCY_SMOOTHING * latency
+                    + (1 - LATENCY_SMOOTHING) * previous
+                )
+        super()._state_change_callback(new_state)
+
+    def _handle_flag_response(
+        self,
+        flag_rsp: sync_pb2.SyncFlagsResponse,
+        context_values_response: sync_pb2.GetMetadataResponse | None,
+    ) -> bool:
+        self._failures_in_row = 0
+        self.current.failed_at = None
+        return super()._handle_flag_response(flag_rsp, context_values_response)
+
+    def _wait_before_reconnect(self, stream_expired: bool = False) -> None:
+        if stream_expired:
+            # the target is healthy, reopen the stream against it
+            super()._wait_before_reconnect(stream_expired)
+            return
+        self.current.failed_at = time.monotonic()
+        self._failures_in_row += 1
+        if self._failures_in_row >= len(self.targets):
+            # every target failed in a row, back off before the next round
+            self._failures_in_row = 0
+            super()._wait_before_reconnect()
+        if self.active:
+            self._switch_to(self.ranked_targets()[0])
+
+    def _switch_to(self, target: SyncTarget) -> None:
+        with self._channel_lock:
+            if target is self.current or not self.active:
+                return
+            logger.info(
+                f"Failing over gRPC sync from {self.current.target} to {target.target}"
+            )
+            previous = self.channel
+            previous.unsubscribe(self._state_change_callback)
+            self.current = target
+            self._connect_started = time.monotonic()
+            self.channel = self._generate_channel(self.config)
+            self.stub = sync_pb2_grpc.FlagSyncServiceStub(self.channel)
+            self.channel.subscribe(self._state_change_callback, try_to_connect=True)
+        previous.close()
+
+    def _close_channel(self) -> None:
+        with self._channel_lock:
+            self.channel.close()
@@ -0,0 +1,204 @@
+"""Change notifications for watched flag files based on Linux inotify.
+
+The parent directories of the watched files are watched rather than the files
+themselves, so replacing a file through an atomic rename and the symlink swap
+Kubernetes performs when updating a mounted ConfigMap (``..data`` is renamed
+to point at a new timestamped directory) are noticed as well. Watched
+directories report changes to any of their entries. A newly created regular
+file is only reported once it is closed after writing, never half-written.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import stat
+import struct
+import sys
+import threading
+import time
+import typing
+
+logger = logging.getLogger("openfeature.contrib")
+
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_IGNORED = 0x00008000
+
+_WATCH_MASK = (
+    IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+def _load_libc() -> typing.Any:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        ]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class InotifyFileEvents:
+    """Blocks until one of the watched files may have changed."""
+
+    def __init__(self, libc: typing.Any, fd: int, paths: typing.Iterable[str]):
+        self._libc = libc
+        self._fd = fd
+        self._wake_read, self._wake_write = os.pipe()
+        self._paths = [os.path.abspath(path) for path in paths]
+        self._names = {os.path.basename(path) for path in self._paths}
+        self._directories = {path for path in self._paths if os.path.isdir(path)}
+        self._watches: dict[int, str] = {}
+        # watched directories that are sources themselves, not just parents
+        self._source_directories: set[str] = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._refresh_watches()
+
+    @classmethod
+    def create(cls, paths: typing.Iterable[str]) -> "InotifyFileEvents | None":
+        """Start watching ``paths``, returns None if inotify is unavailable."""
+        libc = _load_libc()
+        if libc is None:
+            return None
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            logger.debug(f"inotify unavailable: {os.strerror(ctypes.get_errno())}")
+            return None
+        events = cls(libc, fd, paths)
+        if not events.watching:
+            events.close()
+            return None
+        return events
+
+    @property
+    def watching(self) -> bool:
+        return bool(self._watches)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until a relevant change happened or ``timeout`` expired.
+
+        Returns False once woken up through `wake`.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return True
+            readable, _, _ = select.select(
+                [self._fd, self._wake_read], [], [], remaining
+            )
+            if self._wake_read in readable:
+                return False
+            if not readable:
+                return True
+            relevant = self._read_events()
+            self._refresh_watches()
+            if relevant or not self.watching:
+                return True
+
+    def wake(self) -> None:
+        """Release a thread blocked in `wait`, used on shutdown."""
+        with self._lock:
+            if not self._closed:
+                os.write(self._wake_write, b"\0")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for fd in (self._fd, self._wake_read, self._wake_write):
+                os.close(fd)
+
+    def _read_events(self) -> bool:
+        try:
+            buffer = os.read(self._fd, _READ_SIZE)
+        except BlockingIOError:
+            return False
+
+        relevant = False
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(buffer[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+            if mask == IN_CREATE and self._is_regular_file(wd, name):
+                # reported again by IN_CLOSE_WRITE once it is written
+                continue
+            # ConfigMap updates swap the `..data` symlink next to the file
+            if (
+                not name
+                or name in self._names
+                or name.startswith("..")
+                or self._watches.get(wd) in self._source_directories
+            ):
+                relevant = True
+        return relevant
+
+    def _is_regular_file(self, wd: int, name: str) -> bool:
+        directory = self._watches.get(wd)
+        if directory is None or not name:
+            return False
+        try:
+            return stat.S_ISREG(os.lstat(os.path.join(directory, name)).st_mode)
+        except OSError:
+            return False
+
+    def _refresh_watches(self) -> None:
+        # a symlinked file may resolve into another directory after a swap
+        directories = set()
+        source_directories = set()
+        for path in self._paths:
+            if path in self._directories:
+                source_directories.add(path)
+                source_directories.add(os.path.realpath(path))
+            else:
+                directories.add(os.path.dirname(path))
+                directories.add(os.path.dirname(os.path.realpath(path)))
+        self._source_directories = source_directories
+        directories |= source_directories
+
+        for directory in directories - set(self._watches.values()):
+            wd = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(directory), _WATCH_MASK
+            )
+            if wd < 0:
+                logger.debug(
+                    f"Could not watch {directory}: {os.strerror(ctypes.get_errno())}"
+                )
+                continue
+            self._watches[wd] = directory
+
+        for wd, directory in list(self._watches.items()):
+            if directory not in directories:
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._watches[wd]
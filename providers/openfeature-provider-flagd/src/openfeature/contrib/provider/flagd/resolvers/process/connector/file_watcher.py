@@ -1,5 +1,9 @@
+import contextlib
+import dataclasses
+import hashlib
 import json
 import logging
+import mmap
 import os
 import threading
 import time
@@ -11,13 +15,39 @@ from openfeature.contrib.provider.flagd.config import Config
 from openfeature.contrib.provider.flagd.resolvers.process.connector import (
     FlagStateConnector,
 )
+from openfeature.contrib.provider.flagd.resolvers.process.connector.file_events import (
+    InotifyFileEvents,
+)
 from openfeature.contrib.provider.flagd.resolvers.process.flags import FlagStore
+from openfeature.contrib.tools.flagd.core.model import FlagSnapshot
 from openfeature.evaluation_context import EvaluationContext
 from openfeature.event import ProviderEventDetails
 from openfeature.exception import ErrorCode, ParseError, ProviderNotReadyError
 
 logger = logging.getLogger("openfeature.contrib")
 
+FLAG_FILE_EXTENSIONS = (".json", ".yaml", ".yml")
+
+
+@contextlib.contextmanager
+def _mapped(file: typing.BinaryIO) -> typing.Iterator[bytes | mmap.mmap]:
+    # empty files cannot be mapped
+    if os.fstat(file.fileno()).st_size == 0:
+        yield b""
+        return
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        yield mapped
+
+
+@dataclasses.dataclass(frozen=True)
+class _FileSource:
+    path: str
+    last_modified: float
+    digest: bytes
+    snapshot: FlagSnapshot
+    size: int
+    decode_seconds: float
+
 
 class FileWatcher(FlagStateConnector):
     def __init__(
@@ -27,23 +57,39 @@ class FileWatcher(FlagStateConnector):
         emit_provider_ready: typing.Callable[[ProviderEventDetails, dict], None],
         emit_provider_error: typing.Callable[[ProviderEventDetails], None],
     ):
-        if config.offline_flag_source_path is None:
+        if not config.offline_flag_source_path:
             raise ValueError(
                 f"`config.offline_flag_source_path` parameter invalid: {config.offline_flag_source_path}"
             )
-        else:
-            self.file_path = config.offline_flag_source_path
+        # files and directories, later sources take precedence on conflicts
+        self.source_paths: list[str] = (
+            [config.offline_flag_source_path]
+            if isinstance(config.offline_flag_source_path, str)
+            else list(config.offline_flag_source_path)
+        )
 
         self.emit_provider_ready = emit_provider_ready
         self.emit_provider_error = emit_provider_error
         self.deadline_seconds = config.deadline_ms * 0.001
+        self.poll_interval_seconds = config.offline_poll_interval_ms * 0.001
 
-        self.last_modified = 0.0
         self.flag_store = flag_store
         self.should_emit_ready_on_success = False
+        self._sources: dict[str, _FileSource] = {}
+        self._load_lock = threading.Lock()
+        self._shutdown_event = threading.Event()
+        self._file_events: InotifyFileEvents | None = None
 
     def initialize(self, evaluation_context: EvaluationContext) -> None:
         self.active = True
+        self.should_emit_ready_on_success = True
+        self._shutdown_event.clear()
+        # watch before the initial load so no change in between is missed
+        self._file_events = InotifyFileEvents.create(self.source_paths)
+        if self._file_events is None:
+            logger.debug(
+                f"Polling {self.source_paths} every {self.poll_interval_seconds}s"
+            )
         self.thread = threading.Thread(
             target=self.refresh_file, daemon=True, name="FlagdFileWatcherWorkerThread"
         )
@@ -51,25 +97,39 @@ class FileWatcher(FlagStateConnector):
 
         # Let this throw exceptions so that provider status is set correctly
         try:
-            self.should_emit_ready_on_success = True
             self._load_data()
         except Exception as err:
             raise ProviderNotReadyError from err
 
     def shutdown(self) -> None:
         self.active = False
+        self._shutdown_event.set()
+        if self._file_events is not None:
+            self._file_events.wake()
 
     def refresh_file(self) -> None:
-        while self.active:
-            time.sleep(self.deadline_seconds)
-            logger.debug("checking for new flag store contents from file")
-            self.safe_load_data()
+        file_events = self._file_events
+        try:
+            while self._wait_for_change(file_events):
+                logger.debug("checking for new flag store contents from file")
+                self.safe_load_data()
+        finally:
+            if file_events is not None:
+                file_events.close()
+
+    def _wait_for_change(self, file_events: InotifyFileEvents | None) -> bool:
+        """Block until the file may have changed, returns False on shutdown."""
+        # while the file cannot be loaded it is retried like a failed sync
+        timeout = self.deadline_seconds if self.should_emit_ready_on_success else None
+        if file_events is not None and file_events.watching:
+            file_events.wait(timeout)
+        else:
+            self._shutdown_event.wait(timeout or self.poll_interval_seconds)
+        return self.active
 
     def safe_load_data(self) -> None:
         try:
-            last_modified = os.path.getmtime(self.file_path)
-            if last_modified > self.last_modified:
-                self._load_data(last_modified)
+            self._load_data()
         except FileNotFoundError:
             self.handle_error("Provided file path not valid")
         except json.JSONDecodeError:
@@ -88,25 +148,97 @@ class FileWatcher(FlagStateConnector):
         except Exception:
             self.handle_error("Could not read flags from file")
 
-    def _load_data(self, modified_time: float | None = None) -> None:
-        with open(self.file_path) as file:
-            if self.file_path.endswith(".yaml"):
-                data = yaml.safe_load(file)
-            else:
-                data = json.load(file)
-
-            self.flag_store.update(data)
-
-            if self.should_emit_ready_on_success:
-                self.emit_provider_ready(
-                    ProviderEventDetails(
-                        message="Reloading file contents recovered from error state"
-                    ),
-                    {},
+    def _load_data(self) -> None:
+        with self._load_lock:
+            # sources are only committed once all of them loaded, so a file
+            # that fails to parse is retried with the ones changed meanwhile
+            previous = self._sources
+            sources = {
+                path: self._load_file(path, previous.get(path))
+                for path in self._discover()
+            }
+            loaded = [
+                source
+                for path, source in sources.items()
+                if path not in previous
+                or source.snapshot is not previous[path].snapshot
+            ]
+            self._sources = sources
+            if loaded or list(sources) != list(previous):
+                started = time.perf_counter()
+                snapshot = self._merge()
+                self.flag_store.swap(
+                    snapshot,
+                    payload_bytes=sum(source.size for source in loaded),
+                    decode_seconds=sum(source.decode_seconds for source in loaded)
+                    + time.perf_counter()
+                    - started,
                 )
-                self.should_emit_ready_on_success = False
 
-        self.last_modified = modified_time or os.path.getmtime(self.file_path)
+        if self.should_emit_ready_on_success:
+            self.emit_provider_ready(
+                ProviderEventDetails(
+                    message="Reloading file contents recovered from error state"
+                ),
+                {},
+            )
+            self.should_emit_ready_on_success = False
+
+    def _discover(self) -> list[str]:
+        paths = []
+        for source_path in self.source_paths:
+            if not os.path.isdir(source_path):
+                paths.append(source_path)
+                continue
+            # hidden entries include the `..data` links of ConfigMap volumes
+            paths.extend(
+                os.path.join(source_path, name)
+                for name in sorted(os.listdir(source_path))
+                if not name.startswith(".")
+                and name.endswith(FLAG_FILE_EXTENSIONS)
+                and os.path.isfile(os.path.join(source_path, name))
+            )
+        return paths
+
+    def _load_file(self, path: str, previous: _FileSource | None) -> _FileSource:
+        last_modified = os.path.getmtime(path)
+        # replacing the file may bring back an older modification time
+        if previous is not None and last_modified == previous.last_modified:
+            return previous
+
+        with open(path, "rb") as file, _mapped(file) as content:
+            digest = hashlib.blake2b(content, digest_size=16).digest()
+            if previous is not None and digest == previous.digest:
+                self.flag_store.record_skipped_reload()
+                logger.debug(f"Skipping unchanged flag file {path} - {digest.hex()}")
+                return dataclasses.replace(previous, last_modified=last_modified)
+            size = len(content)
+            started = time.perf_counter()
+            # decoded straight from the mapping, without copying it to bytes
+            text = str(content, "utf-8")
+        if path.endswith((".yaml", ".yml")):
+            data = yaml.safe_load(text)
+        else:
+            data = json.loads(text)
+
+        logger.debug(f"Loading flag file {path} - {digest.hex()}")
+        snapshot = FlagStore.parse(data)
+        return _FileSource(
+            path,
+            last_modified,
+            digest,
+            snapshot,
+            size,
+            time.perf_counter() - started,
+        )
+
+    def _merge(self) -> FlagSnapshot:
+        flags: dict = {}
+        metadata: dict = {}
+        for source in self._sources.values():
+            flags.update(source.snapshot.flags)
+            metadata.update(source.snapshot.metadata)
+        return FlagSnapshot(flags=flags, metadata=metadata)
 
     def handle_error(self, error_message: str) -> None:
         logger.exception(error_message)
@@ -1,3 +1,4 @@
+import hashlib
 import json
 import logging
 import threading
@@ -21,15 +22,20 @@ from openfeature.schemas.protobuf.flagd.sync.v1 import (
     sync_pb2_grpc,
 )
 
-from ....config import Config
+from ....config import Config, grpc_tuning_options
+from ...backoff import ReconnectBackoff
 from ...types import GrpcMultiCallableArgs
 from ..connector import FlagStateConnector
 from ..flags import FlagStore
+from .sync_cache import SyncCache
 
 logger = logging.getLogger("openfeature.contrib")
 
 
 class GrpcWatcher(FlagStateConnector):
+    # RPCs wait for the channel to connect instead of failing fast
+    wait_for_ready = True
+
     def __init__(
         self,
         config: Config,
@@ -44,6 +50,9 @@ class GrpcWatcher(FlagStateConnector):
         self.channel = self._generate_channel(config)
         self.stub = sync_pb2_grpc.FlagSyncServiceStub(self.channel)
         self.retry_backoff_max_seconds = config.retry_backoff_max_ms * 0.001
+        self.backoff = ReconnectBackoff(
+            config.retry_backoff_ms * 0.001, self.retry_backoff_max_seconds
+        )
         self.retry_grace_period = config.retry_grace_period
         self.streamline_deadline_seconds = config.stream_deadline_ms * 0.001
         self.deadline = config.deadline_ms * 0.001
@@ -56,11 +65,27 @@ class GrpcWatcher(FlagStateConnector):
         self.connected = False
         self._is_fatal = False
         self._shutdown_event = threading.Event()
+        # ends the blocking connect: first data, a fatal error or shutdown
+        self._ready_event = threading.Event()
         self.thread: threading.Thread | None = None
         self.timer: threading.Timer | None = None
 
-    def _generate_channel(self, config: Config) -> grpc.Channel:
-        target = f"{config.host}:{config.port}"
+        # payloads are parsed and applied off the stream thread; only the
+        # latest unapplied payload is kept, superseded ones are dropped
+        self._pending: tuple[str, dict | None] | None = None
+        self._pending_condition = threading.Condition()
+        self._applied_digest: bytes | None = None
+        self.apply_thread: threading.Thread | None = None
+
+        self.sync_cache = (
+            SyncCache(config.sync_cache_path, self._cache_target(config), self.selector)
+            if config.sync_cache_path
+            else None
+        )
+        self._sync_context: dict = {}
+
+    @staticmethod
+    def _channel_options(config: Config) -> list[tuple[str, typing.Any]]:
         # Create the channel with the service config
         options: list[tuple[str, typing.Any]] = [
             ("grpc.keepalive_time_ms", config.keep_alive_time),
@@ -96,33 +121,42 @@ class GrpcWatcher(FlagStateConnector):
         ]
         if config.default_authority is not None:
             options.append(("grpc.default_authority", config.default_authority))
+        options.extend(grpc_tuning_options(config))
 
-        if config.channel_credentials is not None:
-            channel = grpc.secure_channel(
-                target,
-                credentials=config.channel_credentials,
-                options=options,
-            )
+        return options
 
-        elif config.tls:
-            credentials = grpc.ssl_channel_credentials()
-            if config.cert_path:
-                with open(config.cert_path, "rb") as f:
-                    credentials = grpc.ssl_channel_credentials(f.read())
+    @staticmethod
+    def _channel_credentials(config: Config) -> grpc.ChannelCredentials | None:
+        if config.channel_credentials is not None:
+            return config.channel_credentials
+        if not config.tls:
+            return None
+        if config.cert_path:
+            with open(config.cert_path, "rb") as f:
+                return grpc.ssl_channel_credentials(f.read())
+        return grpc.ssl_channel_credentials()
 
-            channel = grpc.secure_channel(
+    def _generate_channel(self, config: Config) -> grpc.Channel:
+        return self._channel_for(f"{config.host}:{config.port}", config)
+
+    def _cache_target(self, config: Config) -> str:
+        """Identifies the sync source in the sync cache."""
+        return f"{config.host}:{config.port}"
+
+    @classmethod
+    def _channel_for(cls, target: str, config: Config) -> grpc.Channel:
+        options = cls._channel_options(config)
+        credentials = cls._channel_credentials(config)
+        if credentials is not None:
+            return grpc.secure_channel(
                 target,
                 credentials=credentials,
                 options=options,
+                compression=config.compression,
             )
-
-        else:
-            channel = grpc.insecure_channel(
-                target,
-                options=options,
-            )
-
-        return channel
+        return grpc.insecure_channel(
+            target, options=options, compression=config.compression
+        )
 
     def initialize(self, context: EvaluationContext) -> None:
         self.connect()
@@ -130,18 +164,27 @@ class GrpcWatcher(FlagStateConnector):
     def connect(self) -> None:
         self.active = True
         self._shutdown_event.clear()
+        self._ready_event.clear()
+        self._start_apply_thread()
+        # loaded before the stream starts so it cannot replace newer payloads
+        cached = self._load_sync_cache()
 
         # Run monitoring in a separate thread
         self.monitor_thread = threading.Thread(
             target=self.monitor, daemon=True, name="FlagdGrpcSyncServiceMonitorThread"
         )
         self.monitor_thread.start()
+
+        if cached:
+            # the stream reconciles in the background
+            return
+
         ## block until ready or deadline reached
-        timeout = self.deadline + time.monotonic()
-        while not self.connected and time.monotonic() < timeout:
-            if self._is_fatal:
-                break
-            time.sleep(0.05)
+        self.wait_until_ready(self.deadline)
+
+    def wait_until_ready(self, timeout: float) -> None:
+        """Block until the first payload is applied, raise if it is not."""
+        self._ready_event.wait(timeout)
         logger.debug("Finished blocking gRPC state initialization")
 
         if self._is_fatal:
@@ -152,6 +195,32 @@ class GrpcWatcher(FlagStateConnector):
                 "Blocking init finished before data synced. Consider increasing startup deadline to avoid inconsistent evaluations."
             )
 
+    def _load_sync_cache(self) -> bool:
+        cached = self.sync_cache.load() if self.sync_cache else None
+        if cached is None:
+            return False
+        flag_str, sync_context = cached
+        payload = flag_str.encode()
+        try:
+            self._update_flag_store(flag_str, len(payload))
+        except (json.JSONDecodeError, ParseError):
+            logger.exception("Ignoring invalid flag configuration in sync cache")
+            return False
+        logger.debug("Loaded flag configuration from sync cache")
+        self._applied_digest = self._digest(payload)
+        self._sync_context = sync_context
+        self.emit_provider_ready(
+            ProviderEventDetails(message="Serving cached flag configuration"),
+            sync_context,
+        )
+        # stale until the stream delivers the current configuration
+        self.emit_provider_stale(
+            ProviderEventDetails(
+                message="Serving cached flag configuration, gRPC sync not connected"
+            )
+        )
+        return True
+
     def monitor(self) -> None:
         self.channel.subscribe(self._state_change_callback, try_to_connect=True)
 
@@ -201,6 +270,12 @@ class GrpcWatcher(FlagStateConnector):
     def shutdown(self) -> None:
         self.active = False
         self._shutdown_event.set()
+        self._ready_event.set()
+        with self._pending_condition:
+            self._pending_condition.notify_all()
+        self._close_channel()
+
+    def _close_channel(self) -> None:
         self.channel.close()
 
     def _create_request_args(self) -> dict:
@@ -233,7 +308,9 @@ class GrpcWatcher(FlagStateConnector):
         context_values_request = sync_pb2.GetMetadataRequest()
         try:
             context_values_response: sync_pb2.GetMetadataResponse = (
-                self.stub.GetMetadata(context_values_request, wait_for_ready=True)
+                self.stub.GetMetadata(
+                    context_values_request, wait_for_ready=self.wait_for_ready
+                )
             )
             return context_values_response
         except grpc.RpcError as e:
@@ -249,26 +326,106 @@ class GrpcWatcher(FlagStateConnector):
         context_values_response: sync_pb2.GetMetadataResponse | None,
     ) -> bool:
         """Process a single flag response. Returns True if the loop should terminate."""
-        flag_str = flag_rsp.flag_configuration
-        logger.debug(f"Received flag configuration - {abs(hash(flag_str)) % (10**8)}")
-        self.flag_store.update(json.loads(flag_str))
+        self.backoff.reset()
+        self._submit(
+            flag_rsp.flag_configuration,
+            self._context_values(flag_rsp, context_values_response),
+        )
 
-        if not self.connected:
-            context_values = {}
-            if flag_rsp.sync_context:
-                context_values = MessageToDict(flag_rsp.sync_context)
-            elif context_values_response:
-                context_values = MessageToDict(context_values_response)["metadata"]
+        if not self.active:
+            logger.debug("Terminating gRPC sync thread")
+            return True
+        return False
+
+    def _context_values(
+        self,
+        flag_rsp: sync_pb2.SyncFlagsResponse,
+        context_values_response: sync_pb2.GetMetadataResponse | None,
+    ) -> dict | None:
+        """Sync context to report with the ready event, None once connected."""
+        if self.connected:
+            return None
+        if flag_rsp.sync_context:
+            return MessageToDict(flag_rsp.sync_context)
+        if context_values_response:
+            return typing.cast(dict, MessageToDict(context_values_response)["metadata"])
+        return {}
+
+    def _submit(self, flag_str: str, context_values: dict | None) -> None:
+        with self._pending_condition:
+            if self._pending is not None:
+                logger.debug("Dropping superseded flag configuration")
+            self._pending = (flag_str, context_values)
+            self._pending_condition.notify()
+
+    def _start_apply_thread(self) -> None:
+        if self.apply_thread is None or not self.apply_thread.is_alive():
+            self.apply_thread = threading.Thread(
+                target=self._apply_loop,
+                daemon=True,
+                name="FlagdGrpcSyncApplyThread",
+            )
+            self.apply_thread.start()
+
+    def _apply_loop(self) -> None:
+        while True:
+            with self._pending_condition:
+                while self._pending is None and self.active:
+                    self._pending_condition.wait()
+                if self._pending is None:
+                    return
+                flag_str, context_values = self._pending
+                self._pending = None
+            try:
+                self._apply(flag_str, context_values)
+            except Exception:
+                # keep the worker alive for the next payload
+                logger.exception("Could not apply flag configuration")
+
+    @staticmethod
+    def _digest(payload: bytes) -> bytes:
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def _update_flag_store(self, flag_str: str, payload_bytes: int) -> None:
+        started = time.perf_counter()
+        flags_data = json.loads(flag_str)
+        self.flag_store.update(
+            flags_data,
+            payload_bytes=payload_bytes,
+            decode_seconds=time.perf_counter() - started,
+        )
+
+    def _apply(self, flag_str: str, context_values: dict | None) -> None:
+        payload = flag_str.encode()
+        digest = self._digest(payload)
+        if context_values is not None:
+            self._sync_context = context_values
+        if digest == self._applied_digest:
+            self.flag_store.record_skipped_reload()
+            logger.debug(f"Skipping unchanged flag configuration - {digest.hex()}")
+        else:
+            logger.debug(f"Received flag configuration - {digest.hex()}")
+            try:
+                self._update_flag_store(flag_str, len(payload))
+            except json.JSONDecodeError:
+                logger.exception(
+                    "Could not parse JSON flag data from SyncFlags endpoint"
+                )
+                return
+            except ParseError:
+                logger.exception("Could not parse flag data using flagd syntax")
+                return
+            self._applied_digest = digest
+            if self.sync_cache is not None:
+                self.sync_cache.store(flag_str, self._sync_context)
+
+        if context_values is not None and not self.connected:
             self.emit_provider_ready(
                 ProviderEventDetails(message="gRPC sync connection established"),
                 context_values,
             )
             self.connected = True
-
-        if not self.active:
-            logger.debug("Terminating gRPC sync thread")
-            return True
-        return False
+            self._ready_event.set()
 
     def _handle_rpc_error(self, e: grpc.RpcError) -> bool:
         """Handle a gRPC RpcError. Returns True if the stream loop should stop."""
@@ -279,6 +436,7 @@ class GrpcWatcher(FlagStateConnector):
             logger.error(f"SyncFlags stream fatal error, {code=} {e.details()=}")
             self._is_fatal = True
             self.active = False
+            self._ready_event.set()
             self.emit_provider_error(
                 ProviderEventDetails(
                     message=f"Fatal gRPC status code: {code}",
@@ -290,35 +448,41 @@ class GrpcWatcher(FlagStateConnector):
         logger.debug(f"SyncFlags stream error, reconnecting, {code=} {e.details()=}")
         return False
 
-    def _wait_before_reconnect(self) -> None:
-        self._shutdown_event.wait(self.retry_backoff_max_seconds)
+    def _wait_before_reconnect(self, stream_expired: bool = False) -> None:
+        """Back off before reopening the stream.
+
+        ``stream_expired`` is set when a stream that delivered flags ended
+        cleanly or hit ``stream_deadline_ms``, which is routine, not a failure.
+        """
+        delay = self.backoff.next_delay()
+        logger.debug(f"Reconnecting gRPC sync stream in {delay:.3f}s")
+        self._shutdown_event.wait(delay)
 
     def listen(self) -> None:
         call_args = self.generate_grpc_call_args()
         request_args = self._create_request_args()
 
         while self.active:
+            received = False
+            stream_expired = False
             try:
                 context_values_response = self._fetch_metadata()
                 request = sync_pb2.SyncFlagsRequest(**request_args)
                 logger.debug("Setting up gRPC sync flags connection")
                 for flag_rsp in self.stub.SyncFlags(request, **call_args):
+                    received = True
                     if self._handle_flag_response(flag_rsp, context_values_response):
                         return
+                stream_expired = received
             except grpc.RpcError as e:
                 if self._handle_rpc_error(e):
                     return
-            except json.JSONDecodeError:
-                logger.exception(
-                    "Could not parse JSON flag data from SyncFlags endpoint"
-                )
-            except ParseError:
-                logger.exception("Could not parse flag data using flagd syntax")
+                stream_expired = received and e.code() == StatusCode.DEADLINE_EXCEEDED
             if self.active:
-                self._wait_before_reconnect()
+                self._wait_before_reconnect(stream_expired)
 
     def generate_grpc_call_args(self) -> GrpcMultiCallableArgs:
-        call_args: GrpcMultiCallableArgs = {"wait_for_ready": True}
+        call_args: GrpcMultiCallableArgs = {"wait_for_ready": self.wait_for_ready}
         if self.streamline_deadline_seconds > 0:
             call_args["timeout"] = self.streamline_deadline_seconds
         # Add selector via gRPC metadata header (flagd v0.11.0+ preferred approach)
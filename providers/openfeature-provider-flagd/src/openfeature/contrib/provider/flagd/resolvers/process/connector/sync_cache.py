@@ -0,0 +1,68 @@
+import contextlib
+import json
+import logging
+import os
+import tempfile
+
+logger = logging.getLogger("openfeature.contrib")
+
+
+class SyncCache:
+    """Last successfully applied sync payload, persisted to a local file.
+
+    Lets the in-process resolver start serving flags before the sync stream
+    connects. The cache records the sync target and selector it was written
+    for and is not loaded for others. Failures to read or write the cache are
+    logged and otherwise ignored, the cache never prevents the provider from
+    working.
+    """
+
+    def __init__(self, path: str, target: str, selector: str | None = None):
+        self.path = path
+        self.target = target
+        self.selector = selector
+
+    def load(self) -> tuple[str, dict] | None:
+        """Return the cached flag configuration and sync context, if any."""
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                document = json.load(file)
+            if (document.get("target"), document.get("selector")) != (
+                self.target,
+                self.selector,
+            ):
+                logger.info(
+                    f"Ignoring sync cache {self.path} written for another target or selector"
+                )
+                return None
+            return document["flagConfiguration"], document.get("syncContext", {})
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring unreadable sync cache {self.path}", exc_info=True)
+            return None
+
+    def store(self, flag_configuration: str, sync_context: dict) -> None:
+        """Atomically replace the cache, readers never observe a partial file."""
+        document = {
+            "target": self.target,
+            "selector": self.selector,
+            "flagConfiguration": flag_configuration,
+            "syncContext": sync_context,
+        }
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            fd, temporary_path = tempfile.mkstemp(suffix=".tmp", dir=directory)
+        except OSError:
+            logger.warning(f"Could not write sync cache {self.path}", exc_info=True)
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(document, file)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary_path, self.path)
+        except OSError:
+            logger.warning(f"Could not write sync cache {self.path}", exc_info=True)
+            with contextlib.suppress(OSError):
+                os.unlink(temporary_path)
@@ -0,0 +1,264 @@
+"""Sync streams shared between the in-process providers of a process.
+
+Providers configured with ``shared_sync`` subscribe to the process-wide
+`SyncHub` instead of opening their own stream. The hub keeps one channel per
+target and one ``SyncFlags`` stream per target and selector. Every payload is
+parsed once and the resulting snapshot is swapped into the flag store of each
+subscriber, provider events are fanned out to all of them. Streams and
+channels are closed once their last subscriber shuts down.
+
+A stream uses the configuration of the subscriber that opened it, deadlines,
+retry settings and the sync cache of later subscribers are not applied to it.
+"""
+
+import logging
+import threading
+import time
+import typing
+
+import grpc
+
+from openfeature.contrib.tools.flagd.core.model import FlagSnapshot
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.event import ProviderEventDetails
+
+from ....config import Config
+from ..flags import FlagStore
+from .grpc_watcher import GrpcWatcher
+
+logger = logging.getLogger("openfeature.contrib")
+
+ChannelKey: typing.TypeAlias = tuple[typing.Hashable, ...]
+StreamKey: typing.TypeAlias = tuple[ChannelKey, str | None, str | None]
+
+
+def _channel_key(config: Config) -> ChannelKey:
+    return (
+        f"{config.host}:{config.port}",
+        bool(config.tls),
+        config.cert_path,
+        config.default_authority,
+        # credentials objects cannot be compared, only identical ones share
+        id(config.channel_credentials),
+        config.compression,
+        config.max_receive_message_length,
+        config.http2_window_size,
+    )
+
+
+def _stream_key(config: Config) -> StreamKey:
+    return _channel_key(config), config.selector, config.provider_id
+
+
+class _HubGrpcWatcher(GrpcWatcher):
+    """GrpcWatcher on a channel owned by the hub, feeding a shared stream."""
+
+    @property
+    def stream(self) -> "_SharedStream":
+        return typing.cast(_SharedStream, self.flag_store)
+
+    def _generate_channel(self, config: Config) -> grpc.Channel:
+        return self.stream.hub.acquire_channel(config, super()._generate_channel)
+
+    def monitor(self) -> None:
+        # the first RPC on the channel connects it; asking for a connection on
+        # every subscription races with closing the shared channel
+        self.channel.subscribe(self._state_change_callback, try_to_connect=False)
+
+    def _close_channel(self) -> None:
+        self.channel.unsubscribe(self._state_change_callback)
+        self.stream.hub.release_channel(self.config)
+
+
+class _SharedStream:
+    """One sync stream, the flag store its watcher writes to."""
+
+    def __init__(self, hub: "SyncHub", key: StreamKey, config: Config):
+        self.hub = hub
+        self.key = key
+        self.subscribers: list[SharedSyncConnector] = []
+        self.snapshot: FlagSnapshot | None = None
+        # set once the stream reported ready, kept while reconnecting
+        self.sync_context: dict | None = None
+        self.started = False
+        self._lock = threading.RLock()
+        self.watcher = _HubGrpcWatcher(
+            config,
+            self,  # type: ignore[arg-type]
+            self._emit_ready,
+            self._emit_error,
+            self._emit_stale,
+        )
+
+    @property
+    def closed(self) -> bool:
+        return self.started and not self.watcher.active
+
+    def record_skipped_reload(self) -> None:
+        with self._lock:
+            for subscriber in self.subscribers:
+                subscriber.flag_store.record_skipped_reload()
+
+    def update(
+        self,
+        flags_data: dict,
+        payload_bytes: int | None = None,
+        decode_seconds: float = 0.0,
+    ) -> None:
+        started = time.perf_counter()
+        snapshot = FlagStore.parse(flags_data)
+        decode_seconds += time.perf_counter() - started
+        with self._lock:
+            self.snapshot = snapshot
+            for subscriber in self.subscribers:
+                # every subscriber reports the cost of the shared decoding
+                subscriber.flag_store.swap(
+                    snapshot,
+                    payload_bytes=payload_bytes,
+                    decode_seconds=decode_seconds,
+                )
+
+    def add(self, subscriber: "SharedSyncConnector") -> None:
+        with self._lock:
+            self.subscribers.append(subscriber)
+
+    def remove(self, subscriber: "SharedSyncConnector") -> bool:
+        """Drop the subscriber, returns True if it was the last one."""
+        with self._lock:
+            if subscriber in self.subscribers:
+                self.subscribers.remove(subscriber)
+            return not self.subscribers
+
+    def join(self, subscriber: "SharedSyncConnector") -> None:
+        """Block until the subscriber is served, like GrpcWatcher.connect."""
+        with self._lock:
+            start = not self.started
+            self.started = True
+            sync_context = self.sync_context
+            if self.snapshot is not None:
+                subscriber.flag_store.swap(self.snapshot)
+
+        if start:
+            logger.debug(f"Opening shared gRPC sync stream {self.key}")
+            self.watcher.connect()
+        elif sync_context is not None:
+            subscriber.emit_provider_ready(
+                ProviderEventDetails(message="Joined shared gRPC sync stream"),
+                sync_context,
+            )
+        else:
+            # the stream is still connecting for an earlier subscriber
+            self.watcher.wait_until_ready(subscriber.deadline)
+
+    def _subscribers(self) -> list["SharedSyncConnector"]:
+        with self._lock:
+            return list(self.subscribers)
+
+    def _emit_ready(self, details: ProviderEventDetails, sync_context: dict) -> None:
+        with self._lock:
+            self.sync_context = sync_context
+        for subscriber in self._subscribers():
+            subscriber.emit_provider_ready(details, sync_context)
+
+    def _emit_error(self, details: ProviderEventDetails) -> None:
+        for subscriber in self._subscribers():
+            subscriber.emit_provider_error(details)
+
+    def _emit_stale(self, details: ProviderEventDetails) -> None:
+        for subscriber in self._subscribers():
+            subscriber.emit_provider_stale(details)
+
+
+class SyncHub:
+    """Reference counted registry of shared channels and sync streams."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._streams: dict[StreamKey, _SharedStream] = {}
+        self._channels: dict[ChannelKey, tuple[grpc.Channel, int]] = {}
+
+    def subscribe(self, subscriber: "SharedSyncConnector") -> _SharedStream:
+        """Register the subscriber with the stream for its target and selector."""
+        key = _stream_key(subscriber.config)
+        with self._lock:
+            stream = self._streams.get(key)
+            if stream is None or stream.closed:
+                stream = _SharedStream(self, key, subscriber.config)
+                self._streams[key] = stream
+            stream.add(subscriber)
+        return stream
+
+    def unsubscribe(
+        self, stream: _SharedStream, subscriber: "SharedSyncConnector"
+    ) -> None:
+        with self._lock:
+            last = stream.remove(subscriber)
+            if last and self._streams.get(stream.key) is stream:
+                del self._streams[stream.key]
+        if last:
+            logger.debug(f"Closing shared gRPC sync stream {stream.key}")
+            stream.watcher.shutdown()
+
+    def acquire_channel(
+        self, config: Config, factory: typing.Callable[[Config], grpc.Channel]
+    ) -> grpc.Channel:
+        key = _channel_key(config)
+        with self._lock:
+            if key in self._channels:
+                channel, references = self._channels[key]
+            else:
+                channel, references = factory(config), 0
+            self._channels[key] = (channel, references + 1)
+            return channel
+
+    def release_channel(self, config: Config) -> None:
+        key = _channel_key(config)
+        with self._lock:
+            channel, references = self._channels[key]
+            if references > 1:
+                self._channels[key] = (channel, references - 1)
+                return
+            del self._channels[key]
+        channel.close()
+
+    @property
+    def stream_count(self) -> int:
+        return len(self._streams)
+
+    @property
+    def channel_count(self) -> int:
+        return len(self._channels)
+
+
+sync_hub = SyncHub()
+
+
+class SharedSyncConnector:
+    """Connector of an in-process provider subscribed to the `sync_hub`."""
+
+    def __init__(
+        self,
+        config: Config,
+        flag_store: FlagStore,
+        emit_provider_ready: typing.Callable[[ProviderEventDetails, dict], None],
+        emit_provider_error: typing.Callable[[ProviderEventDetails], None],
+        emit_provider_stale: typing.Callable[[ProviderEventDetails], None],
+    ):
+        self.config = config
+        self.flag_store = flag_store
+        self.emit_provider_ready = emit_provider_ready
+        self.emit_provider_error = emit_provider_error
+        self.emit_provider_stale = emit_provider_stale
+        self.deadline = config.deadline_ms * 0.001
+        self.hub = sync_hub
+        self.stream: _SharedStream | None = None
+
+    def initialize(self, evaluation_context: EvaluationContext) -> None:
+        self.stream = self.hub.subscribe(self)
+        # stays subscribed if this raises, the stream keeps reconnecting
+        self.stream.join(self)
+
+    def shutdown(self) -> None:
+        stream, self.stream = self.stream, None
+        if stream is not None:
+            self.hub.unsubscribe(stream, self)
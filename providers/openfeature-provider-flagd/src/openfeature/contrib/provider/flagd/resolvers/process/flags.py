@@ -2,17 +2,15 @@
 # The canonical implementation now lives in openfeature.contrib.tools.flagd.core.
 import typing
 
+from openfeature.contrib.tools.flagd.core.model import flag_store as _core
 from openfeature.contrib.tools.flagd.core.model.flag import (  # noqa: F401
     Flag,
     _validate_metadata,
 )
-from openfeature.contrib.tools.flagd.core.model.flag_store import (
-    FlagStore as _CoreFlagStore,
-)
 from openfeature.event import ProviderEventDetails
 
 
-class FlagStore(_CoreFlagStore):
+class FlagStore(_core.FlagStore):
     """Backward-compatible FlagStore that supports an optional event callback."""
 
     def __init__(
@@ -25,8 +23,30 @@ class FlagStore(_CoreFlagStore):
         super().__init__()
         self._emit_provider_configuration_changed = emit_provider_configuration_changed
 
-    def update(self, flags_data: dict) -> list[str]:
-        changed_keys = super().update(flags_data)
+    def update(
+        self,
+        flags_data: dict,
+        payload_bytes: int | None = None,
+        decode_seconds: float = 0.0,
+    ) -> list[str]:
+        """Update flags and return the changed keys.
+
+        Connectors pass the size of the payload and the time spent decoding
+        it for the sync metrics, which are collected by the in-process
+        resolver; this store ignores them.
+        """
+        return self.swap(self.parse(flags_data))
+
+    def record_skipped_reload(self) -> None:
+        """Called by connectors when they skip an unchanged payload."""
+
+    def swap(
+        self,
+        snapshot: _core.FlagSnapshot,
+        payload_bytes: int | None = None,
+        decode_seconds: float = 0.0,
+    ) -> list[str]:
+        changed_keys = super().swap(snapshot)
         if self._emit_provider_configuration_changed is not None:
             self._emit_provider_configuration_changed(
                 ProviderEventDetails(
@@ -0,0 +1,51 @@
+import contextvars
+import threading
+import typing
+
+_current_scope: contextvars.ContextVar["EvaluationScope | None"] = (
+    contextvars.ContextVar("flagd_evaluation_scope", default=None)
+)
+
+
+class EvaluationScope:
+    """Reuses bulk evaluations of an RPC provider within a block of code.
+
+    Inside ``with provider.evaluation_scope():`` the first evaluation with a
+    given evaluation context fetches all flags for that context with a single
+    ``ResolveAll`` call, concurrent and later evaluations with the same
+    context are served from its result. Scopes are meant to be short lived, e.g. one per request:
+    flag changes are only picked up by the next scope.
+    """
+
+    def __init__(self, owner: object):
+        self.owner = owner
+        self._snapshots: dict[bytes, typing.Mapping[str, typing.Any]] = {}
+        self._lock = threading.Lock()
+        self._tokens: list[contextvars.Token] = []
+
+    def get(self, key: bytes) -> typing.Mapping[str, typing.Any] | None:
+        with self._lock:
+            return self._snapshots.get(key)
+
+    def put(self, key: bytes, snapshot: typing.Mapping[str, typing.Any]) -> None:
+        with self._lock:
+            self._snapshots[key] = snapshot
+
+    @property
+    def snapshot_count(self) -> int:
+        """Number of evaluation contexts fetched in bulk."""
+        with self._lock:
+            return len(self._snapshots)
+
+    def __enter__(self) -> "EvaluationScope":
+        self._tokens.append(_current_scope.set(self))
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        _current_scope.reset(self._tokens.pop())
+
+
+def current_scope(owner: object) -> EvaluationScope | None:
+    """The active scope of the given resolver, if any."""
+    scope = _current_scope.get()
+    return scope if scope is not None and scope.owner is owner else None
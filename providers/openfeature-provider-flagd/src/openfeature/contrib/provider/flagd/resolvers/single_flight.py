@@ -0,0 +1,96 @@
+import asyncio
+import copy
+import functools
+import threading
+import typing
+
+T = typing.TypeVar("T")
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: typing.Any = None
+        self.error: BaseException | None = None
+
+
+def _raise_copy(error: BaseException) -> typing.NoReturn:
+    # every waiter raises its own copy, raising the shared exception from
+    # several callers would keep growing its traceback
+    raise copy.copy(error) from error
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls into one.
+
+    While a call for a key is in flight, callers with the same key wait for
+    it and share its result or exception instead of making their own call.
+    Synchronous calls are shared between threads, asynchronous ones between
+    the tasks of an event loop. After `forget`, callers start new calls
+    rather than joining the ones already in flight.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._calls: dict[tuple[int, typing.Hashable], _Call] = {}
+        self._tasks: dict[
+            tuple[asyncio.AbstractEventLoop, int, typing.Hashable], asyncio.Task
+        ] = {}
+
+    def forget(self) -> None:
+        """Stops sharing the calls in flight with later callers."""
+        with self._lock:
+            self._generation += 1
+
+    def do(self, key: typing.Hashable, fn: typing.Callable[[], T]) -> T:
+        with self._lock:
+            flight = (self._generation, key)
+            call = self._calls.get(flight)
+            leader = call is None
+            if call is None:
+                call = self._calls[flight] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                _raise_copy(call.error)
+            return typing.cast(T, call.result)
+
+        try:
+            call.result = fn()
+            return typing.cast(T, call.result)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[flight]
+            call.done.set()
+
+    async def do_async(
+        self,
+        key: typing.Hashable,
+        fn: typing.Callable[[], typing.Coroutine[typing.Any, typing.Any, T]],
+    ) -> T:
+        flight = (asyncio.get_running_loop(), self._generation, key)
+        task = self._tasks.get(flight)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[flight] = task
+            task.add_done_callback(functools.partial(self._finished, flight))
+        # a cancelled caller must not cancel the call for the others
+        await asyncio.wait((task,))
+        error = task.exception()
+        if error is not None:
+            _raise_copy(error)
+        return typing.cast(T, task.result())
+
+    def _finished(
+        self,
+        flight: tuple[asyncio.AbstractEventLoop, int, typing.Hashable],
+        task: asyncio.Task,
+    ) -> None:
+        self._tasks.pop(flight, None)
+        if not task.cancelled():
+            # retrieved, even when all callers were cancelled meanwhile
+            task.exception()
@@ -0,0 +1,144 @@
+import asyncio
+import json
+import threading
+from unittest.mock import Mock
+
+import grpc
+import pytest
+
+from openfeature.contrib.provider.flagd import FlagdProvider
+from openfeature.contrib.provider.flagd.config import Config, ResolverType
+from openfeature.contrib.provider.flagd.resolvers.in_process import InProcessResolver
+from openfeature.contrib.provider.flagd.resolvers.process.connector.aio_grpc_watcher import (
+    AioGrpcWatcher,
+)
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.exception import ProviderFatalError
+from openfeature.flag_evaluation import Reason
+from openfeature.schemas.protobuf.flagd.sync.v1 import sync_pb2, sync_pb2_grpc
+
+FLAGS = json.dumps(
+    {
+        "flags": {
+            "basic-flag": {
+                "state": "ENABLED",
+                "variants": {"on": True, "off": False},
+                "defaultVariant": "on",
+            }
+        }
+    }
+)
+
+
+class FakeSyncService(sync_pb2_grpc.FlagSyncServiceServicer):
+    def __init__(self, abort_code: grpc.StatusCode | None = None):
+        self.abort_code = abort_code
+        self.streams = 0
+
+    async def SyncFlags(self, request, context):  # noqa: N802
+        self.streams += 1
+        if self.abort_code is not None:
+            await context.abort(self.abort_code, "rejected")
+        yield sync_pb2.SyncFlagsResponse(flag_configuration=FLAGS)
+        await asyncio.Event().wait()
+
+
+async def start_server(service: FakeSyncService) -> tuple[grpc.aio.Server, int]:
+    server = grpc.aio.server()
+    sync_pb2_grpc.add_FlagSyncServiceServicer_to_server(service, server)
+    port = server.add_insecure_port("localhost:0")
+    await server.start()
+    return server, port
+
+
+def config_for(port: int, **kwargs) -> Config:
+    return Config(
+        host="localhost",
+        port=port,
+        resolver=ResolverType.IN_PROCESS,
+        deadline_ms=2000,
+        **kwargs,
+    )
+
+
+def test_initialize_async_applies_first_payload_off_the_loop():
+    async def scenario():
+        server, port = await start_server(FakeSyncService())
+        emit_provider_ready = Mock()
+        resolver = InProcessResolver(
+            config_for(port), emit_provider_ready, Mock(), Mock(), Mock()
+        )
+        applied_on = []
+        update = resolver.connector.flag_store.update
+
+        def record_update(*args, **kwargs):
+            applied_on.append(threading.get_ident())
+            update(*args, **kwargs)
+
+        resolver.connector.flag_store.update = record_update
+        try:
+            await resolver.initialize_async(EvaluationContext())
+            assert isinstance(resolver.connector, AioGrpcWatcher)
+            # no sync or apply threads of its own are started
+            assert resolver.connector.thread is None
+            assert resolver.connector.apply_thread is None
+            emit_provider_ready.assert_called_once()
+            # the payload was applied in the executor before ready
+            assert applied_on
+            assert threading.get_ident() not in applied_on
+
+            details = await resolver.resolve_boolean_details_async("basic-flag", False)
+            assert details.value is True
+            assert details.reason == Reason.STATIC
+
+            # the SDK initializes the registered provider once more
+            resolver.initialize(EvaluationContext())
+            emit_provider_ready.assert_called_once()
+        finally:
+            await resolver.shutdown_async()
+            await server.stop(None)
+
+    asyncio.run(scenario())
+
+
+def test_initialize_async_fails_fast_on_fatal_status():
+    async def scenario():
+        service = FakeSyncService(abort_code=grpc.StatusCode.UNAUTHENTICATED)
+        server, port = await start_server(service)
+        config = config_for(port, fatal_status_codes=["UNAUTHENTICATED"])
+        emit_provider_error = Mock()
+        resolver = InProcessResolver(
+            config, Mock(), emit_provider_error, Mock(), Mock()
+        )
+        try:
+            with pytest.raises(ProviderFatalError):
+                await resolver.initialize_async(EvaluationContext())
+            assert service.streams == 1
+            emit_provider_error.assert_called_once()
+        finally:
+            await resolver.shutdown_async()
+            await server.stop(None)
+
+    asyncio.run(scenario())
+
+
+def test_provider_resolves_async_from_file(tmp_path):
+    flag_file = tmp_path / "flags.json"
+    flag_file.write_text(FLAGS)
+
+    async def scenario():
+        provider = FlagdProvider(
+            resolver_type=ResolverType.FILE,
+            offline_flag_source_path=str(flag_file),
+        )
+        await provider.initialize_async(EvaluationContext())
+        try:
+            details = await provider.resolve_boolean_details_async("basic-flag", False)
+            assert details.value is True
+        finally:
+            await provider.shutdown_async()
+        return provider.resolver.connector.thread
+
+    watcher_thread = asyncio.run(scenario())
+    watcher_thread.join(timeout=1)
+    assert not watcher_thread.is_alive()
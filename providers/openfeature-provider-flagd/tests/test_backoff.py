@@ -0,0 +1,38 @@
+from openfeature.contrib.provider.flagd.resolvers.backoff import ReconnectBackoff
+
+
+def test_ceiling_doubles_up_to_maximum():
+    backoff = ReconnectBackoff(1.0, 5.0, rand=lambda: 1.0)
+
+    assert [backoff.next_delay() for _ in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+    state = backoff.state()
+    assert state.attempts == 5
+    assert state.ceiling_seconds == 5.0
+    assert state.last_delay_seconds == 5.0
+
+
+def test_delays_are_jittered_below_ceiling():
+    backoff = ReconnectBackoff(1.0, 8.0)
+
+    for _ in range(20):
+        ceiling = backoff.state().ceiling_seconds
+        assert 0 <= backoff.next_delay() <= ceiling
+    assert backoff.state().ceiling_seconds == 8.0
+
+
+def test_reset_starts_over():
+    backoff = ReconnectBackoff(0.5, 10.0, rand=lambda: 0.5)
+    backoff.next_delay()
+    backoff.next_delay()
+
+    backoff.reset()
+
+    assert backoff.state().attempts == 0
+    assert backoff.next_delay() == 0.25
+
+
+def test_maximum_below_initial_uses_initial():
+    backoff = ReconnectBackoff(2.0, 1.0, rand=lambda: 1.0)
+
+    assert backoff.next_delay() == 2.0
+    assert backoff.next_delay() == 2.0
@@ -0,0 +1,72 @@
+from openfeature.contrib.provider.flagd.resolvers.cache import CacheStats, FlagCache
+from openfeature.flag_evaluation import FlagResolutionDetails, Reason
+
+
+def test_hits_are_independent_copies():
+    cache = FlagCache(10)
+    details = FlagResolutionDetails(
+        value={"color": ["red"]}, reason=Reason.STATIC, variant="red"
+    )
+    cache.put("object-flag", details)
+    details.value["color"].append("blue")
+
+    first = cache.get("object-flag")
+    assert first is not None
+    assert first.reason == Reason.CACHED
+    assert first.variant == "red"
+    first.value["color"].append("green")
+    first.reason = Reason.ERROR
+
+    second = cache.get("object-flag")
+    assert second is not None
+    assert second.value == {"color": ["red"]}
+    assert second.reason == Reason.CACHED
+    assert details.reason == Reason.STATIC
+
+
+def test_counts_hits_misses_and_dropped_entries():
+    cache = FlagCache(2)
+    for key in ("a", "b", "c"):
+        cache.put(key, FlagResolutionDetails(True, reason=Reason.STATIC))
+    cache.put("c", FlagResolutionDetails(False, reason=Reason.STATIC))
+
+    assert cache.get("a") is None
+    assert cache.get("c") is not None
+    cache.invalidate(["b", "missing"])
+
+    assert cache.stats() == CacheStats(
+        hits=1,
+        misses=1,
+        evictions=1,
+        invalidations=1,
+        expirations=0,
+        size=1,
+        max_size=2,
+    )
+    cache.clear()
+    assert cache.stats().invalidations == 2
+    assert cache.stats().size == 0
+
+
+def test_context_entries_expire_and_are_invalidated_per_flag():
+    now = [0.0]
+    cache = FlagCache(10, clock=lambda: now[0])
+    match = FlagResolutionDetails("on", reason=Reason.TARGETING_MATCH, variant="on")
+    cache.put("flag", match, b"alice", ttl=5.0)
+    cache.put("flag", match, b"bob", ttl=5.0)
+    cache.put("other", match, b"alice", ttl=5.0)
+
+    assert cache.get("flag") is None
+    assert cache.get("flag", b"carol") is None
+    details = cache.get("flag", b"alice")
+    assert details is not None
+    assert details.reason == Reason.CACHED
+
+    cache.invalidate(["flag"])
+    assert cache.get("flag", b"bob") is None
+    now[0] = 5.0
+    assert cache.get("other", b"alice") is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 4)
+    assert (stats.invalidations, stats.expirations, stats.size) == (2, 1, 0)
@@ -0,0 +1,29 @@
+from unittest.mock import MagicMock
+
+from openfeature.contrib.provider.flagd.resolvers.channel_pool import ChannelPool
+
+
+def test_prefers_least_outstanding_then_round_robin():
+    channels = [MagicMock(), MagicMock(), MagicMock()]
+    pool = ChannelPool(channels)
+
+    with pool.acquire() as first, pool.acquire() as second:
+        assert [first.channel, second.channel] == channels[:2]
+        assert pool.outstanding == [1, 1, 0]
+        with pool.acquire() as third:
+            assert third.channel is channels[2]
+        with pool.acquire() as fourth:
+            assert fourth.channel is channels[2]
+
+    assert pool.outstanding == [0, 0, 0]
+    with pool.acquire() as next_call:
+        assert next_call.channel is channels[1]
+
+
+def test_close_leaves_first_channel_to_its_owner():
+    channels = [MagicMock(), MagicMock()]
+
+    ChannelPool(channels).close()
+
+    channels[0].close.assert_not_called()
+    channels[1].close.assert_called_once()
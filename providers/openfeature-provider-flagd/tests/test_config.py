@@ -1,3 +1,6 @@
+import os
+
+import grpc
 import pytest
 
 # not sure if we still need this test, as this is also covered with gherkin tests.
@@ -16,14 +19,19 @@ from openfeature.contrib.provider.flagd.config import (
     DEFAULT_TLS,
     ENV_VAR_CACHE_SIZE,
     ENV_VAR_CACHE_TYPE,
+    ENV_VAR_COMPRESSION,
     ENV_VAR_DEADLINE_MS,
     ENV_VAR_HOST,
+    ENV_VAR_HTTP2_WINDOW_SIZE,
     ENV_VAR_KEEP_ALIVE_TIME_MS,
+    ENV_VAR_MAX_RECEIVE_MESSAGE_LENGTH,
     ENV_VAR_OFFLINE_FLAG_SOURCE_PATH,
     ENV_VAR_PORT,
     ENV_VAR_RETRY_BACKOFF_MS,
+    ENV_VAR_SHARED_SYNC,
     ENV_VAR_STREAM_DEADLINE_MS,
     ENV_VAR_SYNC_PORT,
+    ENV_VAR_SYNC_TARGETS,
     ENV_VAR_TLS,
     CacheType,
     Config,
@@ -201,3 +209,48 @@ def test_in_process_default_port_when_no_env_var(monkeypatch):
     config = Config(resolver=ResolverType.IN_PROCESS)
     assert config.port == DEFAULT_PORT_IN_PROCESS
     assert config.resolver == ResolverType.IN_PROCESS
+
+
+def test_offline_flag_source_paths_from_env(monkeypatch):
+    monkeypatch.setenv(
+        ENV_VAR_OFFLINE_FLAG_SOURCE_PATH,
+        os.pathsep.join(["/flags/base", "/flags/a,b.json", ""]),
+    )
+    config = Config(resolver=ResolverType.IN_PROCESS)
+    assert config.offline_flag_source_path == ["/flags/base", "/flags/a,b.json"]
+    assert config.resolver == ResolverType.FILE
+
+
+def test_shared_sync_from_env(monkeypatch):
+    assert Config(resolver=ResolverType.IN_PROCESS).shared_sync is False
+    monkeypatch.setenv(ENV_VAR_SHARED_SYNC, "true")
+    assert Config(resolver=ResolverType.IN_PROCESS).shared_sync is True
+    assert Config(shared_sync=False).shared_sync is False
+
+
+def test_channel_tuning_from_env(monkeypatch):
+    config = Config()
+    assert config.compression is None
+    assert config.max_receive_message_length is None
+    assert config.http2_window_size is None
+
+    monkeypatch.setenv(ENV_VAR_COMPRESSION, "GZIP")
+    monkeypatch.setenv(ENV_VAR_MAX_RECEIVE_MESSAGE_LENGTH, "16777216")
+    monkeypatch.setenv(ENV_VAR_HTTP2_WINDOW_SIZE, "1048576")
+    config = Config()
+    assert config.compression == grpc.Compression.Gzip
+    assert config.max_receive_message_length == 16777216
+    assert config.http2_window_size == 1048576
+
+    assert Config(compression="deflate").compression == grpc.Compression.Deflate
+
+
+def test_rejects_unknown_compression():
+    with pytest.raises(ValueError, match="compression"):
+        Config(compression="brotli")
+
+
+def test_sync_targets_from_env(monkeypatch):
+    monkeypatch.setenv(ENV_VAR_SYNC_TARGETS, "flagd-a:8015, flagd-b:8015")
+    config = Config(resolver=ResolverType.IN_PROCESS)
+    assert config.sync_targets == ["flagd-a:8015", "flagd-b:8015"]
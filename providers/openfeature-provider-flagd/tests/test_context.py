@@ -0,0 +1,48 @@
+import pytest
+
+from openfeature.contrib.provider.flagd.resolvers.context import ContextConverter
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.exception import InvalidContextError
+
+
+def test_equal_contexts_share_conversion():
+    converter = ContextConverter()
+    attributes = {"plan": "pro", "org": {"id": 7, "tags": ["a", "b"]}}
+
+    first = converter.convert(EvaluationContext("user", attributes))
+    second = converter.convert(
+        EvaluationContext("user", {"plan": "pro", "org": {"id": 7, "tags": ["a", "b"]}})
+    )
+
+    assert second is first
+    assert first.struct["org"]["id"] == 7
+    assert first.key == first.struct.SerializeToString(deterministic=True)
+    assert converter.convert(None).key == b""
+
+
+def test_distinguishes_attribute_types_and_targeting_keys():
+    converter = ContextConverter()
+
+    flag = converter.convert(EvaluationContext("user", {"beta": True}))
+    number = converter.convert(EvaluationContext("user", {"beta": 1}))
+    other = converter.convert(EvaluationContext("other", {"beta": True}))
+
+    assert flag.struct["beta"] is True
+    assert number.struct["beta"] == 1
+    assert len({flag.key, number.key, other.key}) == 3
+
+
+def test_bounded_by_max_size():
+    converter = ContextConverter(max_size=1)
+
+    first = converter.convert(EvaluationContext("a"))
+    converter.convert(EvaluationContext("b"))
+
+    assert converter.convert(EvaluationContext("a")) is not first
+
+
+def test_unconvertible_context_raises():
+    converter = ContextConverter()
+
+    with pytest.raises(InvalidContextError):
+        converter.convert(EvaluationContext("user", {"when": object()}))
@@ -0,0 +1,140 @@
+import json
+import threading
+import time
+from concurrent import futures
+from unittest.mock import Mock
+
+import grpc
+import pytest
+
+from openfeature.contrib.provider.flagd.config import Config, ResolverType
+from openfeature.contrib.provider.flagd.resolvers.in_process import InProcessResolver
+from openfeature.contrib.provider.flagd.resolvers.process.connector.failover_grpc_watcher import (
+    FailoverGrpcWatcher,
+)
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.schemas.protobuf.flagd.sync.v1 import sync_pb2, sync_pb2_grpc
+
+FLAGS = json.dumps(
+    {
+        "flags": {
+            "basic-flag": {
+                "state": "ENABLED",
+                "variants": {"on": True, "off": False},
+                "defaultVariant": "on",
+            }
+        }
+    }
+)
+
+
+class FakeSyncService(sync_pb2_grpc.FlagSyncServiceServicer):
+    def __init__(self):
+        self.streams = 0
+        self.stop = threading.Event()
+
+    def SyncFlags(self, request, context):  # noqa: N802
+        self.streams += 1
+        yield sync_pb2.SyncFlagsResponse(flag_configuration=FLAGS)
+        while not self.stop.is_set() and context.is_active():
+            self.stop.wait(0.01)
+
+
+def _start_server() -> tuple[grpc.Server, FakeSyncService, str]:
+    service = FakeSyncService()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    sync_pb2_grpc.add_FlagSyncServiceServicer_to_server(service, server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    return server, service, f"localhost:{port}"
+
+
+@pytest.fixture
+def servers():
+    started = [_start_server() for _ in range(2)]
+    yield started
+    for server, service, _ in started:
+        service.stop.set()
+        server.stop(None)
+
+
+def _resolver(
+    targets: list[str], stream_deadline_ms: int | None = None, **emitters
+) -> InProcessResolver:
+    config = Config(
+        resolver=ResolverType.IN_PROCESS,
+        deadline_ms=2000,
+        retry_backoff_ms=100,
+        retry_backoff_max_ms=60000,
+        stream_deadline_ms=stream_deadline_ms,
+        sync_metadata_disabled=True,
+        sync_targets=targets,
+    )
+    return InProcessResolver(
+        config,
+        emitters.get("ready", Mock()),
+        Mock(),
+        emitters.get("stale", Mock()),
+        emitters.get("changed", Mock()),
+    )
+
+
+def test_fails_over_without_backoff_or_reload(servers):
+    (first_server, first, first_target), (_, second, second_target) = servers
+    stale, changed = Mock(), Mock()
+    resolver = _resolver([first_target, second_target], stale=stale, changed=changed)
+    assert isinstance(resolver.connector, FailoverGrpcWatcher)
+
+    resolver.initialize(EvaluationContext())
+    try:
+        assert first.streams == 1
+        first.stop.set()
+        first_server.stop(None)
+
+        started = time.monotonic()
+        while second.streams == 0:
+            assert time.monotonic() - started < 5, "did not fail over"
+            time.sleep(0.01)
+        # the configured backoff is a minute, failover does not wait for it
+        assert time.monotonic() - started < 5
+        assert resolver.connector.current.target == second_target
+        assert resolver.resolve_boolean_details("basic-flag", False).value
+        # the same configuration is not applied again
+        time.sleep(0.1)
+        changed.assert_called_once()
+    finally:
+        resolver.shutdown()
+
+
+def test_stays_on_primary_when_stream_deadline_expires(servers):
+    (_, first, first_target), (_, second, second_target) = servers
+    resolver = _resolver([first_target, second_target], stream_deadline_ms=200)
+
+    resolver.initialize(EvaluationContext())
+    try:
+        started = time.monotonic()
+        while first.streams < 3:
+            assert time.monotonic() - started < 5, "stream was not reopened"
+            time.sleep(0.01)
+        assert second.streams == 0
+        assert resolver.connector.current.target == first_target
+        assert resolver.connector.current.failed_at is None
+    finally:
+        resolver.shutdown()
+
+
+def test_prefers_healthy_target_with_lowest_connect_latency():
+    resolver = _resolver(["a:1", "b:2", "c:3"])
+    watcher = resolver.connector
+    assert isinstance(watcher, FailoverGrpcWatcher)
+    a, b, c = watcher.targets
+
+    assert watcher.ranked_targets() == [a, b, c]
+
+    b.connect_latency = 0.01
+    c.connect_latency = 0.05
+    assert watcher.ranked_targets() == [b, c, a]
+
+    b.failed_at = time.monotonic()
+    assert watcher.ranked_targets() == [c, a, b]
+    watcher.shutdown()
@@ -1,11 +1,18 @@
+import json
 import os
-from unittest.mock import Mock
+import time
+from unittest.mock import Mock, patch
 
 import pytest
+import yaml
 
 from openfeature import api
 from openfeature.contrib.provider.flagd import FlagdProvider
-from openfeature.contrib.provider.flagd.config import Config
+from openfeature.contrib.provider.flagd.config import Config, ResolverType
+from openfeature.contrib.provider.flagd.resolvers.process.connector.file_events import (
+    InotifyFileEvents,
+    _load_libc,
+)
 from openfeature.contrib.provider.flagd.resolvers.process.connector.file_watcher import (
     FileWatcher,
 )
@@ -78,3 +85,258 @@ def test_file_load_metadata():
     assert flag_set_metadata["integer"] == 1
     assert flag_set_metadata["float"] == 1.2
     assert flag_set_metadata["bool"]
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def _flag_file(default_variant: str) -> str:
+    return json.dumps(
+        {
+            "flags": {
+                "basic-flag": {
+                    "state": "ENABLED",
+                    "variants": {"on": True, "off": False},
+                    "defaultVariant": default_variant,
+                }
+            }
+        }
+    )
+
+
+def _start_watcher(path: str, poll_interval_ms: int) -> tuple[FileWatcher, FlagStore]:
+    flag_store = FlagStore(Mock())
+    file_watcher = FileWatcher(
+        Config(
+            offline_flag_source_path=path, offline_poll_interval_ms=poll_interval_ms
+        ),
+        flag_store,
+        Mock(),
+        Mock(),
+    )
+    file_watcher.initialize(None)
+    return file_watcher, flag_store
+
+
+def _default_variant_of(flag_store: FlagStore, key: str) -> str | None:
+    flag = flag_store.get_flag(key)
+    return flag.default_variant if flag else None
+
+
+def _default_variant(flag_store: FlagStore) -> str | None:
+    return _default_variant_of(flag_store, "basic-flag")
+
+
+@pytest.mark.skipif(_load_libc() is None, reason="inotify not available")
+def test_file_watcher_reloads_on_atomic_rename(tmp_path):
+    path = tmp_path / "flags.json"
+    path.write_text(_flag_file("off"))
+    # polling alone would not notice the change within the test timeout
+    file_watcher, flag_store = _start_watcher(str(path), 60_000)
+    try:
+        replacement = tmp_path / "flags.json.tmp"
+        replacement.write_text(_flag_file("on"))
+        os.replace(replacement, path)
+        assert _wait_for(lambda: _default_variant(flag_store) == "on")
+    finally:
+        file_watcher.shutdown()
+    file_watcher.thread.join(timeout=1)
+    assert not file_watcher.thread.is_alive()
+
+
+@pytest.mark.skipif(_load_libc() is None, reason="inotify not available")
+def test_file_watcher_reloads_on_configmap_symlink_swap(tmp_path):
+    # mimics the layout kubelet uses for ConfigMap volumes
+    first = tmp_path / "..2024_01_01"
+    first.mkdir()
+    (first / "flags.json").write_text(_flag_file("off"))
+    (tmp_path / "..data").symlink_to(first.name)
+    (tmp_path / "flags.json").symlink_to("..data/flags.json")
+
+    file_watcher, flag_store = _start_watcher(str(tmp_path / "flags.json"), 60_000)
+    try:
+        second = tmp_path / "..2024_01_02"
+        second.mkdir()
+        (second / "flags.json").write_text(_flag_file("on"))
+        (tmp_path / "..data_tmp").symlink_to(second.name)
+        os.replace(tmp_path / "..data_tmp", tmp_path / "..data")
+        assert _wait_for(lambda: _default_variant(flag_store) == "on")
+    finally:
+        file_watcher.shutdown()
+
+
+@pytest.mark.skipif(_load_libc() is None, reason="inotify not available")
+def test_file_watcher_waits_for_file_written_into_directory(tmp_path):
+    _write_flags(tmp_path / "a.json", {"a": _boolean_flag("off")})
+    emit_provider_error = Mock()
+    flag_store = FlagStore(Mock())
+    file_watcher = FileWatcher(
+        Config(offline_flag_source_path=str(tmp_path), offline_poll_interval_ms=60_000),
+        flag_store,
+        Mock(),
+        emit_provider_error,
+    )
+    file_watcher.initialize(None)
+    try:
+        content = json.dumps({"flags": {"b": _boolean_flag("on")}})
+        with open(tmp_path / "b.json", "w") as file:
+            file.write(content[:10])
+            file.flush()
+            time.sleep(0.2)
+            file.write(content[10:])
+        assert _wait_for(lambda: _default_variant_of(flag_store, "b") == "on")
+        emit_provider_error.assert_not_called()
+    finally:
+        file_watcher.shutdown()
+    file_watcher.thread.join(timeout=1)
+
+
+def test_file_watcher_polls_with_offline_poll_interval(tmp_path):
+    path = tmp_path / "flags.json"
+    path.write_text(_flag_file("off"))
+    with patch.object(InotifyFileEvents, "create", return_value=None):
+        file_watcher, flag_store = _start_watcher(str(path), 20)
+    try:
+        path.write_text(_flag_file("on"))
+        os.utime(path, (0, 0))
+        assert _wait_for(lambda: _default_variant(flag_store) == "on")
+    finally:
+        file_watcher.shutdown()
+    file_watcher.thread.join(timeout=1)
+    assert not file_watcher.thread.is_alive()
+
+
+def test_file_watcher_skips_unchanged_content(tmp_path):
+    path = tmp_path / "flags.json"
+    path.write_text(_flag_file("off"))
+    emit_provider_configuration_changed = Mock()
+    flag_store = FlagStore(emit_provider_configuration_changed)
+    flag_store.record_skipped_reload = Mock()  # type: ignore[method-assign]
+    file_watcher = FileWatcher(
+        Config(offline_flag_source_path=str(path)),
+        flag_store,
+        Mock(),
+        Mock(),
+    )
+    file_watcher._load_data()
+
+    path.write_text(_flag_file("off"))
+    os.utime(path, (1, 1))
+    file_watcher.safe_load_data()
+    flag_store.record_skipped_reload.assert_called_once_with()
+    assert emit_provider_configuration_changed.call_count == 1
+
+    path.write_text(_flag_file("on"))
+    os.utime(path, (2, 2))
+    file_watcher.safe_load_data()
+    flag_store.record_skipped_reload.assert_called_once_with()
+    assert emit_provider_configuration_changed.call_count == 2
+
+
+def _write_flags(path, flags: dict, metadata: dict | None = None) -> None:
+    path.write_text(json.dumps({"flags": flags, "metadata": metadata or {}}))
+
+
+def _boolean_flag(default_variant: str) -> dict:
+    return {
+        "state": "ENABLED",
+        "variants": {"on": True, "off": False},
+        "defaultVariant": default_variant,
+    }
+
+
+def test_file_watcher_merges_directory_and_files(tmp_path):
+    team_dir = tmp_path / "teams"
+    team_dir.mkdir()
+    _write_flags(team_dir / "a.json", {"shared": _boolean_flag("off")}, {"team": "a"})
+    _write_flags(team_dir / "b.json", {"shared": _boolean_flag("on")}, {"team": "b"})
+    (team_dir / "notes.txt").write_text("ignored")
+    override = tmp_path / "override.yaml"
+    override.write_text(yaml.safe_dump({"flags": {"override": _boolean_flag("on")}}))
+
+    flag_store = FlagStore()
+    file_watcher = FileWatcher(
+        Config(offline_flag_source_path=[str(team_dir), str(override)]),
+        flag_store,
+        Mock(),
+        Mock(),
+    )
+    file_watcher._load_data()
+
+    # later files in a directory take precedence
+    assert _default_variant_of(flag_store, "shared") == "on"
+    assert _default_variant_of(flag_store, "override") == "on"
+    assert flag_store.flag_set_metadata == {"team": "b"}
+
+
+def test_file_watcher_reparses_only_changed_file(tmp_path):
+    _write_flags(tmp_path / "a.json", {"a": _boolean_flag("off")})
+    _write_flags(tmp_path / "b.json", {"b": _boolean_flag("off")})
+    emit_provider_configuration_changed = Mock()
+    flag_store = FlagStore(emit_provider_configuration_changed)
+    file_watcher = FileWatcher(
+        Config(offline_flag_source_path=str(tmp_path)),
+        flag_store,
+        Mock(),
+        Mock(),
+    )
+    file_watcher._load_data()
+    unchanged = flag_store.get_flag("a")
+
+    _write_flags(tmp_path / "b.json", {"b": _boolean_flag("on")})
+    os.utime(tmp_path / "b.json", (1, 1))
+    with patch.object(FlagStore, "parse", wraps=FlagStore.parse) as parse:
+        file_watcher._load_data()
+
+    parse.assert_called_once()
+    assert flag_store.get_flag("a") is unchanged
+    assert _default_variant_of(flag_store, "b") == "on"
+    details = emit_provider_configuration_changed.call_args.args[0]
+    assert details.flags_changed == ["b"]
+
+    (tmp_path / "b.json").unlink()
+    file_watcher._load_data()
+    assert flag_store.get_flag("b") is None
+
+
+def test_provider_reports_sync_metrics_of_changed_files(tmp_path):
+    _write_flags(tmp_path / "a.json", {"a": _boolean_flag("off")})
+    _write_flags(tmp_path / "b.json", {"b": _boolean_flag("off")})
+    sink = Mock()
+    provider = FlagdProvider(
+        resolver_type=ResolverType.FILE,
+        offline_flag_source_path=str(tmp_path),
+        metrics_sink=sink,
+    )
+    assert provider.get_sync_metrics() is None
+    provider.resolver.connector._load_data()
+
+    metrics = provider.get_sync_metrics()
+    assert metrics is not None
+    sink.record_sync.assert_called_once_with(metrics)
+    assert metrics.payload_bytes == sum(
+        os.path.getsize(tmp_path / name) for name in ("a.json", "b.json")
+    )
+    assert metrics.changed_keys == 2
+    assert metrics.decode_seconds > 0
+    assert metrics.snapshot_age >= 0
+
+    _write_flags(tmp_path / "b.json", {"b": _boolean_flag("on")})
+    os.utime(tmp_path / "b.json", (1, 1))
+    provider.resolver.connector._load_data()
+
+    metrics = provider.get_sync_metrics()
+    assert metrics.payload_bytes == os.path.getsize(tmp_path / "b.json")
+    assert metrics.changed_keys == 1
+
+    os.utime(tmp_path / "b.json", (2, 2))
+    provider.resolver.connector._load_data()
+
+    skipped = provider.get_sync_metrics()
+    assert skipped.skipped_reloads == 1
+    assert skipped.applied_at == metrics.applied_at
+    sink.record_skipped_reload.assert_called_once_with(skipped)
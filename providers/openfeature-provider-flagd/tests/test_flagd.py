@@ -1,6 +1,8 @@
 from numbers import Number
+from unittest.mock import Mock
 
 from openfeature.contrib.provider.flagd import FlagdProvider
+from openfeature.event import ProviderEventDetails
 
 
 def test_should_get_boolean_flag_from_flagd(flagd_provider_client):
@@ -77,3 +79,19 @@ def test_get_metadata_returns_metadata_object_with_name():
     provider = FlagdProvider()
     metadata = provider.get_metadata()
     assert metadata.name == "FlagdProvider"
+
+
+def test_sync_metadata_context_is_built_once_per_update():
+    provider = FlagdProvider()
+    assert provider.get_provider_hooks() == []
+
+    provider.emit_provider_ready_with_context(ProviderEventDetails(), {"env": "prod"})
+
+    (hook,) = provider.get_provider_hooks()
+    context = hook.before(Mock(), {})
+    assert context is hook.before(Mock(), {})
+    assert context.attributes == {"env": "prod"}
+
+    provider.emit_provider_ready_with_context(ProviderEventDetails(), {})
+    assert provider.get_provider_hooks() == []
+    provider.shutdown()
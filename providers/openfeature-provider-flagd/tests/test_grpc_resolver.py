@@ -1,8 +1,13 @@
+import asyncio
+import threading
+import time
 import unittest
+from concurrent import futures
 from contextlib import suppress
 from unittest.mock import MagicMock, Mock, patch
 
 import grpc
+import pytest
 from grpc import Channel
 
 from openfeature.contrib.provider.flagd.config import CacheType, Config
@@ -11,7 +16,20 @@ from openfeature.contrib.provider.flagd.resolvers.grpc import (
     FLAGD_SELECTOR_HEADER,
     GrpcResolver,
 )
-from openfeature.schemas.protobuf.flagd.evaluation.v2 import evaluation_pb2
+from openfeature.contrib.provider.flagd.resolvers.scope import EvaluationScope
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.exception import FlagNotFoundError, TypeMismatchError
+from openfeature.flag_evaluation import Reason
+from openfeature.schemas.protobuf.flagd.evaluation.v1 import (
+    evaluation_pb2 as evaluation_v1_pb2,
+)
+from openfeature.schemas.protobuf.flagd.evaluation.v1 import (
+    evaluation_pb2_grpc as evaluation_v1_pb2_grpc,
+)
+from openfeature.schemas.protobuf.flagd.evaluation.v2 import (
+    evaluation_pb2,
+    evaluation_pb2_grpc,
+)
 
 
 class FakeRpcError(grpc.RpcError):
@@ -63,6 +81,83 @@ def test_unary_call_omits_metadata_when_no_selector():
     assert "metadata" not in kwargs
 
 
+def test_targeting_matches_cached_per_context_when_enabled():
+    resolver = GrpcResolver(
+        config=Config(host="localhost", port=8013, targeting_cache_ttl_ms=60000),
+        emit_provider_ready=Mock(),
+        emit_provider_error=Mock(),
+        emit_provider_stale=Mock(),
+        emit_provider_configuration_changed=Mock(),
+    )
+    resolver.stub = MagicMock()
+    resolver.stub.ResolveBoolean = Mock(
+        return_value=evaluation_pb2.ResolveBooleanResponse(
+            value=True, variant="on", reason=Reason.TARGETING_MATCH
+        )
+    )
+    alice = EvaluationContext("alice", {"plan": "pro"})
+
+    first = resolver._resolve("flag", FlagType.BOOLEAN, False, alice)
+    cached = resolver._resolve(
+        "flag", FlagType.BOOLEAN, False, EvaluationContext("alice", {"plan": "pro"})
+    )
+    resolver._resolve("flag", FlagType.BOOLEAN, False, EvaluationContext("bob"))
+
+    assert first.reason == Reason.TARGETING_MATCH
+    assert (cached.value, cached.reason) == (True, Reason.CACHED)
+    assert resolver.stub.ResolveBoolean.call_count == 2
+    resolver.handle_changed_flags({"flags": {"flag": {}}})
+    resolver._resolve("flag", FlagType.BOOLEAN, False, alice)
+    assert resolver.stub.ResolveBoolean.call_count == 3
+
+
+def test_targeting_matches_not_cached_by_default():
+    resolver = _make_resolver(None)
+    resolver.stub = MagicMock()
+    resolver.stub.ResolveBoolean = Mock(
+        return_value=evaluation_pb2.ResolveBooleanResponse(
+            value=True, variant="on", reason=Reason.TARGETING_MATCH
+        )
+    )
+
+    for _ in range(2):
+        resolver._resolve("flag", FlagType.BOOLEAN, False, EvaluationContext("a"))
+
+    assert resolver.stub.ResolveBoolean.call_count == 2
+
+
+def test_concurrent_async_evaluations_share_one_rpc():
+    resolver = _make_resolver(None)
+    aio_stub = MagicMock()
+    calls = []
+
+    async def resolve_boolean(request, **kwargs):
+        calls.append(request.flag_key)
+        await asyncio.sleep(0.05)
+        return evaluation_pb2.ResolveBooleanResponse(
+            value=True, variant="on", reason=Reason.TARGETING_MATCH
+        )
+
+    aio_stub.ResolveBoolean = resolve_boolean
+    resolver._aio_stub = Mock(return_value=aio_stub)
+    user = EvaluationContext("user", {"plan": "pro"})
+
+    async def scenario():
+        return await asyncio.gather(
+            *(
+                resolver.resolve_boolean_details_async("flag", False, user)
+                for _ in range(10)
+            ),
+            resolver.resolve_boolean_details_async("flag", False, EvaluationContext()),
+        )
+
+    results = asyncio.run(scenario())
+
+    assert calls == ["flag", "flag"]
+    assert all(details.value for details in results)
+    assert len({id(details) for details in results}) == len(results)
+
+
 def test_event_stream_includes_selector_metadata_when_configured():
     resolver = _make_resolver("test-selector")
     mock_stub = MagicMock()
@@ -91,6 +186,276 @@ def test_event_stream_omits_metadata_when_no_selector():
     assert "metadata" not in kwargs
 
 
+def test_channel_applies_compression_and_tuning_options():
+    config = Config(
+        host="localhost",
+        port=8013,
+        compression="gzip",
+        max_receive_message_length=64 * 1024 * 1024,
+        http2_window_size=8 * 1024 * 1024,
+    )
+    with patch("grpc.insecure_channel") as insecure_channel:
+        GrpcResolver(
+            config=config,
+            emit_provider_ready=Mock(),
+            emit_provider_error=Mock(),
+            emit_provider_stale=Mock(),
+            emit_provider_configuration_changed=Mock(),
+        )
+
+    kwargs = insecure_channel.call_args.kwargs
+    assert kwargs["compression"] == grpc.Compression.Gzip
+    options = dict(kwargs["options"])
+    assert options["grpc.max_receive_message_length"] == 64 * 1024 * 1024
+    assert options["grpc.http2.lookahead_bytes"] == 8 * 1024 * 1024
+    assert options["grpc.http2.bdp_probe"] == 0
+
+
+def test_channel_pool_spreads_evaluations_over_own_connections(evaluation_service):
+    config = Config(
+        host="localhost", port=evaluation_service.port, tls=False, channel_pool_size=3
+    )
+    with patch("grpc.insecure_channel", wraps=grpc.insecure_channel) as channels:
+        resolver = GrpcResolver(
+            config=config,
+            emit_provider_ready=Mock(),
+            emit_provider_error=Mock(),
+            emit_provider_stale=Mock(),
+            emit_provider_configuration_changed=Mock(),
+        )
+    try:
+        local_pools = [
+            ("grpc.use_local_subchannel_pool", 1) in call.kwargs["options"]
+            for call in channels.call_args_list
+        ]
+        assert local_pools == [False, True, True]
+        assert resolver.pool is not None
+        with resolver.pool.acquire() as busy:
+            assert busy.channel is resolver.channel
+            for _ in range(2):
+                with pytest.raises(FlagNotFoundError):
+                    resolver.resolve_boolean_details("missing-flag", False)
+        assert evaluation_service.calls == 2
+        assert resolver.pool.outstanding == [0, 0, 0]
+    finally:
+        resolver.shutdown()
+
+
+class FakeEvaluationService(evaluation_pb2_grpc.ServiceServicer):
+    def __init__(self):
+        self.calls = 0
+        self.delay = 0.0
+
+    def ResolveBoolean(self, request, context):  # noqa: N802
+        self.calls += 1
+        time.sleep(self.delay)
+        if request.flag_key != "static-flag":
+            context.abort(grpc.StatusCode.NOT_FOUND, "flag not found")
+        return evaluation_pb2.ResolveBooleanResponse(
+            value=True, variant="on", reason=Reason.STATIC
+        )
+
+
+class FakeBulkEvaluationService(evaluation_v1_pb2_grpc.ServiceServicer):
+    def __init__(self):
+        self.contexts = []
+
+    def ResolveAll(self, request, context):  # noqa: N802
+        self.contexts.append(dict(request.context))
+        match = Reason.TARGETING_MATCH
+        return evaluation_v1_pb2.ResolveAllResponse(
+            flags={
+                "bool-flag": evaluation_v1_pb2.AnyFlag(
+                    bool_value=True, variant="on", reason=match
+                ),
+                "int-flag": evaluation_v1_pb2.AnyFlag(
+                    double_value=3, variant="three", reason=match
+                ),
+                "string-flag": evaluation_v1_pb2.AnyFlag(
+                    string_value="blue", variant="blue", reason=match
+                ),
+            }
+        )
+
+
+def _start_evaluation_server(service, bulk_service=None):
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    evaluation_pb2_grpc.add_ServiceServicer_to_server(service, server)
+    if bulk_service is not None:
+        evaluation_v1_pb2_grpc.add_ServiceServicer_to_server(bulk_service, server)
+    service.port = server.add_insecure_port("localhost:0")
+    server.start()
+    return server
+
+
+@pytest.fixture
+def evaluation_service():
+    service = FakeEvaluationService()
+    service.bulk = FakeBulkEvaluationService()
+    server = _start_evaluation_server(service, service.bulk)
+    yield service
+    server.stop(None)
+
+
+def _resolver_for(service) -> GrpcResolver:
+    return GrpcResolver(
+        config=Config(host="localhost", port=service.port, tls=False),
+        emit_provider_ready=Mock(),
+        emit_provider_error=Mock(),
+        emit_provider_stale=Mock(),
+        emit_provider_configuration_changed=Mock(),
+    )
+
+
+def test_async_resolve_uses_aio_channel_and_cache(evaluation_service):
+    resolver = _resolver_for(evaluation_service)
+    resolver.stub = Mock()
+
+    async def scenario():
+        try:
+            first = await resolver.resolve_boolean_details_async("static-flag", False)
+            assert first.value is True
+            assert first.variant == "on"
+            cached = await asyncio.gather(
+                *(
+                    resolver.resolve_boolean_details_async("static-flag", False)
+                    for _ in range(10)
+                )
+            )
+            assert all(details.reason == Reason.CACHED for details in cached)
+            with pytest.raises(FlagNotFoundError):
+                await resolver.resolve_boolean_details_async("missing-flag", False)
+        finally:
+            await resolver.shutdown_async()
+
+    asyncio.run(scenario())
+
+    assert evaluation_service.calls == 2
+    resolver.stub.ResolveBoolean.assert_not_called()
+    stats = resolver.get_cache_stats()
+    assert stats is not None
+    assert (stats.hits, stats.misses) == (10, 2)
+
+
+def test_async_evaluations_on_several_loops_use_own_channels(evaluation_service):
+    evaluation_service.delay = 0.2
+    resolver = GrpcResolver(
+        config=Config(
+            host="localhost",
+            port=evaluation_service.port,
+            tls=False,
+            cache=CacheType.DISABLED,
+        ),
+        emit_provider_ready=Mock(),
+        emit_provider_error=Mock(),
+        emit_provider_stale=Mock(),
+        emit_provider_configuration_changed=Mock(),
+    )
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever)
+    thread.start()
+
+    async def scenario():
+        in_flight = asyncio.run_coroutine_threadsafe(
+            resolver.resolve_boolean_details_async("static-flag", False), other_loop
+        )
+        await asyncio.sleep(0.05)
+        details = await resolver.resolve_boolean_details_async("static-flag", False)
+        # the evaluation on the other loop keeps its channel
+        assert (await asyncio.wrap_future(in_flight)).value is True
+        assert len(resolver._aio_channels) == 2
+        await resolver.shutdown_async()
+        return details
+
+    try:
+        assert asyncio.run(scenario()).value is True
+        assert not resolver._aio_channels
+        # the other channel is closed on its own loop
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0.1), other_loop).result()
+        assert not resolver._aio_close_tasks
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join(timeout=1)
+        other_loop.close()
+    assert evaluation_service.calls == 2
+
+
+def test_scope_serves_evaluations_from_one_resolve_all(evaluation_service):
+    resolver = _resolver_for(evaluation_service)
+    user = EvaluationContext("user-1", {"plan": "pro"})
+    try:
+        with EvaluationScope(resolver) as scope:
+            assert resolver.resolve_boolean_details("bool-flag", False, user).value
+            assert resolver.resolve_integer_details("int-flag", 0, user).value == 3
+            details = resolver.resolve_string_details("string-flag", "red", user)
+            assert (details.value, details.variant) == ("blue", "blue")
+            with pytest.raises(TypeMismatchError):
+                resolver.resolve_string_details("bool-flag", "red", user)
+            # flags missing from the bulk result are evaluated one by one
+            assert resolver.resolve_boolean_details("static-flag", False, user).value
+            resolver.resolve_boolean_details("bool-flag", False, EvaluationContext())
+            assert scope.snapshot_count == 2
+
+        assert len(evaluation_service.bulk.contexts) == 2
+        assert evaluation_service.bulk.contexts[0] == {
+            "targetingKey": "user-1",
+            "plan": "pro",
+        }
+        assert evaluation_service.calls == 1
+        with pytest.raises(FlagNotFoundError):
+            resolver.resolve_boolean_details("bool-flag", False, user)
+    finally:
+        resolver.shutdown()
+
+
+def test_concurrent_scope_evaluations_share_one_resolve_all(evaluation_service):
+    resolver = _resolver_for(evaluation_service)
+    user = EvaluationContext("user-1", {"plan": "pro"})
+
+    async def scenario():
+        try:
+            with EvaluationScope(resolver) as scope:
+                results = await asyncio.gather(
+                    *(
+                        resolver.resolve_boolean_details_async("bool-flag", False, user)
+                        for _ in range(20)
+                    )
+                )
+                assert scope.snapshot_count == 1
+            return results
+        finally:
+            await resolver.shutdown_async()
+
+    results = asyncio.run(scenario())
+
+    assert all(details.value for details in results)
+    assert len(evaluation_service.bulk.contexts) == 1
+
+
+def test_async_scope_falls_back_without_resolve_all():
+    service = FakeEvaluationService()
+    server = _start_evaluation_server(service)
+    resolver = _resolver_for(service)
+
+    async def scenario():
+        try:
+            with EvaluationScope(resolver):
+                for _ in range(2):
+                    details = await resolver.resolve_boolean_details_async(
+                        "static-flag", False
+                    )
+                    assert details.value
+        finally:
+            await resolver.shutdown_async()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        server.stop(None)
+    # the second evaluation is served from the cache
+    assert service.calls == 1
+
+
 class TestGrpcResolver(unittest.TestCase):
     def setUp(self):
         config = Config(
@@ -144,6 +509,25 @@ class TestGrpcResolver(unittest.TestCase):
 
         wait_before_reconnect.assert_called_once()
 
+    def test_connect_returns_once_provider_ready_arrives(self):
+        self.grpc_resolver.deadline = 5
+        self.grpc_resolver.channel.subscribe.side_effect = (
+            lambda callback, try_to_connect: callback(grpc.ChannelConnectivity.READY)
+        )
+        self.grpc_resolver.stub.EventStream = Mock(
+            return_value=iter(
+                [evaluation_pb2.EventStreamResponse(type="provider_ready")]
+            )
+        )
+
+        start = time.monotonic()
+        self.grpc_resolver.connect()
+        elapsed = time.monotonic() - start
+        self.grpc_resolver.shutdown()
+
+        self.assertTrue(self.grpc_resolver.connected)
+        self.assertLess(elapsed, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,9 @@
+import os
+import tempfile
 import threading
 import time
 import unittest
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import ANY, MagicMock, Mock, patch
 
 import grpc
 from google.protobuf.json_format import MessageToDict
@@ -12,8 +14,12 @@ from openfeature.contrib.provider.flagd.config import Config
 from openfeature.contrib.provider.flagd.resolvers.process.connector.grpc_watcher import (
     GrpcWatcher,
 )
+from openfeature.contrib.provider.flagd.resolvers.process.connector.sync_cache import (
+    SyncCache,
+)
 from openfeature.contrib.provider.flagd.resolvers.process.flags import FlagStore
 from openfeature.event import ProviderEventDetails
+from openfeature.exception import ProviderFatalError
 from openfeature.schemas.protobuf.flagd.sync.v1.sync_pb2 import (
     GetMetadataResponse,
     SyncFlagsResponse,
@@ -29,24 +35,29 @@ class FakeRpcError(grpc.RpcError):
         return "stream unavailable"
 
 
+def mock_config() -> Mock:
+    config = Mock(spec=Config)
+    config.retry_backoff_ms = 1000
+    config.retry_backoff_max_ms = 5000
+    config.retry_grace_period = 5
+    config.stream_deadline_ms = 1000
+    config.deadline_ms = 5000
+    config.selector = None
+    config.provider_id = None
+    config.tls = False
+    config.cert_path = None
+    config.channel_credentials = None
+    config.host = "localhost"
+    config.port = 5000
+    config.sync_metadata_disabled = False
+    config.fatal_status_codes = []
+    config.sync_cache_path = None
+    return config
+
+
 class TestGrpcWatcher(unittest.TestCase):
     def setUp(self):
-        config = Mock(spec=Config)
-        config.retry_backoff_ms = 1000
-        config.retry_backoff_max_ms = 5000
-        config.retry_grace_period = 5
-        config.stream_deadline_ms = 1000
-        config.deadline_ms = 5000
-        config.selector = None
-        config.provider_id = None
-        config.tls = False
-        config.cert_path = None
-        config.channel_credentials = None
-        config.host = "localhost"
-        config.port = 5000
-        config.sync_metadata_disabled = False
-        config.fatal_status_codes = []
-
+        config = mock_config()
         flag_store = Mock(spec=FlagStore)
         flag_store.update.return_value = None
         emit_provider_error = Mock()
@@ -72,6 +83,8 @@ class TestGrpcWatcher(unittest.TestCase):
         self.mock_stub.GetMetadata = Mock(return_value=self.mock_metadata)
         self.grpc_watcher.stub = self.mock_stub
         self.grpc_watcher.active = True
+        # connect() starts the apply worker, tests drive the watcher directly
+        self.grpc_watcher._start_apply_thread()
 
     def provider_ready(self, details: ProviderEventDetails, context: dict):
         self.provider_done = True
@@ -152,11 +165,25 @@ class TestGrpcWatcher(unittest.TestCase):
         with patch.object(
             self.grpc_watcher,
             "_wait_before_reconnect",
-            side_effect=lambda: setattr(self.grpc_watcher, "active", False),
+            side_effect=lambda _: setattr(self.grpc_watcher, "active", False),
         ) as wait_before_reconnect:
             self.grpc_watcher.listen()
 
-        wait_before_reconnect.assert_called_once()
+        # nothing was received, so the stream did not merely expire
+        wait_before_reconnect.assert_called_once_with(False)
+
+    def test_reconnect_backoff_grows_until_a_response_arrives(self):
+        self.grpc_watcher._shutdown_event.set()
+        self.grpc_watcher._wait_before_reconnect()
+        self.grpc_watcher._wait_before_reconnect()
+        self.assertEqual(self.grpc_watcher.backoff.state().attempts, 2)
+        self.assertEqual(self.grpc_watcher.backoff.state().ceiling_seconds, 4)
+
+        self.grpc_watcher._handle_flag_response(
+            SyncFlagsResponse(flag_configuration='{"flags": {}}'), None
+        )
+
+        self.assertEqual(self.grpc_watcher.backoff.state().attempts, 0)
 
     def test_listen_backs_off_after_stream_completion(self):
         self.mock_stub.SyncFlags = Mock(return_value=iter([]))
@@ -164,11 +191,12 @@ class TestGrpcWatcher(unittest.TestCase):
         with patch.object(
             self.grpc_watcher,
             "_wait_before_reconnect",
-            side_effect=lambda: setattr(self.grpc_watcher, "active", False),
+            side_effect=lambda _: setattr(self.grpc_watcher, "active", False),
         ) as wait_before_reconnect:
             self.grpc_watcher.listen()
 
-        wait_before_reconnect.assert_called_once()
+        # nothing was received, so the stream did not merely expire
+        wait_before_reconnect.assert_called_once_with(False)
 
     def test_selector_passed_via_both_metadata_and_body(self):
         """Test that selector is passed via both gRPC metadata header and request body for backward compatibility"""
@@ -197,3 +225,150 @@ class TestGrpcWatcher(unittest.TestCase):
         self.assertIn("metadata", kwargs)
         metadata = kwargs["metadata"]
         self.assertEqual(metadata, (("flagd-selector", "test-selector"),))
+
+    def test_identical_payloads_are_applied_once(self):
+        self.mock_stub.SyncFlags = Mock(
+            return_value=iter(
+                [
+                    SyncFlagsResponse(flag_configuration='{"flags": {}}'),
+                    SyncFlagsResponse(flag_configuration='{"flags": {}}'),
+                ]
+            )
+        )
+
+        self.run_listen_and_shutdown_after()
+        self.grpc_watcher.apply_thread.join(timeout=0.5)
+
+        self.grpc_watcher.flag_store.update.assert_called_once_with(
+            {"flags": {}}, payload_bytes=len(b'{"flags": {}}'), decode_seconds=ANY
+        )
+
+    def test_superseded_payloads_are_dropped(self):
+        applying = threading.Event()
+        release = threading.Event()
+        applied = []
+
+        def update(data, **metrics):
+            applied.append(data)
+            applying.set()
+            release.wait(timeout=1)
+
+        self.grpc_watcher.flag_store.update.side_effect = update
+        self.grpc_watcher._submit('{"revision": 1}', {})
+        self.assertTrue(applying.wait(timeout=1))
+        self.grpc_watcher._submit('{"revision": 2}', None)
+        self.grpc_watcher._submit('{"revision": 3}', None)
+        release.set()
+
+        self.grpc_watcher.shutdown()
+        self.grpc_watcher.apply_thread.join(timeout=1)
+        self.assertEqual(applied, [{"revision": 1}, {"revision": 3}])
+        self.assertTrue(self.provider_done)
+
+    def test_apply_worker_survives_unexpected_errors(self):
+        self.grpc_watcher.flag_store.update.side_effect = [OSError("disk"), None]
+        self.grpc_watcher._submit('{"revision": 1}', {})
+        for _i in range(100):
+            if self.grpc_watcher.flag_store.update.call_count:
+                break
+            time.sleep(0.01)
+        self.grpc_watcher._submit('{"revision": 2}', {})
+        for _i in range(100):
+            if self.provider_done:
+                break
+            time.sleep(0.01)
+
+        self.assertTrue(self.provider_done)
+        self.assertTrue(self.grpc_watcher.apply_thread.is_alive())
+        self.grpc_watcher.shutdown()
+
+    def test_invalid_payload_does_not_mark_connected(self):
+        self.grpc_watcher._submit("not json", {})
+        self.grpc_watcher.shutdown()
+        self.grpc_watcher.apply_thread.join(timeout=1)
+
+        self.grpc_watcher.flag_store.update.assert_not_called()
+        self.assertFalse(self.grpc_watcher.connected)
+        self.assertFalse(self.provider_done)
+
+    def test_applied_payload_is_persisted_to_sync_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = SyncCache(os.path.join(directory, "flags.cache"), "localhost:5000")
+            self.grpc_watcher.sync_cache = cache
+            self.grpc_watcher._apply('{"flags": {}}', {"attribute": "value"})
+
+            self.assertEqual(cache.load(), ('{"flags": {}}', {"attribute": "value"}))
+            self.assertEqual(os.listdir(directory), ["flags.cache"])
+
+    def test_connect_serves_sync_cache_before_stream_connects(self):
+        emit_provider_stale = Mock()
+        self.grpc_watcher.emit_provider_stale = emit_provider_stale
+        with tempfile.TemporaryDirectory() as directory:
+            cache = SyncCache(os.path.join(directory, "flags.cache"), "localhost:5000")
+            cache.store('{"flags": {}}', {"attribute": "cached"})
+            self.grpc_watcher.sync_cache = cache
+
+            self.grpc_watcher.connect()
+
+        self.grpc_watcher.flag_store.update.assert_called_once_with(
+            {"flags": {}}, payload_bytes=len(b'{"flags": {}}'), decode_seconds=ANY
+        )
+        self.assertTrue(self.provider_done)
+        self.assertEqual(self.context, {"attribute": "cached"})
+        # stale right away, without waiting for the deadline
+        emit_provider_stale.assert_called_once()
+
+        # the same configuration from the stream only reconciles the status
+        self.provider_done = False
+        self.grpc_watcher._apply('{"flags": {}}', {"attribute": "live"})
+        self.grpc_watcher.flag_store.update.assert_called_once()
+        self.assertTrue(self.provider_done)
+        self.assertEqual(self.context, {"attribute": "live"})
+        self.grpc_watcher.shutdown()
+
+    def test_connect_returns_once_first_payload_is_applied(self):
+        threading.Timer(
+            0.05, self.grpc_watcher._submit, args=('{"flags": {}}', {})
+        ).start()
+
+        start = time.monotonic()
+        self.grpc_watcher.connect()
+        elapsed = time.monotonic() - start
+        self.grpc_watcher.shutdown()
+
+        self.assertTrue(self.grpc_watcher.connected)
+        # the configured deadline is 5 seconds
+        self.assertLess(elapsed, 1)
+
+    def test_connect_fails_fast_on_fatal_status(self):
+        self.grpc_watcher.config.fatal_status_codes = ["UNAVAILABLE"]
+        threading.Timer(
+            0.05, self.grpc_watcher._handle_rpc_error, args=(FakeRpcError(),)
+        ).start()
+
+        start = time.monotonic()
+        with self.assertRaises(ProviderFatalError):
+            self.grpc_watcher.connect()
+        self.assertLess(time.monotonic() - start, 1)
+
+
+class TestSyncCache(unittest.TestCase):
+    def test_missing_or_corrupt_cache_is_ignored(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "flags.cache")
+            self.assertIsNone(SyncCache(path, "localhost:8015").load())
+            with open(path, "w") as file:
+                file.write("{not json")
+            self.assertIsNone(SyncCache(path, "localhost:8015").load())
+
+    def test_cache_of_another_target_or_selector_is_ignored(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "flags.cache")
+            SyncCache(path, "localhost:8015", "team-a").store('{"flags": {}}', {})
+
+            self.assertIsNone(SyncCache(path, "localhost:8016", "team-a").load())
+            self.assertIsNone(SyncCache(path, "localhost:8015").load())
+            self.assertEqual(
+                SyncCache(path, "localhost:8015", "team-a").load(),
+                ('{"flags": {}}', {}),
+            )
@@ -40,13 +40,16 @@ def context(targeting_key):
 
 @pytest.fixture
 def config():
-    return create_autospec(Config)
+    config = create_autospec(Config)
+    config.metrics_sink = None
+    return config
 
 
 @pytest.fixture
 def resolver(config):
     config.offline_flag_source_path = "flag.json"
     config.deadline_ms = 100
+    config.offline_poll_interval_ms = 100
     return InProcessResolver(
         config=config,
         emit_provider_ready=Mock(),
@@ -56,6 +59,31 @@ def resolver(config):
     )
 
 
+def test_connector_update_passes_parsed_data_through(config):
+    config.offline_flag_source_path = "flag.json"
+    config.deadline_ms = 100
+    config.offline_poll_interval_ms = 100
+    emit_provider_configuration_changed = Mock()
+    resolver = InProcessResolver(
+        config=config,
+        emit_provider_ready=Mock(),
+        emit_provider_error=Mock(),
+        emit_provider_stale=Mock(),
+        emit_provider_configuration_changed=emit_provider_configuration_changed,
+    )
+    resolver.evaluator = Mock(wraps=resolver.evaluator)
+    resolver.connector.flag_store.evaluator = resolver.evaluator
+    flags = _flag_config(variants={"default_variant": True})
+
+    resolver.connector.flag_store.update(flags)
+
+    resolver.evaluator.set_flags_and_get_changed_keys.assert_called_once_with(
+        flags, payload_bytes=None, decode_seconds=0.0
+    )
+    details = emit_provider_configuration_changed.call_args.args[0]
+    assert details.flags_changed == ["flag"]
+
+
 def test_resolve_boolean_details_flag_not_found(resolver):
     with pytest.raises(FlagNotFoundError):
         resolver.resolve_boolean_details("nonexistent_flag", False)
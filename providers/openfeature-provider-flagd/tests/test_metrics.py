@@ -0,0 +1,57 @@
+from unittest.mock import Mock
+
+import pytest
+
+from openfeature.contrib.tools.flagd.core.metrics import SyncMetrics
+
+pytest.importorskip("opentelemetry.metrics")
+
+from openfeature.contrib.provider.flagd.metrics import (
+    OpenTelemetryMetricsSink,
+)
+
+
+def test_records_sync_metrics_with_opentelemetry():
+    instruments: dict[str, Mock] = {}
+    meter = Mock()
+    meter.create_histogram.side_effect = lambda name, **kwargs: instruments.setdefault(
+        name, Mock()
+    )
+    sink = OpenTelemetryMetricsSink(meter)
+    (observe,) = meter.create_observable_gauge.call_args.kwargs["callbacks"]
+    assert list(observe(Mock())) == []
+
+    sink.record_sync(
+        SyncMetrics(
+            payload_bytes=128,
+            decode_seconds=0.002,
+            update_seconds=0.001,
+            changed_keys=3,
+            applied_at=0.0,
+        )
+    )
+
+    instruments["flagd.sync.payload.size"].record.assert_called_once_with(128)
+    instruments["flagd.sync.decode.duration"].record.assert_called_once_with(0.002)
+    instruments["flagd.sync.update.duration"].record.assert_called_once_with(0.001)
+    instruments["flagd.sync.changed_keys"].record.assert_called_once_with(3)
+    (age,) = observe(Mock())
+    assert age.value > 0
+
+
+def test_counts_skipped_reloads_with_opentelemetry():
+    meter = Mock()
+    sink = OpenTelemetryMetricsSink(meter)
+
+    sink.record_skipped_reload(
+        SyncMetrics(
+            payload_bytes=128,
+            decode_seconds=0.002,
+            update_seconds=0.001,
+            changed_keys=3,
+            applied_at=0.0,
+            skipped_reloads=1,
+        )
+    )
+
+    meter.create_counter.return_value.add.assert_called_once_with(1)
@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import time
+from concurrent import futures
+
+import pytest
+
+from openfeature.contrib.provider.flagd.resolvers.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_result():
+    flights = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def call():
+        calls.append(1)
+        release.wait(timeout=5)
+        return object()
+
+    with futures.ThreadPoolExecutor(max_workers=8) as executor:
+        results = [executor.submit(flights.do, "key", call) for _ in range(8)]
+        time.sleep(0.2)
+        release.set()
+        shared = {f.result() for f in results}
+
+    assert len(calls) == 1
+    assert len(shared) == 1
+    assert flights.do("key", lambda: "next") == "next"
+
+
+def test_waiters_share_the_exception():
+    flights = SingleFlight()
+    release = threading.Event()
+
+    def fail():
+        release.wait(timeout=5)
+        raise ValueError("unavailable")
+
+    with futures.ThreadPoolExecutor(max_workers=3) as executor:
+        results = [executor.submit(flights.do, "key", fail) for _ in range(3)]
+        time.sleep(0.2)
+        release.set()
+        errors = []
+        for result in results:
+            with pytest.raises(ValueError, match="unavailable") as raised:
+                result.result()
+            errors.append(raised.value)
+
+    # every caller raises its own exception, caused by the single failure
+    assert len({id(error) for error in errors}) == 3
+    assert len({id(error.__cause__ or error) for error in errors}) == 1
+
+
+def test_calls_after_forget_do_not_join_earlier_ones():
+    flights = SingleFlight()
+    release = threading.Event()
+
+    def stale():
+        release.wait(timeout=5)
+        return "stale"
+
+    with futures.ThreadPoolExecutor(max_workers=1) as executor:
+        earlier = executor.submit(flights.do, "key", stale)
+        time.sleep(0.1)
+        flights.forget()
+        assert flights.do("key", lambda: "fresh") == "fresh"
+        release.set()
+        assert earlier.result() == "stale"
+
+    def call(value):
+        async def resolve():
+            await asyncio.sleep(0.01)
+            return value
+
+        return resolve
+
+    async def scenario():
+        earlier = asyncio.ensure_future(flights.do_async("key", call("stale")))
+        await asyncio.sleep(0)
+        flights.forget()
+        return await asyncio.gather(earlier, flights.do_async("key", call("fresh")))
+
+    assert asyncio.run(scenario()) == ["stale", "fresh"]
+
+
+def test_async_calls_survive_cancelled_caller():
+    flights = SingleFlight()
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    async def scenario():
+        first = asyncio.ensure_future(flights.do_async("key", call))
+        others = [flights.do_async("key", call) for _ in range(5)]
+        await asyncio.sleep(0)
+        first.cancel()
+        return await asyncio.gather(*others)
+
+    assert asyncio.run(scenario()) == [1] * 5
+    assert calls == [1]
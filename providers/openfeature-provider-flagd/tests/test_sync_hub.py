@@ -0,0 +1,131 @@
+import json
+import threading
+from concurrent import futures
+from unittest.mock import Mock
+
+import grpc
+import pytest
+
+from openfeature.contrib.provider.flagd.config import Config, ResolverType
+from openfeature.contrib.provider.flagd.resolvers.in_process import InProcessResolver
+from openfeature.contrib.provider.flagd.resolvers.process.connector.sync_hub import (
+    SharedSyncConnector,
+    sync_hub,
+)
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.schemas.protobuf.flagd.sync.v1 import sync_pb2, sync_pb2_grpc
+
+
+def _flags(default_variant: str) -> str:
+    return json.dumps(
+        {
+            "flags": {
+                "basic-flag": {
+                    "state": "ENABLED",
+                    "variants": {"on": True, "off": False},
+                    "defaultVariant": default_variant,
+                }
+            }
+        }
+    )
+
+
+class FakeSyncService(sync_pb2_grpc.FlagSyncServiceServicer):
+    def __init__(self):
+        self.selectors: list[str] = []
+        self.next_payload = _flags("on")
+        self.stop = threading.Event()
+
+    def SyncFlags(self, request, context):  # noqa: N802
+        self.selectors.append(request.selector)
+        sent = None
+        while not self.stop.is_set() and context.is_active():
+            if self.next_payload != sent:
+                sent = self.next_payload
+                yield sync_pb2.SyncFlagsResponse(flag_configuration=sent)
+            self.stop.wait(0.01)
+
+
+@pytest.fixture
+def service():
+    service = FakeSyncService()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    sync_pb2_grpc.add_FlagSyncServiceServicer_to_server(service, server)
+    service.port = server.add_insecure_port("localhost:0")
+    server.start()
+    yield service
+    service.stop.set()
+    server.stop(None)
+
+
+def _resolver(port: int, selector: str | None = None) -> InProcessResolver:
+    config = Config(
+        host="localhost",
+        port=port,
+        resolver=ResolverType.IN_PROCESS,
+        deadline_ms=2000,
+        selector=selector,
+        sync_metadata_disabled=True,
+        shared_sync=True,
+    )
+    return InProcessResolver(config, Mock(), Mock(), Mock(), Mock())
+
+
+def _wait_for(condition) -> None:
+    for _ in range(200):
+        if condition():
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError("condition not met")
+
+
+def test_providers_with_same_target_and_selector_share_one_stream(service):
+    first, second = _resolver(service.port), _resolver(service.port)
+    assert isinstance(first.connector, SharedSyncConnector)
+
+    first.initialize(EvaluationContext())
+    second.initialize(EvaluationContext())
+    try:
+        assert service.selectors == [""]
+        assert sync_hub.stream_count == 1
+        assert sync_hub.channel_count == 1
+        for resolver in (first, second):
+            assert resolver.resolve_boolean_details("basic-flag", False).value
+            resolver.connector.emit_provider_ready.assert_called_once()
+
+        service.next_payload = _flags("off")
+        for resolver in (first, second):
+            _wait_for(
+                lambda r=resolver: (
+                    r.resolve_boolean_details("basic-flag", True).value is False
+                )
+            )
+    finally:
+        first.shutdown()
+        second.shutdown()
+
+    assert sync_hub.stream_count == 0
+    assert sync_hub.channel_count == 0
+
+
+def test_selectors_get_own_stream_on_shared_channel(service):
+    first = _resolver(service.port, selector="a")
+    second = _resolver(service.port, selector="b")
+
+    first.initialize(EvaluationContext())
+    second.initialize(EvaluationContext())
+    try:
+        assert sorted(service.selectors) == ["a", "b"]
+        assert sync_hub.stream_count == 2
+        assert sync_hub.channel_count == 1
+
+        first.shutdown()
+        assert sync_hub.stream_count == 1
+        assert sync_hub.channel_count == 1
+        assert second.resolve_boolean_details("basic-flag", False).value
+    finally:
+        first.shutdown()
+        second.shutdown()
+
+    assert sync_hub.stream_count == 0
+    assert sync_hub.channel_count == 0
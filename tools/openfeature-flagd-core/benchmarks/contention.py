@@ -0,0 +1,205 @@
+"""Evaluation throughput and latency of FlagdCore under concurrent syncs.
+
+N evaluator threads resolve flags against a single FlagdCore while a writer
+thread applies ``set_flags_and_get_changed_keys`` at a fixed rate, alternating
+between two configurations so every sync changes flags. Throughput and
+p50/p99/p99.9 latencies are reported per thread count.
+
+    python benchmarks/contention.py --threads 1,2,4,8 --duration 5 --sync-rate 10
+"""
+
+import argparse
+import copy
+import json
+import platform
+import random
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+
+from openfeature.contrib.tools.flagd.core import FlagdCore
+from openfeature.evaluation_context import EvaluationContext
+
+
+@dataclass
+class Result:
+    threads: int
+    evaluations: int
+    syncs: int
+    throughput: float
+    p50_us: float
+    p99_us: float
+    p999_us: float
+
+
+def build_configuration(flag_count: int, revision: int) -> dict:
+    flags = {}
+    for i in range(flag_count):
+        key = f"flag-{i}"
+        if i % 3 == 0:
+            targeting: dict | None = {
+                "fractional": [["on", 50 + revision], ["off", 50 - revision]]
+            }
+        elif i % 3 == 1:
+            targeting = {
+                "if": [
+                    {
+                        "or": [
+                            {
+                                "sem_ver": [
+                                    {"var": "version"},
+                                    ">=",
+                                    f"{revision + 1}.0.0",
+                                ]
+                            },
+                            {
+                                "in": [
+                                    {"var": "email"},
+                                    ["a@example.com", "b@example.com"],
+                                ]
+                            },
+                        ]
+                    },
+                    "on",
+                    "off",
+                ]
+            }
+        else:
+            targeting = None
+        flags[key] = {
+            "state": "ENABLED",
+            "variants": {"on": True, "off": False},
+            "defaultVariant": "on" if revision % 2 else "off",
+            **({"targeting": targeting} if targeting else {}),
+        }
+    return {"flags": flags, "metadata": {"revision": revision}}
+
+
+def percentile(latencies: list[int], quantile: float) -> float:
+    if not latencies:
+        # a short run may not sample every bucket
+        return float("nan")
+    index = min(len(latencies) - 1, int(quantile * len(latencies)))
+    return latencies[index] / 1000
+
+
+class ContentionBenchmark:
+    def __init__(
+        self,
+        threads: int,
+        sync_rate: float,
+        flag_count: int,
+        configurations: list[dict],
+        seed: int,
+    ) -> None:
+        self.threads = threads
+        self.sync_rate = sync_rate
+        self.keys = [f"flag-{i}" for i in range(flag_count)]
+        self.configurations = configurations
+        self.seed = seed
+        self.core = FlagdCore()
+        self.core.set_flags(copy.deepcopy(configurations[0]))
+        self.stop = threading.Event()
+        self.start = threading.Barrier(threads + (1 if sync_rate > 0 else 0))
+        self.latencies: list[list[int]] = [[] for _ in range(threads)]
+        self.syncs = 0
+
+    def evaluate(self, index: int) -> None:
+        rng = random.Random(self.seed + index)  # noqa: S311
+        contexts = [
+            EvaluationContext(
+                f"user-{i}", {"version": f"{i % 4}.0.0", "email": f"{i}@example.com"}
+            )
+            for i in range(256)
+        ]
+        samples = self.latencies[index]
+        self.start.wait()
+        while not self.stop.is_set():
+            key = rng.choice(self.keys)
+            ctx = rng.choice(contexts)
+            begin = time.perf_counter_ns()
+            self.core.resolve_boolean_value(key, False, ctx)
+            samples.append(time.perf_counter_ns() - begin)
+
+    def write(self) -> None:
+        interval = 1 / self.sync_rate
+        self.start.wait()
+        while not self.stop.wait(interval):
+            # the store takes ownership of the parsed configuration, so hand
+            # it a fresh copy made outside the measured section
+            configuration = copy.deepcopy(self.configurations[(self.syncs + 1) % 2])
+            self.core.set_flags_and_get_changed_keys(configuration)
+            self.syncs += 1
+
+    def run(self, duration: float) -> Result:
+        workers = [
+            threading.Thread(target=self.evaluate, args=(i,), daemon=True)
+            for i in range(self.threads)
+        ]
+        if self.sync_rate > 0:
+            workers.append(threading.Thread(target=self.write, daemon=True))
+        for worker in workers:
+            worker.start()
+
+        time.sleep(duration)
+        self.stop.set()
+        for worker in workers:
+            worker.join()
+
+        merged = sorted(sample for samples in self.latencies for sample in samples)
+        return Result(
+            threads=self.threads,
+            evaluations=len(merged),
+            syncs=self.syncs,
+            throughput=len(merged) / duration,
+            p50_us=percentile(merged, 0.5),
+            p99_us=percentile(merged, 0.99),
+            p999_us=percentile(merged, 0.999),
+        )
+
+
+def interpreter() -> str:
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    return (
+        f"{platform.python_implementation()} {platform.python_version()} "
+        f"({'GIL' if gil_enabled else 'free-threaded'})"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", default="1,2,4,8", help="comma separated")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per run")
+    parser.add_argument("--sync-rate", type=float, default=10.0, help="syncs/second")
+    parser.add_argument("--flags", type=int, default=100, help="flags per config")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="emit JSON lines")
+    args = parser.parse_args()
+
+    configurations = [build_configuration(args.flags, revision) for revision in (0, 1)]
+    thread_counts = [int(count) for count in args.threads.split(",")]
+
+    if not args.json:
+        print(interpreter())  # noqa: T201
+        print(  # noqa: T201
+            f"{'threads':>7} {'evals/s':>12} {'p50 us':>9} {'p99 us':>9} "
+            f"{'p99.9 us':>9} {'syncs':>6}"
+        )
+    for threads in thread_counts:
+        benchmark = ContentionBenchmark(
+            threads, args.sync_rate, args.flags, configurations, args.seed
+        )
+        result = benchmark.run(args.duration)
+        if args.json:
+            print(json.dumps({"interpreter": interpreter(), **asdict(result)}))  # noqa: T201
+        else:
+            print(  # noqa: T201
+                f"{result.threads:>7} {result.throughput:>12,.0f} "
+                f"{result.p50_us:>9.1f} {result.p99_us:>9.1f} "
+                f"{result.p999_us:>9.1f} {result.syncs:>6}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
+import dataclasses
 import json
+import logging
 import threading
+import time
 import typing
 from collections.abc import Mapping, Sequence
 
@@ -7,14 +10,25 @@ from openfeature.evaluation_context import EvaluationContext
 from openfeature.exception import (
     FlagNotFoundError,
     GeneralError,
+    OpenFeatureError,
     ParseError,
     TypeMismatchError,
 )
 from openfeature.flag_evaluation import FlagResolutionDetails, FlagValueType, Reason
 
+from .metrics import MetricsSink, SyncMetrics
 from .model.flag import Flag
-from .model.flag_store import FlagStore
-from .targeting import targeting
+from .model.flag_store import FlagSnapshot, FlagStore
+from .targeting import (
+    AdaptiveRuleOptimizer,
+    Clock,
+    Explanation,
+    FlagdProperties,
+    RuleTracer,
+    targeting,
+)
+
+logger = logging.getLogger("openfeature.contrib")
 
 T = typing.TypeVar("T")
 
@@ -63,29 +77,113 @@ def _default_resolve(
 class FlagdCore:
     """Reference implementation of the Evaluator protocol for flagd."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        clock: Clock = time.time,
+        rule_optimizer: AdaptiveRuleOptimizer | None = None,
+        metrics_sink: MetricsSink | None = None,
+    ) -> None:
+        """
+        :param clock: time source for ``$flagd.timestamp``, in seconds since the epoch
+        :param rule_optimizer: enables adaptive reordering of ``and``/``or`` branches
+            in targeting rules, disabled by default
+        :param metrics_sink: receives the `SyncMetrics` of every flag
+            configuration update
+        """
         self._lock = threading.RLock()
         self._flag_store = FlagStore()
+        self._flagd_properties = FlagdProperties(clock)
+        self._rule_optimizer = rule_optimizer
+        self._metrics_sink = metrics_sink
+        self._sync_metrics: SyncMetrics | None = None
+        self._skipped_reloads = 0
+
+    def set_flags(
+        self, flag_configuration: str | bytes | dict[str, typing.Any]
+    ) -> None:
+        self.set_flags_and_get_changed_keys(flag_configuration)
 
-    def set_flags(self, flag_configuration: str | dict[str, typing.Any]) -> None:
-        with self._lock:
+    def set_flags_and_get_changed_keys(
+        self,
+        flag_configuration: str | bytes | dict[str, typing.Any] | FlagSnapshot,
+        payload_bytes: int | None = None,
+        decode_seconds: float = 0.0,
+    ) -> list[str]:
+        """Replace the flag configuration and return the keys of changed flags.
+
+        The configuration is either serialized JSON, an already parsed
+        document or a snapshot built with `FlagStore.parse`. A parsed document
+        is owned by the evaluator afterwards: it is modified in place and
+        retained without a defensive copy, so callers must not reuse it.
+
+        :param payload_bytes: size of the serialized payload, for the sync
+            metrics; taken from bytes payloads, a str payload is not encoded
+            just to measure it
+        :param decode_seconds: time the caller spent decoding it
+        """
+        started = time.perf_counter()
+        if isinstance(flag_configuration, bytes) and payload_bytes is None:
+            payload_bytes = len(flag_configuration)
+        # build the snapshot outside the lock so evaluations are only blocked
+        # for the swap itself
+        if isinstance(flag_configuration, FlagSnapshot):
+            snapshot = flag_configuration
+        else:
             data: dict[str, typing.Any] = (
                 json.loads(flag_configuration)
-                if isinstance(flag_configuration, str)
+                if isinstance(flag_configuration, (str, bytes))
                 else flag_configuration
             )
-            self._flag_store.update(data)
+            snapshot = FlagStore.parse(data)
+        decoded = time.perf_counter()
+        with self._lock:
+            changed_keys = self._flag_store.swap(snapshot)
+            self._flagd_properties.clear()
+            if self._rule_optimizer is not None:
+                self._rule_optimizer.invalidate(changed_keys)
+            # built under the lock so a concurrent skipped reload is not lost
+            metrics = SyncMetrics(
+                payload_bytes=payload_bytes,
+                decode_seconds=decode_seconds + decoded - started,
+                update_seconds=time.perf_counter() - decoded,
+                changed_keys=len(changed_keys),
+                applied_at=time.monotonic(),
+                skipped_reloads=self._skipped_reloads,
+            )
+            self._sync_metrics = metrics
+        self._record_sync(metrics)
+        return changed_keys
 
-    def set_flags_and_get_changed_keys(
-        self, flag_configuration: str | dict[str, typing.Any]
-    ) -> list[str]:
+    def record_skipped_reload(self) -> None:
+        """Counts a payload that the sync source skipped as unchanged."""
         with self._lock:
-            data: dict[str, typing.Any] = (
-                json.loads(flag_configuration)
-                if isinstance(flag_configuration, str)
-                else flag_configuration
+            self._skipped_reloads += 1
+            metrics = self._sync_metrics
+            if metrics is None:
+                return
+            metrics = dataclasses.replace(
+                metrics, skipped_reloads=self._skipped_reloads
             )
-            return self._flag_store.update(data)
+            self._sync_metrics = metrics
+        if self._metrics_sink is not None:
+            try:
+                self._metrics_sink.record_skipped_reload(metrics)
+            except Exception:
+                logger.exception("Could not record skipped reload")
+
+    def _record_sync(self, metrics: SyncMetrics) -> None:
+        if self._metrics_sink is not None:
+            # the configuration is already applied, a failing sink must not
+            # fail the update
+            try:
+                self._metrics_sink.record_sync(metrics)
+            except Exception:
+                logger.exception("Could not record sync metrics")
+
+    @property
+    def sync_metrics(self) -> SyncMetrics | None:
+        """Metrics of the last flag configuration update, None before the first."""
+        return self._sync_metrics
 
     def get_flag_set_metadata(self) -> Mapping[str, float | int | str | bool]:
         with self._lock:
@@ -122,12 +220,41 @@ class FlagdCore:
     ) -> FlagResolutionDetails[Sequence[FlagValueType] | Mapping[str, FlagValueType]]:
         return self._resolve(flag_key, default_value, ctx, "object")
 
+    def explain(
+        self,
+        flag_key: str,
+        default_value: typing.Any,
+        ctx: EvaluationContext | None = None,
+    ) -> Explanation:
+        """Resolve a flag while tracing its targeting rule.
+
+        The returned explanation holds the resolution details (or the error
+        raised by the resolution) and the path taken through the rule, with
+        intermediate values and the time spent in each node.
+        """
+        tracer = RuleTracer()
+        details: FlagResolutionDetails | None = None
+        error: OpenFeatureError | None = None
+        start = time.perf_counter_ns()
+        try:
+            details = self._resolve(flag_key, default_value, ctx, tracer=tracer)
+        except OpenFeatureError as e:
+            error = e
+        return Explanation(
+            flag_key=flag_key,
+            details=details,
+            error=error,
+            trace=tracer.root,
+            duration_ns=time.perf_counter_ns() - start,
+        )
+
     def _resolve(
         self,
         key: str,
         default_value: T,
         evaluation_context: EvaluationContext | None = None,
         flag_type: str | None = None,
+        tracer: RuleTracer | None = None,
     ) -> FlagResolutionDetails[T]:
         with self._lock:
             flag = self._flag_store.get_flag(key)
@@ -151,7 +278,14 @@ class FlagdCore:
                 return result
 
             try:
-                variant = targeting(flag.key, flag.targeting, evaluation_context)
+                variant = targeting(
+                    flag.key,
+                    flag.targeting,
+                    evaluation_context,
+                    self._flagd_properties,
+                    self._rule_optimizer,
+                    tracer,
+                )
                 if variant is None:
                     result = _default_resolve(
                         flag, default_value, metadata, Reason.DEFAULT
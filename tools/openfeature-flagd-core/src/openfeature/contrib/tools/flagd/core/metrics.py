@@ -0,0 +1,40 @@
+import dataclasses
+import time
+import typing
+
+
+@dataclasses.dataclass(frozen=True)
+class SyncMetrics:
+    """Cost of applying one flag configuration to the evaluator.
+
+    ``decode_seconds`` covers deserializing and parsing the payload, including
+    the decoding done by the sync source before handing it over, while
+    ``update_seconds`` only covers swapping the parsed snapshot in.
+    """
+
+    # size of the serialized payload, None if it was handed over decoded
+    payload_bytes: int | None
+    decode_seconds: float
+    update_seconds: float
+    changed_keys: int
+    # time.monotonic() when the snapshot was swapped in
+    applied_at: float
+    # payloads skipped since startup because they matched the applied one
+    skipped_reloads: int = 0
+
+    @property
+    def snapshot_age(self) -> float:
+        """Seconds since the snapshot was swapped in."""
+        return time.monotonic() - self.applied_at
+
+
+class MetricsSink(typing.Protocol):
+    """Receives the metrics of every applied flag configuration.
+
+    `record_skipped_reload` gets the metrics of the current configuration
+    with the updated counter when a sync source skips an unchanged payload.
+    """
+
+    def record_sync(self, metrics: SyncMetrics) -> None: ...
+
+    def record_skipped_reload(self, metrics: SyncMetrics) -> None: ...
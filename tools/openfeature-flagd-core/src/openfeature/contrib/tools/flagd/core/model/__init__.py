@@ -1,4 +1,4 @@
 from .flag import Flag
-from .flag_store import FlagStore
+from .flag_store import FlagSnapshot, FlagStore
 
-__all__ = ["Flag", "FlagStore"]
+__all__ = ["Flag", "FlagSnapshot", "FlagStore"]
@@ -1,12 +1,63 @@
-import json
-import re
+import copy
+import typing
 from collections.abc import Mapping
+from dataclasses import dataclass
 
 from openfeature.exception import ParseError
 
 from .flag import Flag, _validate_metadata
 
 
+def _ref_name(node: typing.Any) -> str | None:
+    if isinstance(node, dict) and len(node) == 1:
+        name = node.get("$ref")
+        if isinstance(name, str):
+            return name
+    return None
+
+
+def _expand_refs(
+    node: typing.Any, evaluators: Mapping[str, typing.Any], expanding: frozenset[str]
+) -> typing.Any:
+    """Copy of ``node`` with ``{"$ref": name}`` objects replaced by the named evaluator."""
+    name = _ref_name(node)
+    if name is not None and name in evaluators and name not in expanding:
+        return _expand_refs(evaluators[name], evaluators, expanding | {name})
+    if isinstance(node, dict):
+        return {
+            key: _expand_refs(value, evaluators, expanding)
+            for key, value in node.items()
+        }
+    if isinstance(node, list):
+        return [_expand_refs(item, evaluators, expanding) for item in node]
+    return node
+
+
+def _replace_refs(node: typing.Any, evaluators: Mapping[str, typing.Any]) -> None:
+    """Replace ``{"$ref": name}`` objects below ``node`` in place."""
+    if isinstance(node, dict):
+        children: typing.Iterable = node.items()
+    elif isinstance(node, list):
+        children = enumerate(node)
+    else:
+        return
+    for key, child in children:
+        name = _ref_name(child)
+        if name is not None and name in evaluators:
+            # every reference gets its own copy, flags must not share rules
+            node[key] = copy.deepcopy(evaluators[name])
+        else:
+            _replace_refs(child, evaluators)
+
+
+@dataclass(frozen=True)
+class FlagSnapshot:
+    """A fully parsed flag configuration, ready to be swapped into a store."""
+
+    flags: Mapping[str, Flag]
+    metadata: Mapping[str, float | int | str | bool]
+
+
 class FlagStore:
     def __init__(self) -> None:
         self.flags: Mapping[str, Flag] = {}
@@ -16,19 +67,26 @@ class FlagStore:
         return self.flags.get(key)
 
     def update(self, flags_data: dict) -> list[str]:
-        """Update flags and return list of changed flag keys."""
+        """Update flags and return list of changed flag keys.
+
+        The store takes ownership of ``flags_data``: it is modified in place
+        and parts of it are retained, so callers must not reuse it.
+        """
+        return self.swap(self.parse(flags_data))
+
+    @staticmethod
+    def parse(flags_data: dict) -> FlagSnapshot:
+        """Build a snapshot from a parsed configuration, taking ownership of it."""
         flags = flags_data.get("flags", {})
         metadata = flags_data.get("metadata", {})
         evaluators: dict | None = flags_data.get("$evaluators")
         if evaluators:
-            transposed = json.dumps(flags)
-            for name, rule in evaluators.items():
-                transposed = re.sub(
-                    rf"{{\s*\"\$ref\":\s*\"{re.escape(name)}\"\s*}}",
-                    json.dumps(rule),
-                    transposed,
-                )
-            flags = json.loads(transposed)
+            # evaluators may reference each other, expand them once up front
+            expanded = {
+                name: _expand_refs(rule, evaluators, frozenset({name}))
+                for name, rule in evaluators.items()
+            }
+            _replace_refs(flags, expanded)
 
         if not isinstance(flags, dict):
             raise ParseError("`flags` key of configuration must be a dictionary")
@@ -37,8 +95,15 @@ class FlagStore:
         for key, value in metadata.items():
             _validate_metadata(key, value)
 
+        return FlagSnapshot(
+            flags={key: Flag.from_dict(key, data) for key, data in flags.items()},
+            metadata=metadata,
+        )
+
+    def swap(self, snapshot: FlagSnapshot) -> list[str]:
+        """Replace the current flags with the snapshot and return the changed keys."""
         old_keys = set(self.flags.keys())
-        new_flags = {key: Flag.from_dict(key, data) for key, data in flags.items()}
+        new_flags = snapshot.flags
         new_keys = set(new_flags.keys())
 
         # Determine changed keys
@@ -50,6 +115,6 @@ class FlagStore:
         )
 
         self.flags = new_flags
-        self.flag_set_metadata = metadata
+        self.flag_set_metadata = snapshot.metadata
 
         return changed_keys
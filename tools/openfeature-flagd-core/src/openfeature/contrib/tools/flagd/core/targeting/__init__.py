@@ -1,3 +1,14 @@
-from .targeting import targeting
+from .adaptive import AdaptiveRuleOptimizer, BranchDecision
+from .explain import Explanation, RuleTracer, TraceNode
+from .targeting import Clock, FlagdProperties, targeting
 
-__all__ = ["targeting"]
+__all__ = [
+    "AdaptiveRuleOptimizer",
+    "BranchDecision",
+    "Clock",
+    "Explanation",
+    "FlagdProperties",
+    "RuleTracer",
+    "TraceNode",
+    "targeting",
+]
@@ -0,0 +1,407 @@
+"""Adaptive reordering of ``and``/``or`` branches in targeting rules.
+
+Every ``sample_interval``-th evaluation of a flag, each branch of the eligible
+``and``/``or`` nodes of its rule is evaluated on its own to record how often it
+short-circuits the node and how long it takes. Once ``min_samples`` have been
+collected, branches are reordered to minimise the expected evaluation cost.
+
+Only nodes whose value is used for its truthiness (conditions of ``if``,
+operands of ``!``/``!!`` and nested ``and``/``or`` in such positions) and whose
+branches consist entirely of side-effect-free operators are reordered, so the
+rule still selects the same variant.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import typing
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass, field
+
+from json_logic import jsonLogic
+from json_logic.builtins import to_bool
+from json_logic.types import JsonValue
+
+logger = logging.getLogger("openfeature.contrib")
+
+Path: typing.TypeAlias = tuple[int, ...]
+
+PURE_OPERATORS = frozenset(
+    {
+        # json-logic builtins, except `log` which writes to stdout
+        "==",
+        "!=",
+        "===",
+        "!==",
+        "<",
+        ">",
+        "<=",
+        ">=",
+        "!",
+        "!!",
+        "+",
+        "*",
+        "-",
+        "/",
+        "%",
+        "in",
+        "min",
+        "max",
+        "cat",
+        "var",
+        "substr",
+        "merge",
+        "missing",
+        "missing_some",
+        # control flow handled by the json-logic interpreter itself
+        "if",
+        "?:",
+        "and",
+        "or",
+        "filter",
+        "map",
+        "reduce",
+        "all",
+        "some",
+        "none",
+        # flagd custom operators
+        "fractional",
+        "starts_with",
+        "ends_with",
+        "sem_ver",
+    }
+)
+
+# Arguments after the first are evaluated against each item instead of the
+# evaluation context, so nodes below them cannot be profiled on their own.
+_ITERATING_OPERATORS = frozenset({"filter", "map", "reduce", "all", "some", "none"})
+
+
+def _parse(node: JsonValue) -> tuple[str, list] | None:
+    if not isinstance(node, dict) or len(node) != 1:
+        return None
+    op, args = next(iter(node.items()))
+    return op, args if isinstance(args, list) else [args]
+
+
+def _is_pure(node: JsonValue) -> bool:
+    if isinstance(node, list):
+        return all(_is_pure(item) for item in node)
+    parsed = _parse(node)
+    if parsed is None:
+        return True
+    op, args = parsed
+    return op in PURE_OPERATORS and all(_is_pure(arg) for arg in args)
+
+
+def _find_candidates(
+    node: JsonValue, truthiness_only: bool, path: Path, found: list[Path]
+) -> None:
+    parsed = _parse(node)
+    if parsed is None:
+        return
+    op, args = parsed
+
+    if (
+        op in ("and", "or")
+        and truthiness_only
+        and len(args) > 1
+        and all(_is_pure(arg) for arg in args)
+    ):
+        found.append(path)
+
+    if op in _ITERATING_OPERATORS:
+        args = args[:1]
+
+    last = len(args) - 1
+    for index, arg in enumerate(args):
+        if op in ("if", "?:"):
+            is_condition = index % 2 == 0 and index < last
+            child_truthiness_only = is_condition or truthiness_only
+        elif op in ("and", "or"):
+            child_truthiness_only = truthiness_only
+        else:
+            child_truthiness_only = op in ("!", "!!")
+        _find_candidates(arg, child_truthiness_only, (*path, index), found)
+
+
+def _node_at(rule: JsonValue, path: Path) -> tuple[str, list]:
+    node = rule
+    for index in path:
+        node = typing.cast(tuple[str, list], _parse(node))[1][index]
+    return typing.cast(tuple[str, list], _parse(node))
+
+
+def _reorder(
+    node: JsonValue, orders: dict[Path, tuple[int, ...]], path: Path
+) -> JsonValue:
+    parsed = _parse(node)
+    if parsed is None:
+        return node
+    op, args = parsed
+    new_args = [_reorder(arg, orders, (*path, index)) for index, arg in enumerate(args)]
+    order = orders.get(path)
+    if order is not None:
+        new_args = [new_args[index] for index in order]
+    return {op: new_args}
+
+
+@dataclass
+class _BranchStats:
+    samples: int = 0
+    short_circuits: int = 0
+    total_ns: int = 0
+
+    @property
+    def short_circuit_rate(self) -> float:
+        return self.short_circuits / self.samples if self.samples else 0.0
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.samples if self.samples else 0.0
+
+
+def _expected_ns(stats: list[_BranchStats], order: Iterable[int]) -> float:
+    expected = 0.0
+    reach = 1.0
+    for index in order:
+        expected += reach * stats[index].mean_ns
+        reach *= 1.0 - stats[index].short_circuit_rate
+    return expected
+
+
+def _optimal_order(stats: list[_BranchStats]) -> tuple[int, ...]:
+    # for independent branches, ascending cost per short-circuit probability
+    # minimises the expected cost; the sort is stable so ties keep rule order
+    def ratio(index: int) -> float:
+        rate = stats[index].short_circuit_rate
+        return stats[index].mean_ns / rate if rate else float("inf")
+
+    return tuple(sorted(range(len(stats)), key=ratio))
+
+
+@dataclass
+class _NodeProfile:
+    path: Path
+    operator: str
+    branches: list
+    stats: list[_BranchStats]
+    order: tuple[int, ...]
+    enabled: bool = True
+
+    @property
+    def samples(self) -> int:
+        return self.stats[0].samples
+
+
+@dataclass
+class _RuleProfile:
+    rule: dict
+    active_rule: JsonValue
+    nodes: list[_NodeProfile] = field(default_factory=list)
+    evaluations: int = 0
+
+
+@dataclass(frozen=True)
+class BranchDecision:
+    """Current ordering of one ``and``/``or`` node, for debugging.
+
+    ``path`` holds the argument indices leading from the rule root to the node
+    and ``order`` the original branch indices in evaluation order.
+    """
+
+    flag_key: str
+    path: Path
+    operator: str
+    order: tuple[int, ...]
+    short_circuit_rates: tuple[float, ...]
+    mean_ns: tuple[float, ...]
+    expected_ns: float
+    samples: int
+    enabled: bool
+
+
+class AdaptiveRuleOptimizer:
+    """Reorders ``and``/``or`` branches of targeting rules by observed selectivity."""
+
+    def __init__(
+        self,
+        sample_interval: int = 64,
+        min_samples: int = 16,
+        min_improvement: float = 0.1,
+    ) -> None:
+        """
+        :param sample_interval: profile every n-th evaluation of a flag
+        :param min_samples: samples required before a node is reordered
+        :param min_improvement: relative reduction of the expected cost a new
+            order must reach to replace the current one
+        """
+        if sample_interval < 1:
+            raise ValueError("sample_interval must be at least 1")
+        self.sample_interval = sample_interval
+        self.min_samples = min_samples
+        self.min_improvement = min_improvement
+        self._lock = threading.Lock()
+        self._profiles: dict[str, _RuleProfile] = {}
+
+    def evaluate(
+        self,
+        key: str,
+        rule: dict,
+        data: dict[str, typing.Any],
+        operations: typing.Mapping[str, typing.Any],
+    ) -> JsonValue:
+        profile = self._profile(key, rule)
+        if not profile.nodes:
+            return jsonLogic(rule, data, operations)
+
+        profile.evaluations += 1
+        if profile.evaluations % self.sample_interval == 0:
+            self._sample(profile, data, operations)
+
+        active_rule = profile.active_rule
+        if active_rule is rule:
+            return jsonLogic(rule, data, operations)
+        try:
+            return jsonLogic(active_rule, data, operations)
+        except Exception:
+            # a reordered branch raised where the original order may have
+            # short-circuited before reaching it
+            logger.debug(f"Disabling adaptive branch ordering for flag {key}")
+            with self._lock:
+                for node in profile.nodes:
+                    node.enabled = False
+                profile.active_rule = profile.rule
+            return jsonLogic(rule, data, operations)
+
+    def active_rule(self, key: str, rule: dict) -> JsonValue:
+        """The possibly reordered rule currently evaluated in place of ``rule``."""
+        profile = self._profiles.get(key)
+        if profile is None or profile.rule is not rule:
+            return rule
+        return profile.active_rule
+
+    def invalidate(self, keys: Collection[str] | None = None) -> None:
+        """Drop collected statistics for the given flags, or for all flags."""
+        with self._lock:
+            if keys is None:
+                self._profiles = {}
+            else:
+                for key in keys:
+                    self._profiles.pop(key, None)
+
+    def decisions(self) -> list[BranchDecision]:
+        with self._lock:
+            return [
+                BranchDecision(
+                    flag_key=key,
+                    path=node.path,
+                    operator=node.operator,
+                    order=node.order,
+                    short_circuit_rates=tuple(
+                        stats.short_circuit_rate for stats in node.stats
+                    ),
+                    mean_ns=tuple(stats.mean_ns for stats in node.stats),
+                    expected_ns=_expected_ns(node.stats, node.order),
+                    samples=node.samples,
+                    enabled=node.enabled,
+                )
+                for key, profile in self._profiles.items()
+                for node in profile.nodes
+            ]
+
+    def _profile(self, key: str, rule: dict) -> _RuleProfile:
+        profile = self._profiles.get(key)
+        if profile is not None and profile.rule is rule:
+            return profile
+
+        with self._lock:
+            profile = self._profiles.get(key)
+            if profile is None or profile.rule != rule:
+                profile = self._build_profile(rule)
+                self._profiles[key] = profile
+            elif profile.rule is not rule:
+                # same rule re-parsed by a sync, keep what was learned so far
+                if profile.active_rule is profile.rule:
+                    profile.active_rule = rule
+                profile.rule = rule
+            return profile
+
+    @staticmethod
+    def _build_profile(rule: dict) -> _RuleProfile:
+        paths: list[Path] = []
+        _find_candidates(rule, False, (), paths)
+        nodes = []
+        for path in paths:
+            op, branches = _node_at(rule, path)
+            nodes.append(
+                _NodeProfile(
+                    path=path,
+                    operator=op,
+                    branches=branches,
+                    stats=[_BranchStats() for _ in branches],
+                    order=tuple(range(len(branches))),
+                )
+            )
+        return _RuleProfile(rule=rule, active_rule=rule, nodes=nodes)
+
+    def _sample(
+        self,
+        profile: _RuleProfile,
+        data: dict[str, typing.Any],
+        operations: typing.Mapping[str, typing.Any],
+    ) -> None:
+        with self._lock:
+            changed = False
+            for node in profile.nodes:
+                if node.enabled:
+                    changed |= self._sample_node(node, data, operations)
+            if changed:
+                orders = {
+                    node.path: node.order
+                    for node in profile.nodes
+                    if node.enabled and node.order != tuple(range(len(node.order)))
+                }
+                profile.active_rule = (
+                    _reorder(profile.rule, orders, ()) if orders else profile.rule
+                )
+
+    def _sample_node(
+        self,
+        node: _NodeProfile,
+        data: dict[str, typing.Any],
+        operations: typing.Mapping[str, typing.Any],
+    ) -> bool:
+        """Profile each branch of the node, returns True if its order changed."""
+        measurements = []
+        for branch in node.branches:
+            start = time.perf_counter_ns()
+            try:
+                value = jsonLogic(branch, data, operations)
+            except Exception:
+                logger.debug(f"Disabling adaptive ordering of node {node.path}")
+                node.enabled = False
+                return node.order != tuple(range(len(node.order)))
+            measurements.append((time.perf_counter_ns() - start, to_bool(value)))
+
+        short_circuit_on = node.operator == "or"
+        for stats, (elapsed_ns, truthy) in zip(node.stats, measurements, strict=True):
+            stats.samples += 1
+            stats.total_ns += elapsed_ns
+            if truthy is short_circuit_on:
+                stats.short_circuits += 1
+
+        if node.samples < self.min_samples:
+            return False
+        candidate = _optimal_order(node.stats)
+        if candidate == node.order:
+            return False
+        current_ns = _expected_ns(node.stats, node.order)
+        if _expected_ns(node.stats, candidate) > current_ns * (
+            1 - self.min_improvement
+        ):
+            return False
+        node.order = candidate
+        return True
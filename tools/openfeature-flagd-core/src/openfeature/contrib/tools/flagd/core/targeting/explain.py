@@ -0,0 +1,147 @@
+"""Rule tracing for explained evaluations.
+
+The rule is instrumented by wrapping every operator node in a ``$trace``
+operator node and evaluated with the regular json-logic interpreter, so the
+trace follows exactly the branches the interpreter takes. Instrumentation only
+happens for explained evaluations; regular evaluations are not affected.
+"""
+
+from __future__ import annotations
+
+import time
+import typing
+from dataclasses import dataclass, field
+
+from json_logic import jsonLogic
+from json_logic.types import JsonValue
+
+from openfeature.exception import OpenFeatureError
+from openfeature.flag_evaluation import FlagResolutionDetails
+
+Path: typing.TypeAlias = tuple[int, ...]
+
+TRACE_OPERATOR = "$trace"
+
+
+@dataclass
+class TraceNode:
+    """A single evaluated node of a targeting rule.
+
+    ``duration_ns`` includes the evaluation of all arguments, while
+    ``operator_ns`` only covers the operator implementation itself (e.g. the
+    bucket selection of ``fractional``). Control flow handled by the
+    interpreter (``if``, ``and``, ``or``, ...) has no ``operator_ns``.
+    """
+
+    operator: str
+    path: Path
+    result: JsonValue = None
+    duration_ns: int = 0
+    operator_ns: int | None = None
+    arguments: list | None = None
+    error: str | None = None
+    children: list[TraceNode] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        return {
+            "operator": self.operator,
+            "path": list(self.path),
+            "result": self.result,
+            "durationNs": self.duration_ns,
+            "operatorNs": self.operator_ns,
+            "arguments": self.arguments,
+            "error": self.error,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+@dataclass
+class Explanation:
+    """Outcome of an explained evaluation."""
+
+    flag_key: str
+    details: FlagResolutionDetails | None
+    error: OpenFeatureError | None
+    trace: TraceNode | None
+    duration_ns: int
+
+
+def _instrument(node: JsonValue, path: Path) -> JsonValue:
+    if isinstance(node, list):
+        return [_instrument(item, (*path, index)) for index, item in enumerate(node)]
+    if not isinstance(node, dict) or len(node) != 1:
+        return node
+
+    op, args = next(iter(node.items()))
+    if not isinstance(args, list):
+        args = [args]
+    instrumented = {
+        op: [_instrument(arg, (*path, index)) for index, arg in enumerate(args)]
+    }
+    # a dict with more than one key is a literal for json-logic, so the
+    # wrapped node reaches the trace operator unevaluated
+    return {TRACE_OPERATOR: {"operator": op, "path": path, "node": instrumented}}
+
+
+class RuleTracer:
+    """Evaluates a rule while recording a `TraceNode` for every operator node."""
+
+    def __init__(self) -> None:
+        self.root: TraceNode | None = None
+        self._stack: list[TraceNode] = []
+
+    def evaluate(
+        self,
+        rule: JsonValue,
+        data: dict[str, typing.Any],
+        operations: typing.Mapping[str, typing.Any],
+    ) -> JsonValue:
+        traced_operations: dict[str, typing.Any] = {
+            name: self._wrap(operation) if callable(operation) else operation
+            for name, operation in operations.items()
+        }
+
+        def trace(data: typing.Any, spec: dict[str, typing.Any]) -> JsonValue:
+            return self._trace(data, spec, traced_operations)
+
+        traced_operations[TRACE_OPERATOR] = trace
+        return jsonLogic(_instrument(rule, ()), data, traced_operations)
+
+    def _trace(
+        self,
+        data: typing.Any,
+        spec: dict[str, typing.Any],
+        operations: dict[str, typing.Any],
+    ) -> JsonValue:
+        record = TraceNode(operator=spec["operator"], path=spec["path"])
+        if self._stack:
+            self._stack[-1].children.append(record)
+        elif self.root is None:
+            self.root = record
+
+        self._stack.append(record)
+        start = time.perf_counter_ns()
+        try:
+            record.result = jsonLogic(spec["node"], data, operations)
+        except Exception as e:
+            record.error = repr(e)
+            raise
+        finally:
+            record.duration_ns = time.perf_counter_ns() - start
+            self._stack.pop()
+        return record.result
+
+    def _wrap(
+        self, operation: typing.Callable[..., JsonValue]
+    ) -> typing.Callable[..., JsonValue]:
+        def traced(data: typing.Any, *args: typing.Any) -> JsonValue:
+            start = time.perf_counter_ns()
+            try:
+                return operation(data, *args)
+            finally:
+                if self._stack:
+                    record = self._stack[-1]
+                    record.operator_ns = time.perf_counter_ns() - start
+                    record.arguments = list(args)
+
+        return traced
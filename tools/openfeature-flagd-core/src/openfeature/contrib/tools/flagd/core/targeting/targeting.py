@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 import time
 import typing
 
@@ -9,12 +10,14 @@ from json_logic.types import JsonValue
 from openfeature.evaluation_context import EvaluationContext
 from openfeature.exception import ParseError
 
+from .adaptive import AdaptiveRuleOptimizer
 from .custom_ops import (
     ends_with,
     fractional,
     sem_ver,
     starts_with,
 )
+from .explain import RuleTracer
 
 OPERATORS = {
     **builtins.BUILTINS,
@@ -24,11 +27,45 @@ OPERATORS = {
     "sem_ver": sem_ver,
 }
 
+Clock: typing.TypeAlias = typing.Callable[[], float]
+
+
+class FlagdProperties:
+    """Prebuilt ``$flagd`` mappings injected into the targeting context.
+
+    ``$flagd.timestamp`` has a resolution of one second, so the mapping of a
+    flag is only rebuilt when the clock moves on to the next second.
+    Returned mappings are shared between evaluations and must be treated as
+    read-only. Owners clear it whenever their flags change, so it holds at
+    most one mapping per flag of the current configuration.
+    """
+
+    def __init__(self, clock: Clock = time.time) -> None:
+        self._clock = clock
+        self._properties: dict[str, dict[str, typing.Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict[str, typing.Any]:
+        now = int(self._clock())
+        properties = self._properties.get(key)
+        if properties is None or properties["timestamp"] != now:
+            properties = {"flagKey": key, "timestamp": now}
+            with self._lock:
+                self._properties[key] = properties
+        return properties
+
+    def clear(self) -> None:
+        with self._lock:
+            self._properties = {}
+
 
 def targeting(
     key: str,
     targeting: dict,
     evaluation_context: EvaluationContext | None = None,
+    flagd_properties: FlagdProperties | None = None,
+    rule_optimizer: AdaptiveRuleOptimizer | None = None,
+    tracer: RuleTracer | None = None,
 ) -> JsonValue:
     if not isinstance(targeting, dict):
         raise ParseError(f"Invalid 'targeting' value in flag: {targeting}")
@@ -36,8 +73,21 @@ def targeting(
     json_logic_context: dict[str, typing.Any] = (
         dict(evaluation_context.attributes) if evaluation_context else {}
     )
-    json_logic_context["$flagd"] = {"flagKey": key, "timestamp": int(time.time())}
+    json_logic_context["$flagd"] = (
+        flagd_properties.get(key)
+        if flagd_properties is not None
+        else {"flagKey": key, "timestamp": int(time.time())}
+    )
     json_logic_context["targetingKey"] = (
         evaluation_context.targeting_key if evaluation_context else None
     )
+    if tracer is not None:
+        rule = (
+            rule_optimizer.active_rule(key, targeting)
+            if rule_optimizer is not None
+            else targeting
+        )
+        return tracer.evaluate(rule, json_logic_context, OPERATORS)
+    if rule_optimizer is not None:
+        return rule_optimizer.evaluate(key, targeting, json_logic_context, OPERATORS)
     return jsonLogic(targeting, json_logic_context, OPERATORS)
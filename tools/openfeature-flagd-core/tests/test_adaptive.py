@@ -0,0 +1,111 @@
+from json_logic import jsonLogic
+
+from openfeature.contrib.tools.flagd.core import FlagdCore
+from openfeature.contrib.tools.flagd.core.targeting import AdaptiveRuleOptimizer
+from openfeature.contrib.tools.flagd.core.targeting.targeting import OPERATORS
+from openfeature.evaluation_context import EvaluationContext
+
+# `in` evaluates every element of a literal list, which makes it slow
+EXPENSIVE = {"in": [{"var": "email"}, [f"user-{i}@example.com" for i in range(500)]]}
+CHEAP = {"==": [{"var": "tier"}, "gold"]}
+
+RULE = {"if": [{"or": [EXPENSIVE, CHEAP]}, "on", "off"]}
+
+
+def _contexts(n: int) -> list[dict]:
+    return [
+        {"email": f"other-{i}@example.com", "tier": "gold" if i % 10 else "silver"}
+        for i in range(n)
+    ]
+
+
+class TestAdaptiveRuleOptimizer:
+    def test_reorders_selective_cheap_branch_first(self) -> None:
+        optimizer = AdaptiveRuleOptimizer(sample_interval=1, min_samples=5)
+        for data in _contexts(20):
+            optimizer.evaluate("flag", RULE, data, OPERATORS)
+
+        (decision,) = optimizer.decisions()
+        assert decision.flag_key == "flag"
+        assert decision.path == (0,)
+        assert decision.operator == "or"
+        assert decision.order == (1, 0)
+        assert decision.short_circuit_rates[0] == 0.0
+        assert decision.short_circuit_rates[1] == 0.9
+        assert decision.enabled
+
+    def test_results_unchanged(self) -> None:
+        optimizer = AdaptiveRuleOptimizer(sample_interval=3, min_samples=2)
+        for data in _contexts(60):
+            expected = jsonLogic(RULE, data, OPERATORS)
+            assert optimizer.evaluate("flag", RULE, data, OPERATORS) == expected
+
+    def test_value_context_not_reordered(self) -> None:
+        """`or` returns its first truthy operand, so only truthiness positions qualify."""
+        rule = {"or": [{"var": "a"}, {"var": "b"}]}
+        optimizer = AdaptiveRuleOptimizer(sample_interval=1)
+        optimizer.evaluate("flag", rule, {"a": "x", "b": "y"}, OPERATORS)
+        assert optimizer.decisions() == []
+
+    def test_negated_and_is_candidate(self) -> None:
+        rule = {"!": {"and": [{"var": "a"}, {"var": "b"}]}}
+        optimizer = AdaptiveRuleOptimizer(sample_interval=1)
+        optimizer.evaluate("flag", rule, {"a": True, "b": False}, OPERATORS)
+        (decision,) = optimizer.decisions()
+        assert decision.path == (0,)
+        assert decision.operator == "and"
+
+    def test_impure_operator_not_reordered(self) -> None:
+        rule = {"if": [{"or": [{"log": "x"}, CHEAP]}, "on", "off"]}
+        optimizer = AdaptiveRuleOptimizer(sample_interval=1)
+        optimizer.evaluate("flag", rule, {"tier": "gold"}, OPERATORS)
+        assert optimizer.decisions() == []
+
+    def test_raising_branch_disables_node(self) -> None:
+        raising = {">": [{"/": [1, {"var": "divisor"}]}, 0]}
+        rule = {"if": [{"and": [{"var": "flag"}, raising]}, "on", "off"]}
+        optimizer = AdaptiveRuleOptimizer(sample_interval=1, min_samples=1)
+        data = {"flag": False, "divisor": 0}
+        assert optimizer.evaluate("flag", rule, data, OPERATORS) == "off"
+        (decision,) = optimizer.decisions()
+        assert not decision.enabled
+
+    def test_invalidate_drops_statistics(self) -> None:
+        optimizer = AdaptiveRuleOptimizer(sample_interval=1)
+        optimizer.evaluate("flag", RULE, _contexts(1)[0], OPERATORS)
+        optimizer.invalidate(["flag"])
+        assert optimizer.decisions() == []
+
+    def test_equal_rule_keeps_statistics(self) -> None:
+        optimizer = AdaptiveRuleOptimizer(sample_interval=1, min_samples=5)
+        for data in _contexts(20):
+            optimizer.evaluate("flag", RULE, data, OPERATORS)
+        reparsed = {"if": [{"or": [EXPENSIVE, CHEAP]}, "on", "off"]}
+        optimizer.evaluate("flag", reparsed, _contexts(1)[0], OPERATORS)
+        (decision,) = optimizer.decisions()
+        assert decision.order == (1, 0)
+
+
+class TestFlagdCoreAdaptive:
+    def test_resolves_with_optimizer(self) -> None:
+        optimizer = AdaptiveRuleOptimizer(sample_interval=1, min_samples=5)
+        core = FlagdCore(rule_optimizer=optimizer)
+        core.set_flags(
+            {
+                "flags": {
+                    "adaptive-flag": {
+                        "state": "ENABLED",
+                        "variants": {"on": True, "off": False},
+                        "defaultVariant": "off",
+                        "targeting": RULE,
+                    }
+                }
+            }
+        )
+        for data in _contexts(20):
+            ctx = EvaluationContext(attributes=data)
+            result = core.resolve_boolean_value("adaptive-flag", False, ctx)
+            assert result.value is (data["tier"] == "gold")
+
+        (decision,) = optimizer.decisions()
+        assert decision.order == (1, 0)
@@ -0,0 +1,111 @@
+import pytest
+
+from openfeature.contrib.tools.flagd.core import FlagdCore
+from openfeature.contrib.tools.flagd.core.targeting import RuleTracer
+from openfeature.contrib.tools.flagd.core.targeting.targeting import OPERATORS
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.exception import FlagNotFoundError
+from openfeature.flag_evaluation import Reason
+
+FLAGS = {
+    "flags": {
+        "targeted-flag": {
+            "state": "ENABLED",
+            "variants": {"red": "red", "blue": "blue", "green": "green"},
+            "defaultVariant": "green",
+            "targeting": {
+                "if": [
+                    {"sem_ver": [{"var": "version"}, ">=", "2.0.0"]},
+                    {"fractional": [["red", 50], ["blue", 50]]},
+                    "green",
+                ]
+            },
+        },
+        "static-flag": {
+            "state": "ENABLED",
+            "variants": {"on": True, "off": False},
+            "defaultVariant": "on",
+        },
+    }
+}
+
+
+@pytest.fixture()
+def core() -> FlagdCore:
+    c = FlagdCore()
+    c.set_flags(FLAGS)
+    return c
+
+
+class TestRuleTracer:
+    def test_records_taken_path_only(self) -> None:
+        rule = {"if": [{"==": [{"var": "a"}, 1]}, {"var": "b"}, {"var": "c"}]}
+        tracer = RuleTracer()
+        result = tracer.evaluate(rule, {"a": 1, "b": "yes", "c": "no"}, OPERATORS)
+
+        assert result == "yes"
+        root = tracer.root
+        assert root is not None
+        assert root.operator == "if"
+        assert root.result == "yes"
+        assert root.operator_ns is None
+        assert [child.operator for child in root.children] == ["==", "var"]
+        condition, branch = root.children
+        assert condition.path == (0,)
+        assert condition.result is True
+        assert condition.arguments == [1, 1]
+        assert condition.operator_ns is not None
+        assert branch.path == (1,)
+        assert branch.result == "yes"
+
+    def test_records_error(self) -> None:
+        tracer = RuleTracer()
+        with pytest.raises(ZeroDivisionError):
+            tracer.evaluate({"/": [1, {"var": "zero"}]}, {"zero": 0}, OPERATORS)
+        assert tracer.root is not None
+        assert tracer.root.error is not None
+
+    def test_to_dict(self) -> None:
+        tracer = RuleTracer()
+        tracer.evaluate({"!": {"var": "a"}}, {"a": False}, OPERATORS)
+        assert tracer.root is not None
+        trace = tracer.root.to_dict()
+        assert trace["operator"] == "!"
+        assert trace["result"] is True
+        assert trace["children"][0]["operator"] == "var"
+
+
+class TestFlagdCoreExplain:
+    def test_explain_targeting(self, core: FlagdCore) -> None:
+        ctx = EvaluationContext("user-1", {"version": "2.1.0"})
+        explanation = core.explain("targeted-flag", "fallback", ctx)
+        expected = core.resolve_string_value("targeted-flag", "fallback", ctx)
+
+        assert explanation.error is None
+        assert explanation.details is not None
+        assert explanation.details.value == expected.value
+        assert explanation.details.reason == Reason.TARGETING_MATCH
+        assert explanation.duration_ns > 0
+
+        trace = explanation.trace
+        assert trace is not None
+        assert trace.operator == "if"
+        sem_ver_node, fractional_node = trace.children
+        assert sem_ver_node.operator == "sem_ver"
+        assert sem_ver_node.result is True
+        assert sem_ver_node.operator_ns is not None
+        assert fractional_node.operator == "fractional"
+        assert fractional_node.result == expected.value
+        assert fractional_node.operator_ns is not None
+        assert fractional_node.arguments == [["red", 50], ["blue", 50]]
+
+    def test_explain_static_flag_has_no_trace(self, core: FlagdCore) -> None:
+        explanation = core.explain("static-flag", False)
+        assert explanation.details is not None
+        assert explanation.details.reason == Reason.STATIC
+        assert explanation.trace is None
+
+    def test_explain_captures_error(self, core: FlagdCore) -> None:
+        explanation = core.explain("missing-flag", False)
+        assert explanation.details is None
+        assert isinstance(explanation.error, FlagNotFoundError)
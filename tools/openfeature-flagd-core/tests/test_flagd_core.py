@@ -3,8 +3,9 @@ import json
 import pytest
 
 from openfeature.contrib.tools.flagd.core import FlagdCore
+from openfeature.contrib.tools.flagd.core.model import FlagStore
 from openfeature.evaluation_context import EvaluationContext
-from openfeature.exception import FlagNotFoundError, TypeMismatchError
+from openfeature.exception import FlagNotFoundError, ParseError, TypeMismatchError
 from openfeature.flag_evaluation import Reason
 
 TEST_FLAGS = json.dumps(
@@ -301,6 +302,31 @@ class TestTargeting:
         assert result.variant == "a"
         assert result.reason == Reason.DEFAULT
 
+    def test_targeting_timestamp_from_injected_clock(self) -> None:
+        now = [1_700_000_000.5]
+        c = FlagdCore(clock=lambda: now[0])
+        c.set_flags(
+            {
+                "flags": {
+                    "time-flag": {
+                        "state": "ENABLED",
+                        "variants": {"before": "before", "after": "after"},
+                        "defaultVariant": "before",
+                        "targeting": {
+                            "if": [
+                                {">=": [{"var": "$flagd.timestamp"}, 1_700_000_001]},
+                                "after",
+                                "before",
+                            ]
+                        },
+                    }
+                }
+            }
+        )
+        assert c.resolve_string_value("time-flag", "fallback").value == "before"
+        now[0] += 1
+        assert c.resolve_string_value("time-flag", "fallback").value == "after"
+
 
 # ---- Metadata merging ----
 
@@ -404,3 +430,91 @@ class TestEvaluators:
         result = c.resolve_string_value("ref-flag", "fallback", ctx)
         assert result.value == "hello"
         assert result.reason == Reason.TARGETING_MATCH
+
+    def test_nested_evaluator_refs(self) -> None:
+        c = FlagdCore()
+        c.set_flags(
+            {
+                "flags": {
+                    "ref-flag": {
+                        "state": "ENABLED",
+                        "variants": {"hi": "hello", "bye": "goodbye"},
+                        "defaultVariant": "bye",
+                        "targeting": {
+                            "if": [{"and": [{"$ref": "is_admin"}, True]}, "hi", "bye"]
+                        },
+                    }
+                },
+                "$evaluators": {
+                    "is_admin": {
+                        "or": [{"$ref": "is_root"}, {"==": [{"var": "role"}, "admin"]}]
+                    },
+                    "is_root": {"==": [{"var": "role"}, "root"]},
+                },
+            }
+        )
+        ctx = EvaluationContext(attributes={"role": "root"})
+        assert c.resolve_string_value("ref-flag", "fallback", ctx).value == "hello"
+
+    def test_cyclic_evaluator_refs_terminate(self) -> None:
+        c = FlagdCore()
+        c.set_flags(
+            {
+                "flags": {
+                    "ref-flag": {
+                        "state": "ENABLED",
+                        "variants": {"hi": "hello", "bye": "goodbye"},
+                        "defaultVariant": "bye",
+                        "targeting": {"if": [{"$ref": "a"}, "hi", "bye"]},
+                    }
+                },
+                "$evaluators": {"a": {"!": {"$ref": "b"}}, "b": {"!": {"$ref": "a"}}},
+            }
+        )
+        # the cycle is cut at the repeated reference, which is no valid rule
+        with pytest.raises(ParseError) as exc_info:
+            c.resolve_string_value("ref-flag", "fallback")
+        assert not isinstance(exc_info.value.__cause__, RecursionError)
+
+    def test_flags_do_not_share_evaluator_rules(self) -> None:
+        flag = {
+            "state": "ENABLED",
+            "variants": {"hi": "hello", "bye": "goodbye"},
+            "defaultVariant": "bye",
+            "targeting": {"if": [{"$ref": "is_admin"}, "hi", "bye"]},
+        }
+        c = FlagdCore()
+        c.set_flags(
+            {
+                "flags": {"first": flag, "second": json.loads(json.dumps(flag))},
+                "$evaluators": {"is_admin": {"==": [{"var": "role"}, "admin"]}},
+            }
+        )
+        first = c._flag_store.flags["first"].targeting
+        second = c._flag_store.flags["second"].targeting
+        assert first == second
+        assert first["if"][0] is not second["if"][0]
+
+        first["if"][0]["=="][1] = "root"
+        ctx = EvaluationContext(attributes={"role": "admin"})
+        assert c.resolve_string_value("second", "fallback", ctx).value == "hello"
+
+
+class TestSetFlagsInput:
+    def test_set_flags_from_bytes(self) -> None:
+        c = FlagdCore()
+        c.set_flags(TEST_FLAGS.encode())
+        assert c.resolve_boolean_value("bool-flag", False).value is True
+
+    def test_set_flags_takes_parsed_document(self) -> None:
+        c = FlagdCore()
+        changed = c.set_flags_and_get_changed_keys(json.loads(TEST_FLAGS))
+        assert "bool-flag" in changed
+        assert c.resolve_boolean_value("bool-flag", False).value is True
+
+    def test_set_flags_takes_snapshot(self) -> None:
+        c = FlagdCore()
+        snapshot = FlagStore.parse(json.loads(TEST_FLAGS))
+        changed = c.set_flags_and_get_changed_keys(snapshot)
+        assert "bool-flag" in changed
+        assert c.resolve_boolean_value("bool-flag", False).value is True
@@ -0,0 +1,120 @@
+import json
+
+from openfeature.contrib.tools.flagd.core import FlagdCore
+from openfeature.contrib.tools.flagd.core.metrics import SyncMetrics
+from openfeature.contrib.tools.flagd.core.model import FlagStore
+
+
+def _flags(*keys: str) -> dict:
+    return {
+        "flags": {
+            key: {
+                "state": "ENABLED",
+                "variants": {"on": True, "off": False},
+                "defaultVariant": "on",
+            }
+            for key in keys
+        }
+    }
+
+
+class RecordingSink:
+    def __init__(self) -> None:
+        self.recorded: list[SyncMetrics] = []
+
+    def record_sync(self, metrics: SyncMetrics) -> None:
+        self.recorded.append(metrics)
+
+    def record_skipped_reload(self, metrics: SyncMetrics) -> None:
+        self.recorded.append(metrics)
+
+
+def test_no_metrics_before_first_update() -> None:
+    assert FlagdCore().sync_metrics is None
+
+
+def test_records_serialized_payload() -> None:
+    sink = RecordingSink()
+    core = FlagdCore(metrics_sink=sink)
+    payload = json.dumps(_flags("a", "b"))
+
+    core.set_flags(payload.encode())
+
+    (metrics,) = sink.recorded
+    assert core.sync_metrics is metrics
+    assert metrics.payload_bytes == len(payload.encode())
+    assert metrics.changed_keys == 2
+    assert metrics.decode_seconds > 0
+    assert metrics.update_seconds >= 0
+    assert metrics.snapshot_age >= 0
+
+
+def test_does_not_measure_str_payload() -> None:
+    sink = RecordingSink()
+    core = FlagdCore(metrics_sink=sink)
+    payload = json.dumps(_flags("a"))
+
+    core.set_flags(payload)
+    core.set_flags_and_get_changed_keys(payload, payload_bytes=len(payload))
+
+    assert [m.payload_bytes for m in sink.recorded] == [None, len(payload)]
+
+
+def test_counts_changed_keys_only() -> None:
+    sink = RecordingSink()
+    core = FlagdCore(metrics_sink=sink)
+    core.set_flags(_flags("a", "b"))
+
+    core.set_flags(_flags("a", "c"))
+
+    assert [m.changed_keys for m in sink.recorded] == [2, 2]
+    core.set_flags(_flags("a", "c"))
+    assert sink.recorded[-1].changed_keys == 0
+
+
+def test_includes_decoding_done_by_the_caller() -> None:
+    sink = RecordingSink()
+    core = FlagdCore(metrics_sink=sink)
+
+    core.set_flags_and_get_changed_keys(
+        FlagStore.parse(_flags("a")), payload_bytes=42, decode_seconds=1.5
+    )
+
+    (metrics,) = sink.recorded
+    assert metrics.payload_bytes == 42
+    assert metrics.decode_seconds >= 1.5
+    assert metrics.changed_keys == 1
+
+
+def test_counts_skipped_reloads() -> None:
+    sink = RecordingSink()
+    core = FlagdCore(metrics_sink=sink)
+    core.record_skipped_reload()
+    assert core.sync_metrics is None
+    core.set_flags(_flags("a"))
+
+    core.record_skipped_reload()
+
+    applied, skipped = sink.recorded
+    assert applied.skipped_reloads == 1
+    assert skipped.skipped_reloads == 2
+    assert skipped.applied_at == applied.applied_at
+    assert core.sync_metrics is skipped
+
+
+def test_failing_sink_does_not_fail_the_update() -> None:
+    class FailingSink:
+        def record_sync(self, metrics: SyncMetrics) -> None:
+            raise RuntimeError("exporter down")
+
+        def record_skipped_reload(self, metrics: SyncMetrics) -> None:
+            raise RuntimeError("exporter down")
+
+    core = FlagdCore(metrics_sink=FailingSink())
+
+    assert core.set_flags_and_get_changed_keys(_flags("a")) == ["a"]
+    core.record_skipped_reload()
+
+    assert core.resolve_boolean_value("a", False).value is True
+    assert core.sync_metrics is not None
+    assert core.sync_metrics.skipped_reloads == 1
@@ -1,4 +1,4 @@
-from openfeature.contrib.tools.flagd.core.targeting import targeting
+from openfeature.contrib.tools.flagd.core.targeting import FlagdProperties, targeting
 from openfeature.contrib.tools.flagd.core.targeting.custom_ops import (
     ends_with,
     fractional,
@@ -51,6 +51,42 @@ class TestTargetingFunction:
         assert result == "a"
 
 
+class TestFlagdProperties:
+    def test_mapping_reused_within_same_second(self) -> None:
+        now = [1000.1]
+        properties = FlagdProperties(clock=lambda: now[0])
+        first = properties.get("my-flag")
+        now[0] = 1000.9
+        assert properties.get("my-flag") is first
+        assert first == {"flagKey": "my-flag", "timestamp": 1000}
+
+    def test_mapping_rebuilt_when_second_changes(self) -> None:
+        now = [1000.9]
+        properties = FlagdProperties(clock=lambda: now[0])
+        first = properties.get("my-flag")
+        now[0] = 1001.0
+        second = properties.get("my-flag")
+        assert second is not first
+        assert second == {"flagKey": "my-flag", "timestamp": 1001}
+        assert first["timestamp"] == 1000
+
+    def test_mapping_per_flag(self) -> None:
+        properties = FlagdProperties(clock=lambda: 1000)
+        assert properties.get("a")["flagKey"] == "a"
+        assert properties.get("b")["flagKey"] == "b"
+
+    def test_clear_drops_mappings(self) -> None:
+        properties = FlagdProperties(clock=lambda: 1000)
+        first = properties.get("my-flag")
+        properties.clear()
+        assert properties.get("my-flag") is not first
+
+    def test_targeting_uses_injected_clock(self) -> None:
+        rule = {"if": [{">": [{"var": "$flagd.timestamp"}, 1500]}, "late", "early"]}
+        assert targeting("flag", rule, None, FlagdProperties(lambda: 1000)) == "early"
+        assert targeting("flag", rule, None, FlagdProperties(lambda: 2000)) == "late"
+
+
 class TestStartsWith:
     def test_starts_with_true(self) -> None:
         result = starts_with({}, "hello world", "hello")